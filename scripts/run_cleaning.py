@@ -3,6 +3,10 @@ Script to run data cleaning pipeline (Raw → Bronze).
 
 Usage:
     python scripts/run_cleaning.py --year 2024
+    python scripts/run_cleaning.py --year 2024 --finess-chunksize 100000
+    python scripts/run_cleaning.py --year 2024 --csv
+    python scripts/run_cleaning.py --year 2024 --csv-backend arrow
+    python scripts/run_cleaning.py --year 2024 --workers 4
 """
 import logging
 import sys
@@ -25,6 +29,16 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Run data cleaning for a specific year.')
     parser.add_argument('--year', type=int, default=2024, help='Year to clean data for (default: 2024)')
+    parser.add_argument('--finess-chunksize', type=int, default=None,
+                        help='Clean FINESS in streaming mode with chunks of this many rows (constant memory)')
+    parser.add_argument('--csv', action='store_true',
+                        help='Also write bronze tables as CSV next to the Parquet files')
+    parser.add_argument('--csv-backend', choices=['pandas', 'arrow'], default=None,
+                        help='CSV reader/writer (default: CSV_BACKEND setting)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild even if inputs and code are unchanged since the last run')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Sources cleaned in parallel processes (default: MAX_WORKERS setting, 1 = sequential)')
     args = parser.parse_args()
 
     # Configure logging
@@ -38,7 +52,9 @@ def main():
     bronze_path = project_root / "data" / "bronze"
     
     # Create cleaner and run
-    cleaner = DataCleaner(raw_path, bronze_path)
+    cleaner = DataCleaner(raw_path, bronze_path, finess_chunksize=args.finess_chunksize,
+                          export_csv=args.csv or None, csv_backend=args.csv_backend,
+                          max_workers=args.workers, incremental=False if args.force else None)
     
     year = args.year
     logger.info(f"Cleaning data for year {year}...")
@@ -52,12 +68,14 @@ def main():
         logger.info("CLEANING SUMMARY")
         logger.info("=" * 60)
         
-        for source_name, df in results.items():
-            if df is not None:
-                logger.info(f"✓ {source_name}: {len(df)} records")
-                logger.info(f"  Columns: {len(df.columns)}")
+        for source_name, result in results.items():
+            if result.skipped:
+                logger.info(f"✓ {source_name}: {result.records} records (up to date, skipped)")
+            elif result.succeeded:
+                logger.info(f"✓ {source_name}: {result.records} records in {result.elapsed_seconds:.1f}s")
+                logger.info(f"  Output: {result.output_path}")
             else:
-                logger.info(f"✗ {source_name}: FAILED")
+                logger.info(f"✗ {source_name}: FAILED ({result.elapsed_seconds:.1f}s)")
         
         logger.info("=" * 60)
         logger.info(f"Bronze data saved to: {bronze_path / str(year)}")
@@ -2,6 +2,10 @@
 Script to trigger the data ingestion process.
 Usage:
     python scripts/run_ingestion.py --year 2024
+    python scripts/run_ingestion.py --year 2021 --end-year 2025
+    python scripts/run_ingestion.py --year 2024 --refresh-catalog
+    python scripts/run_ingestion.py --year 2024 --offline
+    python scripts/run_ingestion.py --year 2024 --force
 """
 import logging
 import sys
@@ -13,6 +17,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.config import config
 from src.ingestion_manager import IngestionManager
 from src.pipeline import setup_logging
 
@@ -24,17 +29,32 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Run data ingestion for a specific year.')
     parser.add_argument('--year', type=int, default=2023, help='Year to ingest data for (default: 2023)')
+    parser.add_argument('--end-year', type=int, default=None,
+                        help='Last year of a range starting at --year; shared files are downloaded once')
+    parser.add_argument('--refresh-catalog', action='store_true',
+                        help='Refresh the local catalog index from data.gouv.fr before resolving resources')
+    parser.add_argument('--offline', action='store_true',
+                        help='Resolve resources from the catalog index only (no metadata requests)')
+    parser.add_argument('--force', action='store_true',
+                        help='Download every resource, even if still fresh or unchanged upstream')
     args = parser.parse_args()
+    if args.offline:
+        config.pipeline.offline_mode = True
 
     # Configure logging
     setup_logging("INFO")
     logger = logging.getLogger(__name__)
     
-    logger.info(f"Starting Ingestion for year {args.year}...")
-    
     # Initialize and run the manager
-    manager = IngestionManager()
-    manager.run_year_ingestion(args.year)
+    manager = IngestionManager(force=args.force)
+    if args.refresh_catalog:
+        manager.refresh_catalog(list(range(args.year, (args.end_year or args.year) + 1)))
+    if args.end_year:
+        logger.info(f"Starting Ingestion for years {args.year}-{args.end_year}...")
+        manager.run_multi_year_ingestion(args.year, args.end_year)
+    else:
+        logger.info(f"Starting Ingestion for year {args.year}...")
+        manager.run_year_ingestion(args.year)
 
 if __name__ == "__main__":
     main()
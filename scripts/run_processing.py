@@ -3,6 +3,7 @@ Script to run data processing pipeline (Bronze → Processed).
 
 Usage:
     python scripts/run_processing.py --year 2024
+    python scripts/run_processing.py --year 2024 --csv
 """
 import logging
 import sys
@@ -25,6 +26,12 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Run data processing for a specific year.')
     parser.add_argument('--year', type=int, default=2023, help='Year to process data for (default: 2023)')
+    parser.add_argument('--csv', action='store_true',
+                        help='Also write silver tables as CSV next to the Parquet files')
+    parser.add_argument('--csv-backend', choices=['pandas', 'arrow'], default=None,
+                        help='CSV reader/writer (default: CSV_BACKEND setting)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild even if inputs and code are unchanged since the last run')
     args = parser.parse_args()
 
     # Configure logging
@@ -35,7 +42,8 @@ def main():
     
     # Setup paths - now using bronze as input
     bronze_path = project_root / "data" / "bronze"
-    processor = DataProcessor(bronze_path)
+    processor = DataProcessor(bronze_path, export_csv=args.csv or None, csv_backend=args.csv_backend,
+                              incremental=False if args.force else None)
     
     year = args.year
     logger.info(f"Processing data for year {year}...")
@@ -0,0 +1,44 @@
+"""
+Script to garbage-collect the content-addressed raw store.
+
+Adopts raw files not yet tracked by a year manifest, then deletes blobs
+that no year folder references any more.
+
+Usage:
+    python scripts/run_raw_gc.py
+    python scripts/run_raw_gc.py --dry-run
+"""
+import logging
+import sys
+import argparse
+from pathlib import Path
+
+# Add project root to path
+# This ensures that we can import modules from the 'src' directory
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ingestion_manager import IngestionManager
+from src.pipeline import setup_logging
+
+def main():
+    """
+    Main entry point for raw store garbage collection.
+    Parses command line arguments and triggers the ingestion manager GC.
+    """
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='Garbage-collect unreferenced raw data blobs.')
+    parser.add_argument('--dry-run', action='store_true', help='Only report what would be removed')
+    args = parser.parse_args()
+
+    # Configure logging
+    setup_logging("INFO")
+    logger = logging.getLogger(__name__)
+    
+    logger.info("Starting raw store garbage collection...")
+    
+    manager = IngestionManager()
+    manager.collect_garbage(dry_run=args.dry_run)
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,7 @@ class DataGouvConfig:
     finess_dataset_id: str = "53699569a3a729239d2046eb"
     finess_resource_keyword: str = "extraction"
     csv_separator: str = ";"
-    csv_encoding: str = "latin-1"
+    csv_encoding: str = "latin-1"  # Also the fallback when transcoding raw files to UTF-8
     
     @classmethod
     def from_env(cls):
@@ -123,11 +123,40 @@ class PipelineConfig:
     
     # Retry strategy
     max_retries: int = 3
-    retry_backoff_seconds: int = 5
+    retry_backoff_seconds: int = 5  # Cap of the jittered exponential backoff
+    
+    # Per-host throttling
+    rate_limit_per_second: float = 5.0
+    rate_limit_burst: int = 10
+    circuit_breaker_threshold: int = 5  # Consecutive host errors before failing fast
+    circuit_breaker_cooldown_seconds: int = 60
     
     # Data storage
     raw_data_path: str = "/workspaces/MVP-web-scrapping-project/data/raw"
     processed_data_path: str = "/workspaces/MVP-web-scrapping-project/data/processed"
+    export_csv: bool = False  # CSV copy of bronze/silver tables next to the Parquet files
+    csv_backend: str = "pandas"  # CSV reader/writer: "pandas" or "arrow" (multi-threaded pyarrow)
+    incremental_builds: bool = True  # Skip cleaning/processing steps whose inputs and code are unchanged
+    key_registry_enabled: bool = True  # Link silver tables through silver/registry.sqlite (FINESS -> vel_id)
+    
+    # Persistent HTTP cache (conditional GET with ETag/Last-Modified)
+    http_cache_enabled: bool = True
+    http_cache_path: str = "/workspaces/MVP-web-scrapping-project/data/cache/http"
+    http_cache_max_mb: int = 2048
+    
+    # In-memory cache of parsed connector data (LRU, deep DataFrame size)
+    connector_cache_max_mb: int = 512
+    
+    # Excel parsing: engine ("auto" = calamine if installed) and parsed-sheet cache
+    excel_engine: str = "auto"
+    excel_cache_enabled: bool = True
+    excel_cache_path: str = "/workspaces/MVP-web-scrapping-project/data/cache/xlsx"
+    
+    # Local catalog index of data.gouv dataset/resource metadata
+    catalog_index_enabled: bool = True
+    catalog_index_path: str = "/workspaces/MVP-web-scrapping-project/data/cache/catalog.sqlite"
+    catalog_max_age_hours: int = 24
+    offline_mode: bool = False  # Resolve resources from the catalog index only
     
     # Logging
     log_level: str = "INFO"
@@ -144,8 +173,27 @@ class PipelineConfig:
             max_workers=int(os.getenv("MAX_WORKERS", "4")),
             max_retries=int(os.getenv("MAX_RETRIES", "3")),
             retry_backoff_seconds=int(os.getenv("RETRY_BACKOFF_SECONDS", "5")),
+            rate_limit_per_second=float(os.getenv("RATE_LIMIT_PER_SECOND", "5")),
+            rate_limit_burst=int(os.getenv("RATE_LIMIT_BURST", "10")),
+            circuit_breaker_threshold=int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "5")),
+            circuit_breaker_cooldown_seconds=int(os.getenv("CIRCUIT_BREAKER_COOLDOWN_SECONDS", "60")),
             raw_data_path=os.getenv("RAW_DATA_PATH", "/workspaces/MVP-web-scrapping-project/data/raw"),
             processed_data_path=os.getenv("PROCESSED_DATA_PATH", "/workspaces/MVP-web-scrapping-project/data/processed"),
+            export_csv=os.getenv("EXPORT_CSV", "false").lower() in ("1", "true", "yes"),
+            csv_backend=os.getenv("CSV_BACKEND", "pandas"),
+            incremental_builds=os.getenv("INCREMENTAL_BUILDS", "true").lower() in ("1", "true", "yes"),
+            key_registry_enabled=os.getenv("KEY_REGISTRY_ENABLED", "true").lower() in ("1", "true", "yes"),
+            http_cache_enabled=os.getenv("HTTP_CACHE_ENABLED", "true").lower() in ("1", "true", "yes"),
+            http_cache_path=os.getenv("HTTP_CACHE_PATH", "/workspaces/MVP-web-scrapping-project/data/cache/http"),
+            http_cache_max_mb=int(os.getenv("HTTP_CACHE_MAX_MB", "2048")),
+            connector_cache_max_mb=int(os.getenv("CONNECTOR_CACHE_MAX_MB", "512")),
+            excel_engine=os.getenv("EXCEL_ENGINE", "auto"),
+            excel_cache_enabled=os.getenv("EXCEL_CACHE_ENABLED", "true").lower() in ("1", "true", "yes"),
+            excel_cache_path=os.getenv("EXCEL_CACHE_PATH", "/workspaces/MVP-web-scrapping-project/data/cache/xlsx"),
+            catalog_index_enabled=os.getenv("CATALOG_INDEX_ENABLED", "true").lower() in ("1", "true", "yes"),
+            catalog_index_path=os.getenv("CATALOG_INDEX_PATH", "/workspaces/MVP-web-scrapping-project/data/cache/catalog.sqlite"),
+            catalog_max_age_hours=int(os.getenv("CATALOG_MAX_AGE_HOURS", "24")),
+            offline_mode=os.getenv("OFFLINE_MODE", "false").lower() in ("1", "true", "yes"),
             log_level=os.getenv("LOG_LEVEL", "INFO"),
             log_file=os.getenv("LOG_FILE", None),
         )
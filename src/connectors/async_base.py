@@ -0,0 +1,315 @@
+"""
+Asyncio counterpart of BaseConnector.
+
+Provides the same building blocks as `BaseConnector` (GET with retries,
+streamed downloads to disk, per-host throttling) on top of a single
+`aiohttp.ClientSession`, so one event loop can fetch catalog metadata and
+many resources concurrently over reused connections. Concurrency is bounded
+by a semaphore and by the connection pool size.
+
+Requires the optional `aiohttp` dependency.
+"""
+
+from abc import ABC, abstractmethod
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Any, Dict, Union
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .base import DEFAULT_CHUNK_SIZE, PART_SUFFIX, RETRY_STATUSES, RETRY_METHODS, MAX_RETRY_AFTER_SECONDS, DownloadResult
+from .memory_cache import MemoryCache
+from .rate_limit import HostRateLimiter, CircuitOpenError, backoff_delay, parse_retry_after
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AsyncResponse:
+    """Fully read HTTP response returned by `AsyncBaseConnector.get`."""
+    url: str
+    status_code: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+
+    def json(self) -> Any:
+        """Decode the body as JSON."""
+        return json.loads(self.content)
+
+
+class AsyncBaseConnector(ABC):
+    """Abstract base class for asyncio-based data source connectors."""
+
+    def __init__(self, name: str, base_url: str, timeout: int = 30,
+                 max_retries: int = 3, retry_backoff: int = 5,
+                 max_concurrency: int = 4,
+                 cache_max_bytes: int = 512 * 1024 * 1024,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 backoff_base: float = 0.5):
+        """
+        Initialize async base connector.
+
+        Args:
+            name: Connector name (e.g., 'DataGouv', 'HAS')
+            base_url: API base URL
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries
+            retry_backoff: Maximum backoff time in seconds between retries
+            max_concurrency: Maximum number of requests in flight
+            cache_max_bytes: Memory budget of the in-process data cache
+            rate_limiter: Per-host token buckets and circuit breakers
+                (shared with sync connectors when built from the same config)
+            backoff_base: Scale of the first jittered backoff delay in seconds
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncBaseConnector requires the 'aiohttp' package (pip install aiohttp)")
+
+        self.name = name
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.backoff_base = backoff_base
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.cache = MemoryCache(max_bytes=cache_max_bytes, name=name)
+        self.last_fetch_time = None
+        self._session = None
+        self._semaphore = None
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Create the shared client session on first use.
+
+        The session must be created inside a running event loop; its
+        connection pool is sized to the concurrency limit.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _throttle(self, url: str):
+        """Wait for the host budget; fail fast if the host circuit is open."""
+        throttle = self.rate_limiter.for_url(url)
+        if not throttle.breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {throttle.host}, failing fast")
+        wait = throttle.bucket.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return throttle
+
+    async def _request(self, method: str, url: str, handler, **kwargs) -> Optional[Any]:
+        """
+        Send a request with throttling and retries, passing the response to `handler`.
+
+        Mirrors `BaseConnector._send`: 429/5xx and connection errors are retried
+        (idempotent methods only) after `Retry-After` or a jittered backoff,
+        and repeated host errors open the host's circuit breaker.
+
+        Args:
+            method: HTTP method
+            url: Full URL for request
+            handler: Coroutine function receiving the successful aiohttp response
+            **kwargs: Additional arguments to pass to session.request
+
+        Returns:
+            Whatever `handler` returns, or None if the request failed
+        """
+        session = await self._get_session()
+        attempts = self.max_retries + 1 if method.upper() in RETRY_METHODS else 1
+
+        async with self._semaphore:
+            for attempt in range(attempts):
+                last_attempt = attempt == attempts - 1
+                try:
+                    throttle = await self._throttle(url)
+                    logger.debug(f"[{self.name}] Making async {method} request to {url}")
+                    async with session.request(method, url, **kwargs) as response:
+                        if response.status not in RETRY_STATUSES:
+                            throttle.breaker.record_success()
+                            response.raise_for_status()
+                            self.last_fetch_time = datetime.utcnow()
+                            return await handler(response)
+
+                        throttle.breaker.record_failure()
+                        status = response.status
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+                    # Retryable status: the connection is released before waiting
+                    if last_attempt or (retry_after is not None and retry_after > MAX_RETRY_AFTER_SECONDS):
+                        logger.error(f"[{self.name}] Request failed: HTTP {status} for {url}")
+                        return None
+                    if retry_after is not None:
+                        # The next _throttle() call waits for the paused host
+                        throttle.bucket.pause(retry_after)
+                        logger.warning(f"[{self.name}] HTTP {status} on {url}, honouring Retry-After of {retry_after:.1f}s")
+                    else:
+                        delay = backoff_delay(attempt, self.backoff_base, self.retry_backoff)
+                        logger.warning(f"[{self.name}] HTTP {status} on {url}, retrying in {delay:.1f}s")
+                        await asyncio.sleep(delay)
+                except CircuitOpenError as e:
+                    logger.error(f"[{self.name}] Request failed: {e}")
+                    return None
+                except aiohttp.ClientResponseError as e:
+                    logger.error(f"[{self.name}] Request failed: {e}")
+                    return None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self.rate_limiter.for_url(url).breaker.record_failure()
+                    if last_attempt:
+                        logger.error(f"[{self.name}] Request failed: {e!r}")
+                        return None
+                    delay = backoff_delay(attempt, self.backoff_base, self.retry_backoff)
+                    logger.warning(f"[{self.name}] {e.__class__.__name__} on {url}, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+        return None
+
+    async def get(self, url: str, **kwargs) -> Optional[AsyncResponse]:
+        """Make GET request and read the whole body."""
+        async def read(response):
+            return AsyncResponse(
+                url=str(response.url),
+                status_code=response.status,
+                headers=dict(response.headers),
+                content=await response.read()
+            )
+        return await self._request("GET", url, read, **kwargs)
+
+    async def download_to_file(self, url: str, dest_path: Union[str, Path],
+                               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Optional[DownloadResult]:
+        """
+        Stream a remote resource to disk.
+
+        The body is written chunk by chunk into `<dest_path>.part` and
+        atomically renamed once complete, so memory stays bounded by
+        `chunk_size` and a failed download never leaves a truncated file.
+
+        Args:
+            url: Full URL of the resource
+            dest_path: Final location of the downloaded file
+            chunk_size: Number of bytes read from the socket at a time
+
+        Returns:
+            DownloadResult with size and timing, or None if failed
+        """
+        dest_path = Path(dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest_path.with_name(dest_path.name + PART_SUFFIX)
+        start = time.monotonic()
+
+        async def stream(response):
+            written = 0
+            with open(part_path, 'wb') as f:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+            return written
+
+        try:
+            written = await self._request("GET", url, stream)
+        except OSError as e:
+            logger.error(f"[{self.name}] Download of {url} failed: {e}")
+            written = None
+        if written is None:
+            if part_path.exists():
+                part_path.unlink()
+            return None
+
+        os.replace(part_path, dest_path)
+        result = DownloadResult(
+            url=url,
+            path=dest_path,
+            bytes_written=written,
+            elapsed_seconds=time.monotonic() - start,
+            bytes_transferred=written
+        )
+        logger.info(
+            f"[{self.name}] Downloaded {result.bytes_written} bytes to {dest_path} "
+            f"in {result.elapsed_seconds:.2f}s ({result.bytes_per_second / 1024:.1f} KiB/s)"
+        )
+        return result
+
+    @abstractmethod
+    async def fetch_data(self, **kwargs) -> Optional[Any]:
+        """
+        Fetch data from source.
+
+        Must be implemented by subclasses.
+
+        Returns:
+            Data in appropriate format (DataFrame, dict, etc.)
+        """
+        pass
+
+    @abstractmethod
+    def validate_response(self, response: Any) -> bool:
+        """
+        Validate response data.
+
+        Must be implemented by subclasses.
+
+        Args:
+            response: Response data to validate
+
+        Returns:
+            True if valid, False otherwise
+        """
+        pass
+
+    def cache_data(self, key: str, data: Any, ttl_hours: int = 24):
+        """Cache fetched data (byte-bounded LRU, see MemoryCache)."""
+        self.cache.put(key, data, ttl_hours=ttl_hours)
+        logger.debug(f"[{self.name}] Cached data with key: {key}")
+
+    def get_cached_data(self, key: str) -> Optional[Any]:
+        """Retrieve cached data if not expired."""
+        return self.cache.get(key)
+
+    async def close(self):
+        """Close the client session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        logger.debug(f"[{self.name}] Async session closed")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    def run_sync(self, coro_fn, *args, **kwargs) -> Any:
+        """
+        Run one of this connector's coroutines from synchronous code.
+
+        Opens a fresh event loop, runs the coroutine and closes the session,
+        so existing scripts can use async connectors without asyncio code.
+
+        Args:
+            coro_fn: Coroutine function (e.g. `connector.fetch_data`)
+            *args, **kwargs: Arguments passed to `coro_fn`
+
+        Returns:
+            The coroutine's result
+        """
+        async def runner():
+            try:
+                return await coro_fn(*args, **kwargs)
+            finally:
+                await self.close()
+        return asyncio.run(runner())
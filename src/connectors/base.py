@@ -6,23 +6,75 @@ error handling, and caching.
 """
 
 from abc import ABC, abstractmethod
+import json
 import logging
+import os
 import time
-from typing import Optional, Any, List
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Any, Dict, List, Union
+from datetime import datetime
 import requests
 from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+
+from .http_cache import HTTPCache
+from .memory_cache import MemoryCache
+from .rate_limit import HostRateLimiter, CircuitOpenError, backoff_delay, parse_retry_after
 
 
 logger = logging.getLogger(__name__)
 
+# Size of the blocks written to disk while streaming a download.
+# Peak memory during a download is bounded by this value, not by the file size.
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Partial downloads live next to their destination until complete
+PART_SUFFIX = ".part"
+PART_META_SUFFIX = ".part.json"
+
+# Answers rejecting the Range / If-Range of a resumed download
+RANGE_REJECTED_STATUSES = frozenset([412, 416])
+
+# Transient answers worth retrying, and the methods safe to retry
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+RETRY_METHODS = frozenset(["HEAD", "GET", "OPTIONS"])
+
+# Retry-After values above this are not waited for: the request fails instead
+MAX_RETRY_AFTER_SECONDS = 300
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of a streamed download written to disk."""
+    url: str
+    path: Path
+    bytes_written: int
+    elapsed_seconds: float
+    bytes_transferred: Optional[int] = None  # Bytes received over the network
+    resumed_from: int = 0  # Offset a resumed download started from
+    from_cache: bool = False  # Existing copy kept after a 304 Not Modified
+    sha256: Optional[str] = None  # Content hash, set once stored in the raw store
+    etag: Optional[str] = None  # Validators of the downloaded copy, for the next
+    last_modified: Optional[str] = None  # conditional download
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average network transfer rate of the download."""
+        transferred = self.bytes_written if self.bytes_transferred is None else self.bytes_transferred
+        if self.elapsed_seconds <= 0:
+            return float(transferred)
+        return transferred / self.elapsed_seconds
+
 
 class BaseConnector(ABC):
     """Abstract base class for all data source connectors."""
     
     def __init__(self, name: str, base_url: str, timeout: int = 30, 
-                 max_retries: int = 3, retry_backoff: int = 5):
+                 max_retries: int = 3, retry_backoff: int = 5,
+                 http_cache: Optional[HTTPCache] = None,
+                 cache_max_bytes: int = 512 * 1024 * 1024,
+                 rate_limiter: Optional[HostRateLimiter] = None,
+                 backoff_base: float = 0.5):
         """
         Initialize base connector.
         
@@ -31,44 +83,116 @@ class BaseConnector(ABC):
             base_url: API base URL
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries
-            retry_backoff: Backoff time in seconds between retries
+            retry_backoff: Maximum backoff time in seconds between retries
+            http_cache: Optional persistent cache used for conditional GETs
+            cache_max_bytes: Memory budget of the in-process data cache
+            rate_limiter: Per-host token buckets and circuit breakers
+                (a private default limiter is used when omitted)
+            backoff_base: Scale of the first jittered backoff delay in seconds
         """
         self.name = name
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self.backoff_base = backoff_base
+        self.rate_limiter = rate_limiter or HostRateLimiter()
         self.session = self._create_session()
+        self.http_cache = http_cache
         self.last_fetch_time = None
-        self.cache = {}
+        self.cache = MemoryCache(max_bytes=cache_max_bytes, name=name)
     
     def _create_session(self) -> requests.Session:
         """
-        Create requests session with retry strategy.
+        Create requests session.
+        
+        Retries are handled by `_send` (per-host throttling, Retry-After,
+        jittered backoff), so the transport adapter itself never retries.
         
         Returns:
             Configured requests Session object
         """
         session = requests.Session()
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=self.max_retries,
-            backoff_factor=self.retry_backoff,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=0)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         return session
     
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the per-host throttle, retrying transient failures.
+        
+        - Each attempt takes a token from the host's bucket.
+        - 429/5xx answers and connection errors are retried (idempotent methods
+          only) after the server's `Retry-After`, or else a jittered exponential
+          backoff capped at `retry_backoff` seconds. A `Retry-After` pauses the
+          whole host, not just this request.
+        - Repeated host errors open the host's circuit breaker, after which
+          requests fail fast with `CircuitOpenError` until the cooldown elapses.
+        
+        Args:
+            method: HTTP method
+            url: Full URL for request
+            **kwargs: Additional arguments to pass to session.request
+            
+        Returns:
+            Final response (possibly a retryable error status once retries are exhausted)
+            
+        Raises:
+            requests.exceptions.RequestException: if no response could be obtained
+        """
+        throttle = self.rate_limiter.for_url(url)
+        attempts = self.max_retries + 1 if method.upper() in RETRY_METHODS else 1
+        
+        for attempt in range(attempts):
+            if not throttle.breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {throttle.host}, failing fast")
+            throttle.bucket.acquire()
+            
+            last_attempt = attempt == attempts - 1
+            try:
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                throttle.breaker.record_failure()
+                if last_attempt:
+                    raise
+                delay = backoff_delay(attempt, self.backoff_base, self.retry_backoff)
+                logger.warning(f"[{self.name}] {e.__class__.__name__} on {url}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            
+            if response.status_code not in RETRY_STATUSES:
+                throttle.breaker.record_success()
+                return response
+            
+            throttle.breaker.record_failure()
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            if last_attempt or (retry_after is not None and retry_after > MAX_RETRY_AFTER_SECONDS):
+                return response
+            
+            response.close()
+            if retry_after is not None:
+                # The bucket makes every caller of this host wait, including us
+                throttle.bucket.pause(retry_after)
+                logger.warning(f"[{self.name}] HTTP {response.status_code} on {url}, honouring Retry-After of {retry_after:.1f}s")
+            else:
+                delay = backoff_delay(attempt, self.backoff_base, self.retry_backoff)
+                logger.warning(f"[{self.name}] HTTP {response.status_code} on {url}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
     def _make_request(self, method: str, url: str, **kwargs) -> Optional[Any]:
         """
         Make HTTP request with error handling and retries.
         
+        When a persistent HTTP cache is configured, GET requests are sent as
+        conditional requests (If-None-Match / If-Modified-Since). A 304 answer
+        is served from the cached body, and fresh cacheable 200 answers are
+        stored for the next run. The cache is meant for small metadata
+        answers: streamed requests (file downloads, see `download_to_file`)
+        and range requests bypass it.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Full URL for request
@@ -77,20 +201,46 @@ class BaseConnector(ABC):
         Returns:
             Response object or None if failed
         """
+        cache_key = None
+        request_headers = dict(kwargs.pop('headers', None) or {})
+        if (self.http_cache is not None and method == "GET" and 'Range' not in request_headers
+                and not kwargs.get('stream')):
+            cache_key = self.http_cache.make_key(url, kwargs.get('params'))
+            request_headers.update(self.http_cache.conditional_headers(cache_key))
+        
         try:
             logger.debug(f"[{self.name}] Making {method} request to {url}")
-            response = self.session.request(
-                method,
-                url,
-                timeout=self.timeout,
-                **kwargs
-            )
+            response = self._send(method, url, headers=request_headers, **kwargs)
             response.raise_for_status()
             self.last_fetch_time = datetime.utcnow()
+            
+            if cache_key is None:
+                return response
+            
+            if response.status_code == 304:
+                response.close()
+                cached = self.http_cache.build_response(cache_key, url)
+                if cached is not None:
+                    logger.info(f"[{self.name}] Not modified, using cached copy of {url}")
+                    cached.from_cache = True
+                    return cached
+                # Cached body vanished since the lookup: fetch it unconditionally
+                request_headers.pop('If-None-Match', None)
+                request_headers.pop('If-Modified-Since', None)
+                response = self._send(method, url, headers=request_headers, **kwargs)
+                response.raise_for_status()
+            
+            if self.http_cache.is_cacheable(response) and self.http_cache.store(cache_key, url, response):
+                stored = self.http_cache.build_response(cache_key, url)
+                stored.from_cache = False
+                return stored
             return response
         except requests.exceptions.RequestException as e:
             logger.error(f"[{self.name}] Request failed: {e}")
             return None
+        except OSError as e:
+            logger.error(f"[{self.name}] HTTP cache error for {url}: {e}")
+            return None
     
     def get(self, url: str, **kwargs) -> Optional[Any]:
         """Make GET request."""
@@ -100,6 +250,200 @@ class BaseConnector(ABC):
         """Make POST request."""
         return self._make_request("POST", url, **kwargs)
     
+    def download_to_file(self, url: str, dest_path: Union[str, Path],
+                         chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         validators: Optional[Dict[str, Optional[str]]] = None) -> Optional[DownloadResult]:
+        """
+        Stream a remote resource to disk, resuming interrupted transfers.
+        
+        The body is written chunk by chunk into `<dest_path>.part`, which is
+        atomically renamed to `dest_path` once the transfer completes. A failed
+        or interrupted download never leaves a truncated file at `dest_path`.
+        
+        The `.part` file is kept on failure together with a small sidecar
+        holding the resource validator (ETag or Last-Modified). The next attempt,
+        in this run or a later one, sends a `Range` header guarded by `If-Range`
+        so only the missing tail is transferred. If the server ignores the
+        range or the resource changed upstream, the download restarts cleanly
+        from byte zero. The partial file is only discarded when the server
+        rejects the range (HTTP 412/416); transport errors keep it.
+        
+        Downloads never go through the HTTP body cache (the raw store already
+        keeps the file). Instead, when `dest_path` exists and `validators`
+        describe it, the request is conditional (If-None-Match /
+        If-Modified-Since) and a 304 answer keeps the existing file.
+        
+        Failed attempts are retried up to `max_retries` times after a jittered
+        exponential backoff, except client errors (4xx other than 429 and
+        rejected ranges), which are raised at once.
+        
+        Args:
+            url: Full URL of the resource
+            dest_path: Final location of the downloaded file
+            chunk_size: Number of bytes read from the socket at a time
+            validators: 'etag' / 'last_modified' of the copy at `dest_path`
+                (from a previous DownloadResult, e.g. the raw store manifest)
+            
+        Returns:
+            DownloadResult with size and timing, or None if every attempt failed
+            
+        Raises:
+            requests.exceptions.HTTPError: On a client error such as 404 or 403
+        """
+        dest_path = Path(dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest_path.with_name(dest_path.name + PART_SUFFIX)
+        meta_path = dest_path.with_name(dest_path.name + PART_META_SUFFIX)
+        
+        start = time.monotonic()
+        bytes_transferred = 0
+        resumed_from = None
+        
+        for attempt in range(self.max_retries + 1):
+            headers = {}
+            offset = self._resumable_offset(url, part_path, meta_path)
+            if offset > 0:
+                headers['Range'] = f"bytes={offset}-"
+                headers['If-Range'] = self._read_part_meta(meta_path)['validator']
+                logger.info(f"[{self.name}] Resuming {url} from byte {offset}")
+            elif validators and dest_path.exists():
+                if validators.get('etag'):
+                    headers['If-None-Match'] = validators['etag']
+                if validators.get('last_modified'):
+                    headers['If-Modified-Since'] = validators['last_modified']
+            
+            try:
+                response = self._send("GET", url, stream=True, headers=headers)
+            except requests.exceptions.RequestException as e:
+                # Transport error or open circuit: the partial file is kept for the next attempt
+                self._download_backoff(url, attempt, e)
+                continue
+            
+            if offset > 0 and response.status_code in RANGE_REJECTED_STATUSES:
+                response.close()
+                logger.info(f"[{self.name}] Server rejected range request (HTTP {response.status_code}), restarting {url}")
+                self._discard_part(part_path, meta_path)
+                continue
+            if response.status_code >= 400:
+                response.close()
+                if response.status_code < 500 and response.status_code not in RETRY_STATUSES | RANGE_REJECTED_STATUSES:
+                    # Client errors (404, 403, ...) will not go away by asking again
+                    logger.error(f"[{self.name}] Download of {url} failed: HTTP {response.status_code}")
+                    response.raise_for_status()
+                self._download_backoff(url, attempt, f"HTTP {response.status_code}")
+                continue
+            self.last_fetch_time = datetime.utcnow()
+            
+            if response.status_code == 304:
+                response.close()
+                logger.info(f"[{self.name}] Not modified, keeping {dest_path}")
+                return DownloadResult(
+                    url=url,
+                    path=dest_path,
+                    bytes_written=dest_path.stat().st_size,
+                    elapsed_seconds=time.monotonic() - start,
+                    bytes_transferred=0,
+                    from_cache=True,
+                    etag=validators.get('etag'),
+                    last_modified=validators.get('last_modified')
+                )
+            
+            if offset > 0 and response.status_code != 206:
+                # Range ignored or resource changed upstream: full body follows
+                logger.info(f"[{self.name}] Server did not honour range request, restarting {url}")
+                offset = 0
+            if resumed_from is None:
+                resumed_from = offset
+            
+            self._write_part_meta(meta_path, url, response)
+            try:
+                with response, open(part_path, 'ab' if offset > 0 else 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            bytes_transferred += len(chunk)
+            except (requests.exceptions.RequestException, OSError) as e:
+                self._download_backoff(url, attempt, e)
+                continue
+            
+            os.replace(part_path, dest_path)
+            if meta_path.exists():
+                meta_path.unlink()
+            
+            result = DownloadResult(
+                url=url,
+                path=dest_path,
+                bytes_written=dest_path.stat().st_size,
+                elapsed_seconds=time.monotonic() - start,
+                bytes_transferred=bytes_transferred,
+                resumed_from=resumed_from or 0,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+            logger.info(
+                f"[{self.name}] Downloaded {result.bytes_written} bytes to {dest_path} "
+                f"in {result.elapsed_seconds:.2f}s ({result.bytes_per_second / 1024:.1f} KiB/s)"
+            )
+            return result
+        
+        logger.error(f"[{self.name}] Download of {url} failed after {self.max_retries + 1} attempts")
+        return None
+    
+    def _download_backoff(self, url: str, attempt: int, error: Any):
+        """Log a failed download attempt and wait the jittered backoff before the next one."""
+        if attempt >= self.max_retries:
+            logger.warning(f"[{self.name}] Download of {url} failed (attempt {attempt + 1}): {error}")
+            return
+        delay = backoff_delay(attempt, self.backoff_base, self.retry_backoff)
+        logger.warning(f"[{self.name}] Download of {url} failed (attempt {attempt + 1}): {error}, "
+                       f"retrying in {delay:.1f}s")
+        time.sleep(delay)
+    
+    def _resumable_offset(self, url: str, part_path: Path, meta_path: Path) -> int:
+        """
+        Return the byte offset a previous partial download can resume from.
+        
+        Resuming requires a `.part` file and a validator recorded for the same
+        URL; anything else is discarded and the download starts from zero.
+        """
+        if not part_path.exists():
+            return 0
+        
+        meta = self._read_part_meta(meta_path)
+        if not meta or meta.get('url') != url or not meta.get('validator'):
+            self._discard_part(part_path, meta_path)
+            return 0
+        
+        return part_path.stat().st_size
+    
+    def _read_part_meta(self, meta_path: Path) -> dict:
+        """Read the validator sidecar of a partial download."""
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_part_meta(self, meta_path: Path, url: str, response: Any):
+        """
+        Record the validator of the resource being downloaded.
+        
+        Weak ETags cannot be used with If-Range, so Last-Modified is used instead.
+        """
+        etag = response.headers.get('ETag')
+        if etag and etag.startswith('W/'):
+            etag = None
+        validator = etag or response.headers.get('Last-Modified')
+        
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'validator': validator}, f)
+    
+    def _discard_part(self, part_path: Path, meta_path: Path):
+        """Remove a partial download and its sidecar."""
+        for path in (part_path, meta_path):
+            if path.exists():
+                path.unlink()
+    
     @abstractmethod
     def fetch_data(self, **kwargs) -> Optional[Any]:
         """
@@ -131,16 +475,15 @@ class BaseConnector(ABC):
         """
         Cache fetched data.
         
+        The in-process cache is bounded by a byte budget (deep DataFrame
+        memory usage); least recently used entries are evicted beyond it.
+        
         Args:
             key: Cache key
             data: Data to cache
             ttl_hours: Time to live in hours
         """
-        self.cache[key] = {
-            'data': data,
-            'timestamp': datetime.utcnow(),
-            'ttl': timedelta(hours=ttl_hours)
-        }
+        self.cache.put(key, data, ttl_hours=ttl_hours)
         logger.debug(f"[{self.name}] Cached data with key: {key}")
     
     def get_cached_data(self, key: str) -> Optional[Any]:
@@ -153,19 +496,14 @@ class BaseConnector(ABC):
         Returns:
             Cached data if valid, None otherwise
         """
-        if key not in self.cache:
-            return None
-        
-        cache_entry = self.cache[key]
-        elapsed = datetime.utcnow() - cache_entry['timestamp']
-        
-        if elapsed > cache_entry['ttl']:
-            del self.cache[key]
-            logger.debug(f"[{self.name}] Cache expired for key: {key}")
-            return None
-        
-        logger.debug(f"[{self.name}] Using cached data for key: {key}")
-        return cache_entry['data']
+        data = self.cache.get(key)
+        if data is not None:
+            logger.debug(f"[{self.name}] Using cached data for key: {key}")
+        return data
+    
+    def cache_stats(self) -> dict:
+        """Hit/miss/eviction counters and memory usage of the data cache."""
+        return self.cache.stats()
     
     def clear_cache(self):
         """Clear all cached data."""
@@ -175,6 +513,8 @@ class BaseConnector(ABC):
     def close(self):
         """Close session."""
         self.session.close()
+        if self.http_cache is not None:
+            self.http_cache.close()
         logger.debug(f"[{self.name}] Session closed")
     
     def __enter__(self):
@@ -0,0 +1,212 @@
+"""
+Local index of data.gouv.fr catalog metadata.
+
+Keeps the dataset and resource metadata returned by the API (id, title,
+format, url, last_modified, checksum, filesize) in a SQLite file, together
+with the dataset IDs returned by past searches. Resource resolution
+(`find_csv_resource`, IQSS title matching) can then run against the index
+without any network round trip, and entirely offline once the index is warm.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, List, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Resource fields kept in the index (subset of the data.gouv.fr API payload)
+RESOURCE_FIELDS = ['id', 'title', 'format', 'url', 'last_modified', 'checksum', 'filesize']
+
+
+class CatalogIndex:
+    """
+    SQLite-backed catalog of datasets, resources and search results.
+
+    Entries older than `max_age_hours` are reported as missing so that callers
+    refresh them from the API, unless the lookup is made in offline mode.
+    """
+
+    def __init__(self, index_path: Union[str, Path], max_age_hours: float = 24):
+        """
+        Initialize CatalogIndex.
+
+        Args:
+            index_path: SQLite file holding the index
+            max_age_hours: Age after which an entry needs refreshing
+        """
+        self.index_path = Path(index_path)
+        self.max_age_hours = max_age_hours
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, pipeline_config) -> Optional["CatalogIndex"]:
+        """
+        Build the index described by a PipelineConfig.
+
+        Returns:
+            CatalogIndex instance, or None if the catalog index is disabled
+        """
+        if not pipeline_config.catalog_index_enabled:
+            return None
+        return cls(pipeline_config.catalog_index_path, max_age_hours=pipeline_config.catalog_max_age_hours)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the index lazily so that unused indexes never touch the disk."""
+        if self._conn is None:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS datasets (
+                    id TEXT PRIMARY KEY,
+                    title TEXT,
+                    last_modified TEXT,
+                    refreshed_at REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS resources (
+                    dataset_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    id TEXT,
+                    title TEXT,
+                    format TEXT,
+                    url TEXT,
+                    last_modified TEXT,
+                    checksum TEXT,
+                    filesize INTEGER,
+                    PRIMARY KEY (dataset_id, position)
+                );
+                CREATE TABLE IF NOT EXISTS searches (
+                    query TEXT PRIMARY KEY,
+                    dataset_ids TEXT NOT NULL,
+                    refreshed_at REAL NOT NULL
+                );
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _is_fresh(self, refreshed_at: float, offline: bool) -> bool:
+        return offline or time.time() - refreshed_at <= self.max_age_hours * 3600
+
+    def _upsert(self, dataset_info: dict, now: float):
+        """Replace a dataset and its resources (caller holds the lock)."""
+        dataset_id = dataset_info['id']
+        self.conn.execute(
+            "INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?)",
+            (dataset_id, dataset_info.get('title'), dataset_info.get('last_modified'), now)
+        )
+        self.conn.execute("DELETE FROM resources WHERE dataset_id = ?", (dataset_id,))
+        self.conn.executemany(
+            "INSERT INTO resources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (dataset_id, position, res.get('id'), res.get('title'), res.get('format'), res.get('url'),
+                 res.get('last_modified'), json.dumps(res['checksum']) if res.get('checksum') else None,
+                 res.get('filesize'))
+                for position, res in enumerate(dataset_info.get('resources', []))
+            ]
+        )
+
+    def upsert_dataset(self, dataset_info: dict):
+        """
+        Store (or refresh) a dataset and its resources.
+
+        Args:
+            dataset_info: Dataset payload from the data.gouv.fr API
+        """
+        if not dataset_info.get('id'):
+            return
+        with self._lock:
+            self._upsert(dataset_info, time.time())
+            self.conn.commit()
+
+    def get_dataset(self, dataset_id: str, offline: bool = False) -> Optional[dict]:
+        """
+        Look up a dataset in the index.
+
+        Args:
+            dataset_id: Dataset ID
+            offline: Accept entries of any age
+
+        Returns:
+            API-shaped dict (id, title, last_modified, resources), or None if
+            the dataset is unknown or stale
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT title, last_modified, refreshed_at FROM datasets WHERE id = ?", (dataset_id,)
+            ).fetchone()
+            if row is None or not self._is_fresh(row[2], offline):
+                return None
+            resources = self.conn.execute(
+                "SELECT id, title, format, url, last_modified, checksum, filesize "
+                "FROM resources WHERE dataset_id = ? ORDER BY position", (dataset_id,)
+            ).fetchall()
+
+        return {
+            'id': dataset_id,
+            'title': row[0],
+            'last_modified': row[1],
+            'resources': [
+                dict(zip(RESOURCE_FIELDS, res[:5] + (json.loads(res[5]) if res[5] else None, res[6])))
+                for res in resources
+            ],
+        }
+
+    def record_search(self, query: str, datasets: List[dict]):
+        """
+        Store the result of a dataset search and the datasets it returned.
+
+        Args:
+            query: Search query
+            datasets: Dataset payloads returned by the search, in order
+        """
+        now = time.time()
+        with self._lock:
+            for dataset_info in datasets:
+                if dataset_info.get('id'):
+                    self._upsert(dataset_info, now)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?)",
+                (query, json.dumps([d.get('id') for d in datasets if d.get('id')]), now)
+            )
+            self.conn.commit()
+
+    def search(self, query: str, offline: bool = False) -> Optional[List[dict]]:
+        """
+        Replay a recorded search from the index.
+
+        Args:
+            query: Search query
+            offline: Accept entries of any age
+
+        Returns:
+            Dataset dicts in the original search order, or None if the query
+            was never recorded or is stale
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT dataset_ids, refreshed_at FROM searches WHERE query = ?", (query,)
+            ).fetchone()
+        if row is None or not self._is_fresh(row[1], offline):
+            return None
+
+        datasets = []
+        for dataset_id in json.loads(row[0]):
+            dataset_info = self.get_dataset(dataset_id, offline=True)
+            if dataset_info is not None:
+                datasets.append(dataset_info)
+        return datasets
+
+    def close(self):
+        """Close the SQLite index."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
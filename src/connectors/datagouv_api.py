@@ -5,19 +5,93 @@ Handles retrieval of FINESS data (geographic identification numbers)
 and establishment information from the official French open data portal.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Optional, List, Dict
 import pandas as pd
 import io
 
+from .async_base import AsyncBaseConnector
 from .base import BaseConnector
+from .catalog_index import CatalogIndex
+from .http_cache import HTTPCache
+from .rate_limit import HostRateLimiter
 from src.config import config, DataGouvConfig
 
 
 logger = logging.getLogger(__name__)
 
 
-class DataGouvConnector(BaseConnector):
+class DataGouvMixin:
+    """
+    Resource selection and validation shared by the Data.gouv connectors.
+
+    Pure metadata logic: it reads only its arguments, never the HTTP
+    session or the sync/async state of the connector.
+    """
+    
+    def find_csv_resource(self, dataset_info: dict, keyword_filter: str) -> Optional[str]:
+        """
+        Find CSV resource URL matching keyword filter.
+        
+        Args:
+            dataset_info: Dataset metadata dict
+            keyword_filter: Keyword to search in resource title
+            
+        Returns:
+            URL of matching CSV resource or None if not found
+        """
+        resources = dataset_info.get('resources', [])
+        
+        # Sort by last_modified date (most recent first)
+        resources = sorted(
+            resources,
+            key=lambda x: x.get('last_modified', ''),
+            reverse=True
+        )
+        
+        for resource in resources:
+            if (resource.get('format', '').upper() == 'CSV' and 
+                keyword_filter.lower() in resource.get('title', '').lower()):
+                logger.info(f"Found CSV resource: {resource.get('title')}")
+                logger.info(f"Last modified: {resource.get('last_modified')}")
+                return resource.get('url')
+        
+        logger.warning(f"No CSV resource found with keyword: {keyword_filter}")
+        return None
+    
+    def validate_response(self, response: Optional[pd.DataFrame]) -> bool:
+        """
+        Validate FINESS data response.
+        
+        Args:
+            response: DataFrame to validate
+            
+        Returns:
+            True if valid, False otherwise
+        """
+        if response is None or not isinstance(response, pd.DataFrame):
+            logger.error("Invalid response: not a DataFrame")
+            return False
+        
+        if len(response) == 0:
+            logger.error("Invalid response: empty DataFrame")
+            return False
+        
+        # Check for required columns (case-insensitive)
+        required_cols = ['num_finess_et', 'rs', 'siret']
+        df_cols_lower = [c.lower() for c in response.columns]
+        
+        for col in required_cols:
+            if col.lower() not in df_cols_lower:
+                logger.error(f"Missing required column: {col}")
+                return False
+        
+        logger.info("FINESS data validation successful")
+        return True
+
+
+class DataGouvConnector(DataGouvMixin, BaseConnector):
     """
     Connector for Data.gouv API.
     
@@ -26,12 +100,16 @@ class DataGouvConnector(BaseConnector):
     and clinic registry information.
     """
     
-    def __init__(self, datagouv_config: Optional[DataGouvConfig] = None):
+    def __init__(self, datagouv_config: Optional[DataGouvConfig] = None,
+                 catalog: Optional[CatalogIndex] = None, offline: Optional[bool] = None):
         """
         Initialize Data.gouv connector.
         
         Args:
             datagouv_config: Configuration object for Data.gouv API
+            catalog: Local metadata index (default: built from PipelineConfig)
+            offline: Resolve metadata from the catalog index only, never
+                from the API (default: PipelineConfig.offline_mode)
         """
         if datagouv_config is None:
             datagouv_config = config.datagouv
@@ -39,23 +117,43 @@ class DataGouvConnector(BaseConnector):
         super().__init__(
             name="DataGouv",
             base_url=datagouv_config.base_url,
-            timeout=datagouv_config.timeout
+            timeout=datagouv_config.timeout,
+            max_retries=config.pipeline.max_retries,
+            retry_backoff=config.pipeline.retry_backoff_seconds,
+            http_cache=HTTPCache.from_config(config.pipeline),
+            cache_max_bytes=config.pipeline.connector_cache_max_mb * 1024 * 1024,
+            rate_limiter=HostRateLimiter.from_config(config.pipeline)
         )
         
         self.config = datagouv_config
         self.finess_dataset_id = datagouv_config.finess_dataset_id
         self.finess_keyword = datagouv_config.finess_resource_keyword
+        self.catalog = catalog if catalog is not None else CatalogIndex.from_config(config.pipeline)
+        self.offline = config.pipeline.offline_mode if offline is None else offline
     
-    def search_datasets(self, query: str) -> Optional[list]:
+    def search_datasets(self, query: str, refresh: bool = False) -> Optional[list]:
         """
         Search for datasets by query text.
         
+        Searches recorded in the catalog index are answered locally while
+        fresh (at any age in offline mode).
+        
         Args:
             query: Search query
+            refresh: Bypass the catalog index and query the API
             
         Returns:
             List of dataset dicts or None if failed
         """
+        if self.catalog is not None and not refresh:
+            indexed = self.catalog.search(query, offline=self.offline)
+            if indexed is not None:
+                logger.debug(f"Resolved search '{query}' from the catalog index")
+                return indexed
+        if self.offline:
+            logger.error(f"Offline mode: search '{query}' is not in the catalog index")
+            return None
+        
         url = f"{self.base_url}/datasets/"
         params = {
             "q": query,
@@ -71,21 +169,35 @@ class DataGouvConnector(BaseConnector):
             
         try:
             data = response.json()
-            return data.get('data', [])
+            datasets = data.get('data', [])
         except ValueError as e:
             logger.error(f"Failed to parse search response: {e}")
             return None
+        
+        if self.catalog is not None:
+            self.catalog.record_search(query, datasets)
+        return datasets
 
-    def get_dataset_info(self, dataset_id: str) -> Optional[dict]:
+    def get_dataset_info(self, dataset_id: str, refresh: bool = False) -> Optional[dict]:
         """
-        Get dataset metadata from Data.gouv API.
+        Get dataset metadata, from the catalog index when possible.
         
         Args:
             dataset_id: Dataset ID to fetch metadata for
+            refresh: Bypass the catalog index and query the API
             
         Returns:
             Dataset metadata dict or None if failed
         """
+        if self.catalog is not None and not refresh:
+            indexed = self.catalog.get_dataset(dataset_id, offline=self.offline)
+            if indexed is not None:
+                logger.debug(f"Resolved dataset {dataset_id} from the catalog index")
+                return indexed
+        if self.offline:
+            logger.error(f"Offline mode: dataset {dataset_id} is not in the catalog index")
+            return None
+        
         url = f"{self.base_url}/datasets/{dataset_id}/"
         response = self.get(url)
         
@@ -96,40 +208,34 @@ class DataGouvConnector(BaseConnector):
         try:
             data = response.json()
             logger.info(f"Successfully fetched metadata for dataset {dataset_id}")
-            return data
         except ValueError as e:
             logger.error(f"Failed to parse JSON response: {e}")
             return None
+        
+        if self.catalog is not None:
+            self.catalog.upsert_dataset(data)
+        return data
     
-    def find_csv_resource(self, dataset_info: dict, keyword_filter: str) -> Optional[str]:
+    def refresh_catalog(self, dataset_ids: List[str] = (), queries: List[str] = ()) -> Dict[str, int]:
         """
-        Find CSV resource URL matching keyword filter.
+        Refresh catalog index entries from the API in one pass.
         
         Args:
-            dataset_info: Dataset metadata dict
-            keyword_filter: Keyword to search in resource title
+            dataset_ids: Datasets to re-fetch
+            queries: Searches to re-run
             
         Returns:
-            URL of matching CSV resource or None if not found
+            Dict with the number of refreshed and failed lookups
         """
-        resources = dataset_info.get('resources', [])
-        
-        # Sort by last_modified date (most recent first)
-        resources = sorted(
-            resources,
-            key=lambda x: x.get('last_modified', ''),
-            reverse=True
-        )
-        
-        for resource in resources:
-            if (resource.get('format', '').upper() == 'CSV' and 
-                keyword_filter.lower() in resource.get('title', '').lower()):
-                logger.info(f"Found CSV resource: {resource.get('title')}")
-                logger.info(f"Last modified: {resource.get('last_modified')}")
-                return resource.get('url')
+        if self.offline:
+            logger.error("Offline mode: catalog index cannot be refreshed")
+            return {'refreshed': 0, 'failed': len(dataset_ids) + len(queries)}
         
-        logger.warning(f"No CSV resource found with keyword: {keyword_filter}")
-        return None
+        outcomes = [self.get_dataset_info(i, refresh=True) is not None for i in dataset_ids]
+        outcomes += [self.search_datasets(q, refresh=True) is not None for q in queries]
+        refreshed = sum(outcomes)
+        logger.info(f"Catalog index refreshed: {refreshed}/{len(outcomes)} lookups")
+        return {'refreshed': refreshed, 'failed': len(outcomes) - refreshed}
     
     def download_csv(self, url: str, separator: Optional[str] = None,
                      encoding: Optional[str] = None) -> Optional[pd.DataFrame]:
@@ -211,32 +317,191 @@ class DataGouvConnector(BaseConnector):
         """
         return self.fetch_finess_data()
     
-    def validate_response(self, response: Optional[pd.DataFrame]) -> bool:
+    def close(self):
+        """Close session, HTTP cache and catalog index."""
+        super().close()
+        if self.catalog is not None:
+            self.catalog.close()
+
+
+class AsyncDataGouvConnector(DataGouvMixin, AsyncBaseConnector):
+    """
+    Asyncio connector for Data.gouv API.
+    
+    Same catalog and FINESS operations as `DataGouvConnector`, but metadata
+    lookups and downloads can run concurrently on one event loop, e.g.
+    `await asyncio.gather(*(c.get_dataset_info(i) for i in ids))`.
+    """
+    
+    def __init__(self, datagouv_config: Optional[DataGouvConfig] = None,
+                 max_concurrency: Optional[int] = None):
         """
-        Validate FINESS data response.
+        Initialize async Data.gouv connector.
         
         Args:
-            response: DataFrame to validate
+            datagouv_config: Configuration object for Data.gouv API
+            max_concurrency: Requests in flight (default: PipelineConfig.max_workers)
+        """
+        if datagouv_config is None:
+            datagouv_config = config.datagouv
+        
+        super().__init__(
+            name="DataGouv",
+            base_url=datagouv_config.base_url,
+            timeout=datagouv_config.timeout,
+            max_retries=config.pipeline.max_retries,
+            retry_backoff=config.pipeline.retry_backoff_seconds,
+            max_concurrency=max_concurrency or config.pipeline.max_workers,
+            cache_max_bytes=config.pipeline.connector_cache_max_mb * 1024 * 1024,
+            rate_limiter=HostRateLimiter.from_config(config.pipeline)
+        )
+        
+        self.config = datagouv_config
+        self.finess_dataset_id = datagouv_config.finess_dataset_id
+        self.finess_keyword = datagouv_config.finess_resource_keyword
+    
+    async def search_datasets(self, query: str) -> Optional[list]:
+        """
+        Search for datasets by query text.
+        
+        Args:
+            query: Search query
             
         Returns:
-            True if valid, False otherwise
+            List of dataset dicts or None if failed
         """
-        if response is None or not isinstance(response, pd.DataFrame):
-            logger.error("Invalid response: not a DataFrame")
-            return False
+        url = f"{self.base_url}/datasets/"
+        params = {
+            "q": query,
+            "page_size": 10,
+            "sort": "-created"
+        }
         
-        if len(response) == 0:
-            logger.error("Invalid response: empty DataFrame")
-            return False
+        response = await self.get(url, params=params)
         
-        # Check for required columns (case-insensitive)
-        required_cols = ['num_finess_et', 'rs', 'siret']
-        df_cols_lower = [c.lower() for c in response.columns]
+        if response is None:
+            logger.error(f"Failed to search datasets for query: {query}")
+            return None
         
-        for col in required_cols:
-            if col.lower() not in df_cols_lower:
-                logger.error(f"Missing required column: {col}")
-                return False
+        try:
+            return response.json().get('data', [])
+        except ValueError as e:
+            logger.error(f"Failed to parse search response: {e}")
+            return None
+    
+    async def get_dataset_info(self, dataset_id: str) -> Optional[dict]:
+        """
+        Get dataset metadata from Data.gouv API.
         
-        logger.info("FINESS data validation successful")
-        return True
\ No newline at end of file
+        Args:
+            dataset_id: Dataset ID to fetch metadata for
+            
+        Returns:
+            Dataset metadata dict or None if failed
+        """
+        url = f"{self.base_url}/datasets/{dataset_id}/"
+        response = await self.get(url)
+        
+        if response is None:
+            logger.error(f"Failed to fetch dataset info for {dataset_id}")
+            return None
+        
+        try:
+            data = response.json()
+            logger.info(f"Successfully fetched metadata for dataset {dataset_id}")
+            return data
+        except ValueError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            return None
+    
+    async def get_datasets_info(self, dataset_ids: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        Fetch metadata for several datasets concurrently.
+        
+        Args:
+            dataset_ids: Dataset IDs to fetch
+            
+        Returns:
+            Mapping of dataset ID to metadata dict (None for failures)
+        """
+        results = await asyncio.gather(*(self.get_dataset_info(i) for i in dataset_ids))
+        return dict(zip(dataset_ids, results))
+    
+    async def download_csv(self, url: str, separator: Optional[str] = None,
+                           encoding: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Download and parse CSV from URL.
+        
+        Parsing runs in a worker thread so the event loop keeps serving
+        other transfers.
+        
+        Args:
+            url: CSV file URL
+            separator: CSV field separator (default from config)
+            encoding: File encoding (default from config)
+            
+        Returns:
+            Pandas DataFrame or None if failed
+        """
+        if separator is None:
+            separator = self.config.csv_separator
+        if encoding is None:
+            encoding = self.config.csv_encoding
+        
+        logger.info(f"Downloading CSV from {url}...")
+        response = await self.get(url)
+        
+        if response is None:
+            logger.error(f"Failed to download CSV from {url}")
+            return None
+        
+        try:
+            df = await asyncio.to_thread(
+                pd.read_csv,
+                io.BytesIO(response.content),
+                sep=separator,
+                encoding=encoding,
+                low_memory=False
+            )
+            logger.info(f"Successfully parsed CSV: {len(df)} rows")
+            return df
+        except Exception as e:
+            logger.error(f"Failed to parse CSV: {e}")
+            return None
+    
+    async def fetch_finess_data(self) -> Optional[pd.DataFrame]:
+        """
+        Fetch FINESS data from Data.gouv.
+        
+        Returns:
+            DataFrame with FINESS establishment data or None if failed
+        """
+        cache_key = "finess_data"
+        cached_df = self.get_cached_data(cache_key)
+        if cached_df is not None:
+            return cached_df
+        
+        logger.info("Fetching FINESS data from Data.gouv...")
+        
+        dataset_info = await self.get_dataset_info(self.finess_dataset_id)
+        if dataset_info is None:
+            return None
+        
+        csv_url = self.find_csv_resource(dataset_info, self.finess_keyword)
+        if csv_url is None:
+            return None
+        
+        df = await self.download_csv(csv_url)
+        if df is not None:
+            self.cache_data(cache_key, df, ttl_hours=24)
+        
+        return df
+    
+    async def fetch_data(self, **kwargs) -> Optional[pd.DataFrame]:
+        """
+        Main fetch method - fetches FINESS data.
+        
+        Returns:
+            DataFrame with FINESS data
+        """
+        return await self.fetch_finess_data()
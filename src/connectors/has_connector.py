@@ -5,46 +5,31 @@ Fetches hospital/clinic certification and quality assessment information
 from the French health authority's official sources.
 """
 
+import asyncio
 import logging
 from typing import Optional, List, Dict
 import pandas as pd
 from datetime import datetime
 
+from .async_base import AsyncBaseConnector
 from .base import BaseConnector
+from .http_cache import HTTPCache
+from .rate_limit import HostRateLimiter
 from src.config import config, HASConfig
 
 
 logger = logging.getLogger(__name__)
 
 
-class HASConnector(BaseConnector):
+class HASMixin:
     """
-    Connector for HAS data sources.
-    
-    Fetches certification levels, visit dates, and patient satisfaction scores
-    for healthcare establishments.
+    Parsing, validation and placeholder fetches shared by the HAS connectors.
+
+    Uses only the in-memory cache (`cache_data` / `get_cached_data`), which
+    the sync and async connector bases both provide, never the HTTP session.
     """
     
-    def __init__(self, has_config: Optional[HASConfig] = None):
-        """
-        Initialize HAS connector.
-        
-        Args:
-            has_config: Configuration object for HAS API
-        """
-        if has_config is None:
-            has_config = config.has
-        
-        super().__init__(
-            name="HAS",
-            base_url=has_config.base_url,
-            timeout=has_config.timeout
-        )
-        
-        self.config = has_config
-        self.api_key = has_config.api_key
-    
-    def fetch_certification_data(self, finess_list: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    def _certification_data(self, finess_list: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
         """
         Fetch certification data for establishments.
         
@@ -88,7 +73,7 @@ class HASConnector(BaseConnector):
             logger.error(f"Error fetching HAS data: {e}")
             return None
     
-    def fetch_satisfaction_scores(self, finess_list: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    def _satisfaction_scores(self, finess_list: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
         """
         Fetch patient satisfaction scores (e-Satis) for establishments.
         
@@ -164,6 +149,85 @@ class HASConnector(BaseConnector):
         logger.warning(f"Unknown certification level: {raw_level}")
         return "Non évalué"
     
+    def validate_response(self, response: Optional[pd.DataFrame]) -> bool:
+        """
+        Validate HAS data response.
+        
+        Args:
+            response: DataFrame to validate
+            
+        Returns:
+            True if valid, False otherwise
+        """
+        if response is None or not isinstance(response, pd.DataFrame):
+            logger.error("Invalid response: not a DataFrame")
+            return False
+        
+        # HAS data can be partial, so we just check it's not completely empty
+        if len(response) == 0:
+            logger.warning("HAS response is empty")
+            return False
+        
+        logger.info("HAS data validation successful")
+        return True
+
+
+class HASConnector(HASMixin, BaseConnector):
+    """
+    Connector for HAS data sources.
+    
+    Fetches certification levels, visit dates, and patient satisfaction scores
+    for healthcare establishments.
+    """
+    
+    def __init__(self, has_config: Optional[HASConfig] = None):
+        """
+        Initialize HAS connector.
+        
+        Args:
+            has_config: Configuration object for HAS API
+        """
+        if has_config is None:
+            has_config = config.has
+        
+        super().__init__(
+            name="HAS",
+            base_url=has_config.base_url,
+            timeout=has_config.timeout,
+            max_retries=config.pipeline.max_retries,
+            retry_backoff=config.pipeline.retry_backoff_seconds,
+            http_cache=HTTPCache.from_config(config.pipeline),
+            cache_max_bytes=config.pipeline.connector_cache_max_mb * 1024 * 1024,
+            rate_limiter=HostRateLimiter.from_config(config.pipeline)
+        )
+        
+        self.config = has_config
+        self.api_key = has_config.api_key
+    
+    def fetch_certification_data(self, finess_list: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Fetch certification data for establishments.
+        
+        Args:
+            finess_list: Optional list of FINESS numbers to filter
+            
+        Returns:
+            DataFrame with certification data or None if failed
+        """
+        return self._certification_data(finess_list)
+    
+    def fetch_satisfaction_scores(self, finess_list: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Fetch patient satisfaction scores (e-Satis) for establishments.
+        
+        Args:
+            finess_list: Optional list of FINESS numbers to filter
+            
+        Returns:
+            DataFrame with satisfaction scores or None if failed
+        """
+        return self._satisfaction_scores(finess_list)
+    
     def fetch_data(self, **kwargs) -> Optional[pd.DataFrame]:
         """
         Main fetch method - fetches all available HAS data.
@@ -188,25 +252,89 @@ class HASConnector(BaseConnector):
                 return cert_df
         
         return cert_df if cert_df is not None else satis_df
+
+
+class AsyncHASConnector(HASMixin, AsyncBaseConnector):
+    """
+    Asyncio connector for HAS data sources.
     
-    def validate_response(self, response: Optional[pd.DataFrame]) -> bool:
+    Certification and e-Satis data are fetched concurrently. The HAS
+    endpoints are not wired yet (see `HASConnector`), so both fetches share
+    the placeholder logic of `HASMixin`; once real endpoints exist they
+    should use `await self.get(...)`.
+    """
+    
+    def __init__(self, has_config: Optional[HASConfig] = None,
+                 max_concurrency: Optional[int] = None):
         """
-        Validate HAS data response.
+        Initialize async HAS connector.
         
         Args:
-            response: DataFrame to validate
+            has_config: Configuration object for HAS API
+            max_concurrency: Requests in flight (default: PipelineConfig.max_workers)
+        """
+        if has_config is None:
+            has_config = config.has
+        
+        super().__init__(
+            name="HAS",
+            base_url=has_config.base_url,
+            timeout=has_config.timeout,
+            max_retries=config.pipeline.max_retries,
+            retry_backoff=config.pipeline.retry_backoff_seconds,
+            max_concurrency=max_concurrency or config.pipeline.max_workers,
+            cache_max_bytes=config.pipeline.connector_cache_max_mb * 1024 * 1024,
+            rate_limiter=HostRateLimiter.from_config(config.pipeline)
+        )
+        
+        self.config = has_config
+        self.api_key = has_config.api_key
+    
+    async def fetch_certification_data(self, finess_list: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Fetch certification data for establishments.
+        
+        Args:
+            finess_list: Optional list of FINESS numbers to filter
             
         Returns:
-            True if valid, False otherwise
+            DataFrame with certification data or None if failed
         """
-        if response is None or not isinstance(response, pd.DataFrame):
-            logger.error("Invalid response: not a DataFrame")
-            return False
+        return self._certification_data(finess_list)
+    
+    async def fetch_satisfaction_scores(self, finess_list: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        Fetch patient satisfaction scores (e-Satis) for establishments.
         
-        # HAS data can be partial, so we just check it's not completely empty
-        if len(response) == 0:
-            logger.warning("HAS response is empty")
-            return False
+        Args:
+            finess_list: Optional list of FINESS numbers to filter
+            
+        Returns:
+            DataFrame with satisfaction scores or None if failed
+        """
+        return self._satisfaction_scores(finess_list)
+    
+    async def fetch_data(self, **kwargs) -> Optional[pd.DataFrame]:
+        """
+        Main fetch method - fetches certification and satisfaction data concurrently.
         
-        logger.info("HAS data validation successful")
-        return True
+        Returns:
+            Combined DataFrame with certification and satisfaction data
+        """
+        finess_list = kwargs.get('finess_list', None)
+        
+        cert_df, satis_df = await asyncio.gather(
+            self.fetch_certification_data(finess_list),
+            self.fetch_satisfaction_scores(finess_list)
+        )
+        
+        if cert_df is not None and satis_df is not None:
+            try:
+                merged = pd.merge(cert_df, satis_df, on='finess', how='left')
+                logger.info(f"Merged HAS data: {len(merged)} records")
+                return merged
+            except Exception as e:
+                logger.error(f"Error merging HAS data: {e}")
+                return cert_df
+        
+        return cert_df if cert_df is not None else satis_df
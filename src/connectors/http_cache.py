@@ -0,0 +1,287 @@
+"""
+Persistent HTTP cache for connectors.
+
+Stores GET response bodies on disk together with their validators
+(ETag / Last-Modified) so that later runs can revalidate them with a
+conditional request and reuse the stored body on a 304 Not Modified.
+The cache survives process restarts and is capped in size, evicting the
+least recently used entries first.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Dict, Any, Union
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping alongside a cached body
+# (bodies are stored decoded, so Content-Encoding is deliberately left out)
+STORED_HEADERS = ['Content-Type', 'Content-Disposition', 'ETag', 'Last-Modified']
+
+
+class HTTPCache:
+    """
+    Disk-backed HTTP response cache with conditional GET support.
+
+    Layout under `cache_dir`:
+    - `index.sqlite`: one row per cached URL (validators, size, last access)
+    - `bodies/<key>.body`: raw response body
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = 1024 * 1024 * 1024):
+        """
+        Initialize HTTP cache.
+
+        Args:
+            cache_dir: Directory holding the index and response bodies
+            max_bytes: Total size cap for stored bodies (LRU eviction beyond it)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.bodies_dir = self.cache_dir / "bodies"
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, pipeline_config) -> Optional["HTTPCache"]:
+        """
+        Build the cache described by a PipelineConfig.
+
+        Returns:
+            HTTPCache instance, or None if the HTTP cache is disabled
+        """
+        if not pipeline_config.http_cache_enabled:
+            return None
+        return cls(
+            pipeline_config.http_cache_path,
+            max_bytes=pipeline_config.http_cache_max_mb * 1024 * 1024
+        )
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the index lazily so that unused caches never touch the disk."""
+        if self._conn is None:
+            self.bodies_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.cache_dir / "index.sqlite"), check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    headers TEXT,
+                    size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a stable cache key from a URL and its query parameters."""
+        full_url = url
+        if params:
+            full_url = f"{url}?{urlencode(sorted(params.items()))}"
+        return hashlib.sha256(full_url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.bodies_dir / f"{key}.body"
+
+    def lookup(self, key: str) -> Optional[dict]:
+        """
+        Return the index entry for `key` if its body is still on disk.
+
+        Args:
+            key: Cache key from `make_key`
+
+        Returns:
+            Entry dict (url, etag, last_modified, headers, size) or None
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, etag, last_modified, headers, size FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        if not self._body_path(key).exists():
+            self.delete(key)
+            return None
+        return {
+            'url': row[0],
+            'etag': row[1],
+            'last_modified': row[2],
+            'headers': json.loads(row[3] or '{}'),
+            'size': row[4],
+        }
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """
+        Build If-None-Match / If-Modified-Since headers for a cached entry.
+
+        Returns:
+            Headers dict (empty if nothing is cached for `key`)
+        """
+        entry = self.lookup(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def is_cacheable(response: requests.Response) -> bool:
+        """Only complete 200 responses carrying a validator can be revalidated later."""
+        if response.status_code != 200:
+            return False
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            return False
+        return bool(response.headers.get('ETag') or response.headers.get('Last-Modified'))
+
+    def store(self, key: str, url: str, response: requests.Response,
+              chunk_size: int = 1024 * 1024) -> bool:
+        """
+        Store a 200 response body on disk.
+
+        The body is streamed to disk, so a `stream=True` response is never
+        loaded into memory. Bodies larger than the cache cap are skipped.
+
+        Args:
+            key: Cache key from `make_key`
+            url: Request URL
+            response: Response to store (its body is consumed)
+            chunk_size: Number of bytes written at a time
+
+        Returns:
+            True if stored, False otherwise
+        """
+        declared_size = response.headers.get('Content-Length')
+        if declared_size and declared_size.isdigit() and int(declared_size) > self.max_bytes:
+            logger.debug(f"Response for {url} exceeds HTTP cache size cap, not caching")
+            return False
+
+        body_path = self._body_path(key)
+        self.bodies_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = body_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        size = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        f.write(chunk)
+                        size += len(chunk)
+            os.replace(tmp_path, body_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        headers = {h: response.headers[h] for h in STORED_HEADERS if h in response.headers}
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 json.dumps(headers), size, now, now)
+            )
+            self.conn.commit()
+        logger.debug(f"Stored {size} bytes for {url} in HTTP cache")
+
+        self.evict(keep=key)
+        return True
+
+    def build_response(self, key: str, url: str) -> Optional[requests.Response]:
+        """
+        Rebuild a response object backed by the cached body on disk.
+
+        The body is read lazily from the file, so both `.content` and
+        `.iter_content()` work without loading large files eagerly.
+
+        Returns:
+            Response with status 200, or None if the entry is gone
+        """
+        entry = self.lookup(key)
+        if entry is None:
+            return None
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.headers['Content-Length'] = str(entry['size'])
+        response.raw = open(self._body_path(key), 'rb')
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        self.touch(key)
+        return response
+
+    def touch(self, key: str):
+        """Mark an entry as recently used."""
+        with self._lock:
+            self.conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.conn.commit()
+
+    def delete(self, key: str):
+        """Remove an entry and its body."""
+        with self._lock:
+            self.conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.conn.commit()
+        body_path = self._body_path(key)
+        if body_path.exists():
+            body_path.unlink()
+
+    def total_size(self) -> int:
+        """Total size of all cached bodies in bytes."""
+        with self._lock:
+            row = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return row[0]
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Evict least recently used entries until the cache fits in `max_bytes`.
+
+        Args:
+            keep: Key that must survive eviction (the entry just stored)
+        """
+        total = self.total_size()
+        if total <= self.max_bytes:
+            return
+
+        with self._lock:
+            rows = self.conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self.delete(key)
+            total -= size
+            logger.debug(f"Evicted HTTP cache entry {key} ({size} bytes)")
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock:
+            keys = [row[0] for row in self.conn.execute("SELECT key FROM entries").fetchall()]
+        for key in keys:
+            self.delete(key)
+
+    def close(self):
+        """Close the index database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,157 @@
+"""
+In-process LRU cache for parsed connector data.
+
+Keeps fetched objects (mostly DataFrames) in memory under a byte budget.
+Entry sizes are measured with `DataFrame.memory_usage(deep=True)`, so the
+budget reflects the real footprint of object columns. When the budget is
+exceeded the least recently used entries are evicted.
+"""
+
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(data: Any) -> int:
+    """
+    Estimate the memory footprint of a cached object in bytes.
+
+    Args:
+        data: Object to measure
+
+    Returns:
+        Size in bytes (deep size for pandas objects)
+    """
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(deep=True, index=True).sum())
+    if isinstance(data, pd.Series):
+        return int(data.memory_usage(deep=True, index=True))
+    return sys.getsizeof(data)
+
+
+class MemoryCache:
+    """
+    Byte-bounded LRU cache with per-entry TTL and hit/miss/eviction counters.
+    """
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024, name: str = "cache"):
+        """
+        Initialize MemoryCache.
+
+        Args:
+            max_bytes: Memory budget for all entries combined
+            name: Label used in log messages
+        """
+        self.max_bytes = max_bytes
+        self.name = name
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self.current_bytes -= entry['size']
+
+    def put(self, key: str, data: Any, ttl_hours: float = 24):
+        """
+        Store an object, evicting least recently used entries if needed.
+
+        Objects larger than the whole budget are not cached.
+
+        Args:
+            key: Cache key
+            data: Object to cache
+            ttl_hours: Time to live in hours
+        """
+        size = estimate_size(data)
+        if size > self.max_bytes:
+            logger.warning(
+                f"[{self.name}] Not caching {key}: {size / 1024 ** 2:.1f} MiB exceeds "
+                f"budget of {self.max_bytes / 1024 ** 2:.1f} MiB"
+            )
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = {
+                'data': data,
+                'size': size,
+                'timestamp': datetime.utcnow(),
+                'ttl': timedelta(hours=ttl_hours),
+            }
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                evicted_key, evicted = next(iter(self._entries.items()))
+                self._remove(evicted_key)
+                self.evictions += 1
+                logger.debug(f"[{self.name}] Evicted {evicted_key} ({evicted['size']} bytes)")
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Retrieve an object if present and not expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached object or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if datetime.utcnow() - entry['timestamp'] > entry['ttl']:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                logger.debug(f"[{self.name}] Cache expired for key: {key}")
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry['data']
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dict with entries, bytes, max_bytes, hits, misses, evictions and expirations
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
@@ -0,0 +1,262 @@
+"""
+Per-host request throttling for connectors.
+
+Provides the building blocks used by `BaseConnector._make_request`:
+- `TokenBucket`: request budget per host (rate + burst), shared by threads
+- `CircuitBreaker`: fails fast once a host keeps erroring, probes it again
+  after a cooldown
+- `backoff_delay` / `parse_retry_after`: jittered exponential backoff and
+  `Retry-After` header parsing for 429/503 answers
+"""
+
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Full-jitter exponential backoff.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay scale of the first retry in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds, uniformly drawn in [0, min(cap, base * 2**attempt)]
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Returns:
+        Delay in seconds, or None if absent/unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Callers reserve a token and sleep until it is available, so concurrent
+    threads are spread out instead of bursting past the budget.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize TokenBucket.
+
+        Args:
+            rate: Tokens added per second (<= 0 disables throttling)
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token without sleeping.
+
+        Returns:
+            Time the caller must wait before sending its request, in seconds
+            (lets asyncio callers wait with `asyncio.sleep`)
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self.blocked_until - now)
+            if self.rate > 0:
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                self.tokens -= 1
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until the budget allows it.
+
+        Returns:
+            Time spent waiting in seconds
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float):
+        """Block every caller for `seconds` (e.g. after a Retry-After)."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed -> open after `failure_threshold` consecutive failures;
+    open -> half-open once `cooldown_seconds` have elapsed (one probe allowed);
+    half-open -> closed on success, back to open on failure.
+
+    In half-open, only the caller sending the probe is let through; the
+    others are refused until its outcome is recorded. A probe whose outcome
+    is never recorded (e.g. a cancelled task) is given up after another
+    `cooldown_seconds`, and the next caller probes instead.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 60):
+        """
+        Initialize CircuitBreaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_seconds: Time before a probe request is let through
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at: Optional[float] = None  # Half-open probe in flight
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (in half-open, True for the probe only)."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                if now - self.opened_at < self.cooldown_seconds:
+                    return False
+                self.state = self.HALF_OPEN
+            elif self.probe_started_at is not None and now - self.probe_started_at < self.cooldown_seconds:
+                return False
+            self.probe_started_at = now
+            return True
+
+    def record_success(self):
+        """Reset the breaker after a successful request."""
+        with self._lock:
+            self.failures = 0
+            self.state = self.CLOSED
+            self.probe_started_at = None
+
+    def record_failure(self):
+        """Count a failed request, opening the circuit if needed."""
+        with self._lock:
+            self.failures += 1
+            self.probe_started_at = None
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit opened after {self.failures} consecutive failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class HostThrottle:
+    """Token bucket and circuit breaker guarding one host."""
+
+    def __init__(self, host: str, bucket: TokenBucket, breaker: CircuitBreaker):
+        self.host = host
+        self.bucket = bucket
+        self.breaker = breaker
+
+
+class HostRateLimiter:
+    """
+    Registry of per-host throttles.
+
+    Connectors that share a registry share each host's budget and breaker,
+    whatever thread or connector instance sends the request.
+    """
+
+    _shared: Dict[tuple, "HostRateLimiter"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, requests_per_second: float = 5.0, burst: int = 10,
+                 failure_threshold: int = 5, cooldown_seconds: float = 60):
+        """
+        Initialize HostRateLimiter.
+
+        Args:
+            requests_per_second: Sustained request budget per host
+            burst: Requests allowed back-to-back before throttling kicks in
+            failure_threshold: Consecutive host errors that open the circuit
+            cooldown_seconds: Time an open circuit waits before probing
+        """
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._hosts: Dict[str, HostThrottle] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, pipeline_config) -> "HostRateLimiter":
+        """
+        Return the process-wide limiter for a PipelineConfig.
+
+        The same instance is returned for identical settings so that every
+        connector hitting a host draws from a single budget.
+        """
+        settings = (
+            pipeline_config.rate_limit_per_second,
+            pipeline_config.rate_limit_burst,
+            pipeline_config.circuit_breaker_threshold,
+            pipeline_config.circuit_breaker_cooldown_seconds,
+        )
+        with cls._shared_lock:
+            if settings not in cls._shared:
+                cls._shared[settings] = cls(*settings)
+            return cls._shared[settings]
+
+    def for_url(self, url: str) -> HostThrottle:
+        """Throttle state for the host of `url`."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostThrottle(
+                    host,
+                    TokenBucket(self.requests_per_second, self.burst),
+                    CircuitBreaker(self.failure_threshold, self.cooldown_seconds),
+                )
+            return self._hosts[host]
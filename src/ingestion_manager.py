@@ -5,32 +5,140 @@ Ingestion Manager for orchestrating data download from various sources.
 import logging
 import os
 import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Callable
 import pandas as pd
 from datetime import datetime
 
 from src.config import config
+from src.connectors.base import DownloadResult
 from src.connectors.datagouv_api import DataGouvConnector
 from src.connectors.has_connector import HASConnector
+from src.storage.freshness import FreshnessScheduler
+from src.storage.raw_store import RawStore
+from src.storage.transcode import UTF8, normalize_text_file
 
 logger = logging.getLogger(__name__)
 
+# HAS certification resources: title/URL fragment -> local file name
+HAS_CERTIFICATION_FILES = {
+    'demarche.csv': 'has_demarche.csv',
+    'etablissement-geo.csv': 'has_etab_geo.csv'
+}
+
+TASK_SUCCESS = "success"
+TASK_FAILED = "failed"
+
+
+def _resource_checksum(resource: dict) -> Optional[str]:
+    """Catalog checksum of a resource as `type:value` (None if not published)."""
+    checksum = resource.get('checksum') or {}
+    if not checksum.get('value'):
+        return None
+    return f"{checksum.get('type', 'unknown')}:{checksum['value']}"
+
+
+@dataclass
+class TaskResult:
+    """Outcome of one ingestion task (one resource download)."""
+    name: str
+    year: int
+    status: str
+    elapsed_seconds: float = 0.0
+    downloads: List[DownloadResult] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def bytes_downloaded(self) -> int:
+        """Bytes received over the network by this task."""
+        return sum(d.bytes_transferred or 0 for d in self.downloads)
+
+
+@dataclass
+class ResourcePlan:
+    """A resolved raw resource: where it comes from and where it goes."""
+    name: str
+    year: int
+    url: str
+    local_name: str
+    dataset_id: Optional[str] = None
+    last_modified: Optional[str] = None
+    checksum: Optional[str] = None
+
+
+@dataclass
+class IngestionPlan:
+    """Unique downloads needed to ingest a set of years."""
+    years: List[int]
+    fetches: Dict[str, List[ResourcePlan]] = field(default_factory=dict)
+    unresolved: List[tuple] = field(default_factory=list)
+
+    @property
+    def placements(self) -> int:
+        """Number of year files the plan produces."""
+        return sum(len(group) for group in self.fetches.values())
+
+
+@dataclass
+class IngestionResult:
+    """Per-task status and timing of an ingestion run."""
+    years: List[int]
+    tasks: List[TaskResult] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        """True if every task succeeded."""
+        return all(t.status == TASK_SUCCESS for t in self.tasks)
+
+    @property
+    def failed_tasks(self) -> List[TaskResult]:
+        return [t for t in self.tasks if t.status == TASK_FAILED]
+
+    @property
+    def bytes_downloaded(self) -> int:
+        return sum(t.bytes_downloaded for t in self.tasks)
+
+    def log_summary(self):
+        """Log one line per task followed by totals."""
+        for task in self.tasks:
+            mark = "✓" if task.status == TASK_SUCCESS else "✗"
+            detail = f"{task.bytes_downloaded} bytes" if task.status == TASK_SUCCESS else task.error
+            logger.info(f"  {mark} {task.year} {task.name}: {task.status} in {task.elapsed_seconds:.2f}s ({detail})")
+        logger.info(
+            f"  {len(self.tasks) - len(self.failed_tasks)}/{len(self.tasks)} tasks succeeded, "
+            f"{self.bytes_downloaded} bytes in {self.elapsed_seconds:.2f}s"
+        )
+
+
 class IngestionManager:
     """
     Orchestrates the ingestion of data from various sources (Data.gouv, HAS, etc.)
     and manages storage in a raw/{year} directory structure.
     """
     
-    def __init__(self, base_path: Optional[str] = None):
+    def __init__(self, base_path: Optional[str] = None, max_workers: Optional[int] = None,
+                 force: bool = False):
         """
         Initialize IngestionManager.
         
         Args:
             base_path: Base path for storing data. Defaults to config.raw_data_path.
+            max_workers: Concurrent downloads. Defaults to config.pipeline.max_workers.
+            force: Download every resource, even if still fresh or unchanged upstream.
         """
         self.base_path = Path(base_path or config.pipeline.raw_data_path)
+        self.max_workers = max(1, max_workers or config.pipeline.max_workers)
+        self.force = force
+        self.raw_store = RawStore(self.base_path)
+        self.scheduler = FreshnessScheduler(self.raw_store, config.pipeline)
         self.datagouv_connector = DataGouvConnector()
+        self._dataset_info_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
         # self.has_connector = HASConnector() # Assuming HAS connector might be used for direct API later, 
                                             # but current plan uses DataGouv for HAS files too.
     
@@ -48,7 +156,116 @@ class IngestionManager:
         year_path.mkdir(parents=True, exist_ok=True)
         return year_path
 
-    def download_health_metrics(self, year: int) -> bool:
+    def _normalize_encoding(self, result: DownloadResult) -> Optional[str]:
+        """
+        Rewrite a downloaded text file as UTF-8 without BOM.
+
+        Runs as a streaming pass once the transfer is complete: while the
+        download is in progress, the `.part` file must hold the upstream
+        bytes so an interrupted transfer can be resumed.
+
+        Args:
+            result: Completed download (its size is updated)
+
+        Returns:
+            Source encoding of the file, or None for binary files and files
+            that could not be decoded (left as downloaded)
+        """
+        encoding = normalize_text_file(result.path, fallback=config.datagouv.csv_encoding)
+        if encoding not in (None, UTF8):
+            result.bytes_written = Path(result.path).stat().st_size
+        return encoding
+
+    def _store_download(self, result: DownloadResult, plan: ResourcePlan) -> DownloadResult:
+        """
+        Register a downloaded file in the content-addressed raw store.
+
+        Text files are first normalized to UTF-8 without BOM (a file kept
+        after a 304 already is, and keeps its recorded encoding). The year file
+        becomes a link to a blob shared with every other year holding the
+        same content, and is recorded in the year manifest along with the
+        fetch time, upstream metadata used by the scheduler and the source
+        encoding.
+
+        Args:
+            result: Completed download
+            plan: Resource the file was downloaded for
+
+        Returns:
+            The same result, with its content hash filled in
+        """
+        if result.from_cache:
+            # Not modified upstream: the stored copy was kept as is
+            encoding = self.raw_store.load_manifest(plan.year).get(plan.local_name, {}).get('source_encoding')
+        else:
+            encoding = self._normalize_encoding(result)
+        source = self.scheduler.source_fields(plan.last_modified, plan.checksum)
+        if encoding is not None:
+            source['source_encoding'] = encoding
+        # HTTP validators of the download, sent back on the next fetch
+        source.update({k: v for k, v in (('http_etag', result.etag), ('http_last_modified', result.last_modified)) if v})
+        result.sha256 = self.raw_store.adopt(result.path, plan.year, url=result.url, source=source)
+        return result
+
+    def _skip_if_current(self, plan: ResourcePlan) -> Optional[DownloadResult]:
+        """
+        Reuse the stored file if the scheduler says it needs no refresh.
+
+        Returns:
+            DownloadResult describing the kept file (nothing transferred),
+            or None if the resource must be downloaded
+        """
+        if self.force:
+            return None
+        reason = self.scheduler.skip_reason(plan.name, plan.year, plan.local_name, plan.url,
+                                            plan.last_modified, plan.checksum)
+        if reason is None:
+            return None
+
+        entry = self.raw_store.load_manifest(plan.year)[plan.local_name]
+        logger.info(f"✓ Skipping {plan.local_name} for {plan.year}: {reason}")
+        return DownloadResult(
+            url=plan.url,
+            path=self.base_path / str(plan.year) / plan.local_name,
+            bytes_written=entry['size'],
+            elapsed_seconds=0.0,
+            bytes_transferred=0,
+            from_cache=True,
+            sha256=entry['sha256']
+        )
+
+    def fetch_resource(self, plan: ResourcePlan) -> Optional[DownloadResult]:
+        """
+        Download a resolved resource into its year folder and store it.
+
+        Resources still fresh or unchanged upstream are not downloaded again
+        (unless the manager was created with `force=True`).
+
+        Args:
+            plan: Resolved resource
+
+        Returns:
+            Optional[DownloadResult]: Download details, or None if it failed.
+        """
+        kept = self._skip_if_current(plan)
+        if kept is not None:
+            return kept
+
+        save_path = self.ensure_year_directory(plan.year) / plan.local_name
+        # Revalidate the stored copy with a conditional request (304 keeps it)
+        entry = self.raw_store.load_manifest(plan.year).get(plan.local_name, {})
+        validators = None
+        if entry.get('url') == plan.url:
+            validators = {'etag': entry.get('http_etag'), 'last_modified': entry.get('http_last_modified')}
+        result = self.datagouv_connector.download_to_file(plan.url, save_path, validators=validators)
+        if result is None:
+            logger.error(f"Failed to download {plan.local_name} for {plan.year}")
+            return None
+
+        logger.info(f"Saved {plan.local_name} to {save_path}")
+        return self._store_download(result, plan)
+
+    def download_health_metrics(self, year: int) -> Optional[DownloadResult]:
         """
         Download Health Metrics (IQSS) for a specific year.
 
@@ -59,7 +276,21 @@ class IngestionManager:
             year (int): Target year for the health metrics data (e.g., 2023).
 
         Returns:
-            bool: True if the file was successfully downloaded and saved, False otherwise.
+            Optional[DownloadResult]: Download details (size, throughput) if the file
+            was successfully downloaded and saved, None otherwise.
+        """
+        plan = self.resolve_health_metrics(year)
+        return self.fetch_resource(plan) if plan else None
+
+    def resolve_health_metrics(self, year: int) -> Optional[ResourcePlan]:
+        """
+        Find the Health Metrics (IQSS) resource for a year without downloading it.
+
+        Args:
+            year (int): Target year for the health metrics data.
+
+        Returns:
+            Optional[ResourcePlan]: The resource to fetch, or None if not found.
         """
         query = config.datagouv.iqss_search_pattern.format(year)
         logger.info(f"Searching for Health Metrics dataset for year {year} with query: '{query}'")
@@ -67,16 +298,16 @@ class IngestionManager:
         datasets = self.datagouv_connector.search_datasets(query)
         if not datasets:
             logger.warning(f"No datasets found for Health Metrics {year}")
-            return False
+            return None
             
         # Prioritize exact match or best match
         target_dataset = datasets[0] 
         dataset_id = target_dataset.get('id')
         logger.info(f"Found dataset: {target_dataset.get('title')} (ID: {dataset_id})")
         
-        dataset_info = self.datagouv_connector.get_dataset_info(dataset_id)
+        dataset_info = self._get_dataset_info(dataset_id)
         if not dataset_info:
-            return False
+            return None
             
         # Try to find a CSV resource first, or XLSX
         # IQSS data is often in XLSX or CSV. We need to be flexible.
@@ -106,33 +337,19 @@ class IngestionManager:
         
         if not target_resource:
             logger.warning(f"No suitable resource found for Health Metrics {year}")
-            return False
+            return None
             
         url = target_resource.get('url')
-        logger.info(f"Downloading resource: {target_resource.get('title')} from {url}")
+        logger.info(f"Resolved resource: {target_resource.get('title')} at {url}")
         
-        # Download file
-        response = self.datagouv_connector.get(url)
-        if not response:
-            logger.error(f"Failed to download Health Metrics for {year}")
-            return False
-            
-        # Save file
         # We assume the format based on the resource metadata
         ext = target_resource.get('format', 'csv').lower()
-        filename = f"health_metrics.{ext}"
-        save_path = self.ensure_year_directory(year) / filename
-        
-        try:
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            logger.info(f"Saved Health Metrics to {save_path}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save file: {e}")
-            return False
+        return ResourcePlan(name="health_metrics", year=year, url=url,
+                            local_name=f"health_metrics.{ext}", dataset_id=dataset_id,
+                            last_modified=target_resource.get('last_modified'),
+                            checksum=_resource_checksum(target_resource))
 
-    def download_finess_data(self, year: int) -> bool:
+    def download_finess_data(self, year: int) -> Optional[DownloadResult]:
         """
         Download FINESS data (Establishment directory).
 
@@ -144,124 +361,414 @@ class IngestionManager:
             year (int): Target year directory to save the data in.
 
         Returns:
-            bool: True if the data was successfully downloaded and saved, False otherwise.
+            Optional[DownloadResult]: Download details if the data was successfully
+            downloaded and saved, None otherwise.
         """
         logger.info(f"Downloading FINESS data for {year} (using current snapshot)")
-        
-        # Use existing logic in DataGouvConnector but save to file instead of returning DF
-        dataset_info = self.datagouv_connector.get_dataset_info(self.datagouv_connector.finess_dataset_id)
+        plan = self.resolve_finess(year)
+        return self.fetch_resource(plan) if plan else None
+
+    def resolve_finess(self, year: int) -> Optional[ResourcePlan]:
+        """
+        Find the FINESS extraction resource without downloading it.
+
+        The snapshot URL is the same for every year, so a multi-year plan
+        fetches it only once.
+
+        Args:
+            year (int): Target year directory.
+
+        Returns:
+            Optional[ResourcePlan]: The resource to fetch, or None if not found.
+        """
+        dataset_id = self.datagouv_connector.finess_dataset_id
+        dataset_info = self._get_dataset_info(dataset_id)
         if not dataset_info:
-            return False
+            return None
             
         api_keyword = config.datagouv.finess_resource_keyword
         # Keyword "extraction" usually gets the main file
         
         csv_url = self.datagouv_connector.find_csv_resource(dataset_info, api_keyword)
         if not csv_url:
-            return False
-            
-        response = self.datagouv_connector.get(csv_url)
-        if not response:
-            return False
+            return None
+        
+        resource = next((r for r in dataset_info.get('resources', []) if r.get('url') == csv_url), {})
+        return ResourcePlan(name="finess", year=year, url=csv_url,
+                            local_name="finess.csv", dataset_id=dataset_id,
+                            last_modified=resource.get('last_modified'),
+                            checksum=_resource_checksum(resource))
+
+    def _get_dataset_info(self, dataset_id: str) -> Optional[dict]:
+        """
+        Fetch dataset metadata once per run.
+        
+        Several download tasks (e.g. the two HAS files) need the same dataset
+        metadata; it is memoised in the connector's data cache.
+        """
+        cache_key = f"dataset_info:{dataset_id}"
+        with self._locks_guard:
+            lock = self._dataset_info_locks.setdefault(dataset_id, threading.Lock())
+        # Concurrent resolvers asking for the same dataset wait for one fetch
+        with lock:
+            dataset_info = self.datagouv_connector.get_cached_data(cache_key)
+            if dataset_info is None:
+                dataset_info = self.datagouv_connector.get_dataset_info(dataset_id)
+                if dataset_info is not None:
+                    self.datagouv_connector.cache_data(cache_key, dataset_info, ttl_hours=1)
+        return dataset_info
+
+    def _has_dataset_id(self, year: int) -> Optional[str]:
+        """HAS certification dataset covering `year`, if any."""
+        if 2021 <= year <= 2025:
+            return config.datagouv.has_cert_2021_2025_id
+        # Add logic for older years if needed, e.g. 2014-2020 dataset
+        return None
+
+    def download_has_resource(self, year: int, resource_name: str, local_name: str) -> Optional[DownloadResult]:
+        """
+        Download one HAS Certification file.
+
+        Args:
+            year (int): Target year directory to save the data in.
+            resource_name (str): File name to match in the resource title or URL
+                (e.g. `demarche.csv`).
+            local_name (str): Name of the file in the year folder.
+
+        Returns:
+            Optional[DownloadResult]: Download details, or None if it failed.
+        """
+        plan = self.resolve_has_resource(year, resource_name, local_name)
+        return self.fetch_resource(plan) if plan else None
+
+    def resolve_has_resource(self, year: int, resource_name: str, local_name: str) -> Optional[ResourcePlan]:
+        """
+        Find one HAS Certification resource without downloading it.
+
+        Args:
+            year (int): Target year directory.
+            resource_name (str): File name to match in the resource title or URL.
+            local_name (str): Name of the file in the year folder.
+
+        Returns:
+            Optional[ResourcePlan]: The resource to fetch, or None if not found.
+        """
+        dataset_id = self._has_dataset_id(year)
+        if not dataset_id:
+            logger.warning(f"No HAS dataset configuration for year {year}")
+            return None
             
-        save_path = self.ensure_year_directory(year) / "finess.csv"
-        try:
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            logger.info(f"Saved FINESS data to {save_path}")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save FINESS data: {e}")
-            return False
+        dataset_info = self._get_dataset_info(dataset_id)
+        if not dataset_info:
+            return None
+        
+        target_resource = None
+        for res in dataset_info.get('resources', []):
+            # specific title check or strict filename check if possible (url usually contains filename)
+            # HAS resources seem to be named clearly in title too
+            if resource_name in res.get('title', '').lower() or resource_name in res.get('url', '').lower():
+                target_resource = res
+                break
+        
+        if not target_resource:
+            logger.warning(f"Could not find resource matching {resource_name}")
+            return None
+        
+        return ResourcePlan(name=local_name.rsplit('.', 1)[0], year=year, url=target_resource.get('url'),
+                            local_name=local_name, dataset_id=dataset_id,
+                            last_modified=target_resource.get('last_modified'),
+                            checksum=_resource_checksum(target_resource))
 
-    def download_has_certification(self, year: int) -> bool:
+    def download_has_certification(self, year: int) -> List[DownloadResult]:
         """
         Download HAS Certification data.
 
         Downloads certification decisions (`demarche.csv`) and establishment geolocation
         links (`etablissement-geo.csv`) to ensuring mappability to FINESS numbers.
-        Currently targets the 2021-2025 certification repository.
+        Currently targets the 2021-2025 certification repository. Both files are
+        downloaded concurrently.
 
         Args:
             year (int): Target year directory to save the data in.
 
         Returns:
-            bool: True if at least one resource was successfully downloaded.
+            List[DownloadResult]: One entry per successfully downloaded resource
+            (empty if nothing could be downloaded).
         """
         logger.info(f"Downloading HAS Certification data for {year}")
         
-        dataset_id = None
-        if 2021 <= year <= 2025:
-            dataset_id = config.datagouv.has_cert_2021_2025_id
-        # Add logic for older years if needed, e.g. 2014-2020 dataset
+        tasks = [
+            (f"has_{local_name}", year, lambda y, r=resource_name, l=local_name: self.download_has_resource(y, r, l))
+            for resource_name, local_name in HAS_CERTIFICATION_FILES.items()
+        ]
+        results = []
+        for task in self._run_tasks(tasks):
+            results.extend(task.downloads)
+        return results
+
+    def _year_tasks(self, year: int) -> List[tuple]:
+        """
+        Independent download tasks for one year, as (name, year, callable).
         
-        if not dataset_id:
-            logger.warning(f"No HAS dataset configuration for year {year}")
-            return False
-            
-        dataset_info = self.datagouv_connector.get_dataset_info(dataset_id)
-        if not dataset_info:
-            return False
-            
-        # We need both the decisions (demarche.csv) and the establishment link (etablissement-geo.csv)
-        resources = dataset_info.get('resources', [])
+        HAS files are separate tasks so they download in parallel with the rest.
+        """
+        tasks = [
+            ("health_metrics", year, self.download_health_metrics),
+            ("finess", year, self.download_finess_data),
+        ]
+        for resource_name, local_name in HAS_CERTIFICATION_FILES.items():
+            name = local_name.rsplit('.', 1)[0]
+            tasks.append((name, year, lambda y, r=resource_name, l=local_name: self.download_has_resource(y, r, l)))
+        return tasks
+
+    def _run_task(self, name: str, year: int, func: Callable) -> TaskResult:
+        """
+        Run one download task, capturing its status, timing and downloads.
+        """
+        start = time.monotonic()
+        try:
+            outcome = func(year)
+        except Exception as e:
+            logger.error(f"Task {name} for {year} failed: {e}")
+            return TaskResult(name=name, year=year, status=TASK_FAILED,
+                              elapsed_seconds=time.monotonic() - start, error=str(e))
         
-        files_to_download = {
-            'demarche.csv': 'has_demarche.csv',
-            'etablissement-geo.csv': 'has_etab_geo.csv'
-        }
+        if isinstance(outcome, DownloadResult):
+            downloads = [outcome]
+        else:
+            downloads = list(outcome or [])
         
-        success_count = 0
+        return TaskResult(
+            name=name,
+            year=year,
+            status=TASK_SUCCESS if downloads else TASK_FAILED,
+            elapsed_seconds=time.monotonic() - start,
+            downloads=downloads,
+            error=None if downloads else "nothing downloaded"
+        )
+
+    def _run_tasks(self, tasks: List[tuple]) -> List[TaskResult]:
+        """
+        Run download tasks in a worker pool bounded by `max_workers`.
         
-        for resource_name, local_name in files_to_download.items():
-            target_resource = None
-            for res in resources:
-                # specific title check or strict filename check if possible (url usually contains filename)
-                # HAS resources seem to be named clearly in title too
-                if resource_name in res.get('title', '').lower() or resource_name in res.get('url', '').lower():
-                    target_resource = res
-                    break
+        Args:
+            tasks: (name, year, callable) tuples; callables take the year
             
-            if target_resource:
-                url = target_resource.get('url')
-                response = self.datagouv_connector.get(url)
-                if response:
-                    save_path = self.ensure_year_directory(year) / local_name
-                    try:
-                        with open(save_path, 'wb') as f:
-                            f.write(response.content)
-                        logger.info(f"Saved {local_name} to {save_path}")
-                        success_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to save {local_name}: {e}")
-            else:
-                 logger.warning(f"Could not find resource matching {resource_name}")
-
-        return success_count > 0
+        Returns:
+            TaskResult per task, in submission order
+        """
+        if not tasks:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+            futures = [pool.submit(self._run_task, name, year, func) for name, year, func in tasks]
+            return [future.result() for future in futures]
 
-    def run_year_ingestion(self, year: int):
+    def run_year_ingestion(self, year: int) -> IngestionResult:
         """
         Run full ingestion for a specific year.
         
+        Health metrics, FINESS and both HAS files are downloaded concurrently
+        in a pool of `PipelineConfig.max_workers` threads.
+        
         Args:
             year: Year to process.
+            
+        Returns:
+            IngestionResult with per-task status, timing and download details.
         """
         logger.info(f"Starting ingestion for year {year}")
+        start = time.monotonic()
         
-        self.download_health_metrics(year)
-        self.download_finess_data(year)
-        self.download_has_certification(year)
+        tasks = self._run_tasks(self._year_tasks(year))
+        result = IngestionResult(years=[year], tasks=tasks, elapsed_seconds=time.monotonic() - start)
+        result.log_summary()
         
         logger.info(f"Completed ingestion for {year}")
+        return result
+
+    def refresh_catalog(self, years: List[int]) -> Dict[str, int]:
+        """
+        Refresh the catalog index entries needed to ingest `years`.
+        
+        Re-fetches the FINESS and HAS datasets and re-runs the IQSS searches
+        in one pass, so that later runs (including offline ones) resolve
+        every resource from the index.
+        
+        Args:
+            years: Years whose resources should be resolvable
+            
+        Returns:
+            Dict with the number of refreshed and failed lookups
+        """
+        dataset_ids = [self.datagouv_connector.finess_dataset_id]
+        for year in years:
+            has_id = self._has_dataset_id(year)
+            if has_id and has_id not in dataset_ids:
+                dataset_ids.append(has_id)
+        queries = [config.datagouv.iqss_search_pattern.format(year) for year in years]
+        # Search results carry their resources, so IQSS datasets are indexed too
+        return self.datagouv_connector.refresh_catalog(dataset_ids, queries)
+
+    def _resolvers(self, year: int) -> List[tuple]:
+        """Resource lookups for one year, as (name, callable) pairs mirroring `_year_tasks`."""
+        resolvers = [
+            ("health_metrics", self.resolve_health_metrics),
+            ("finess", self.resolve_finess),
+        ]
+        for resource_name, local_name in HAS_CERTIFICATION_FILES.items():
+            name = local_name.rsplit('.', 1)[0]
+            resolvers.append((name, lambda y, r=resource_name, l=local_name: self.resolve_has_resource(y, r, l)))
+        return resolvers
+
+    def _resolve(self, name: str, year: int, func: Callable) -> Optional[ResourcePlan]:
+        """Run one resolver, logging instead of raising on failure."""
+        try:
+            return func(year)
+        except Exception as e:
+            logger.error(f"Resolving {name} for {year} failed: {e}")
+            return None
+
+    def plan_ingestion(self, years: List[int]) -> IngestionPlan:
+        """
+        Resolve every resource needed for `years` and group them by URL.
+        
+        Year-independent resources (the FINESS snapshot, the HAS 2021-2025
+        files) resolve to the same URL for every year and end up in a single
+        group, so they are downloaded once. Lookups run concurrently; dataset
+        metadata is fetched once per dataset.
+        
+        Args:
+            years: Years to ingest
+            
+        Returns:
+            IngestionPlan with one entry per unique URL
+        """
+        lookups = [(name, year, func) for year in years for name, func in self._resolvers(year)]
+        plan = IngestionPlan(years=list(years))
+        if not lookups:
+            return plan
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(lookups))) as pool:
+            futures = [pool.submit(self._resolve, name, year, func) for name, year, func in lookups]
+            resolved = [future.result() for future in futures]
+        
+        for (name, year, _), resource in zip(lookups, resolved):
+            if resource is None:
+                plan.unresolved.append((name, year))
+            else:
+                plan.fetches.setdefault(resource.url, []).append(resource)
+        return plan
 
-    def run_multi_year_ingestion(self, start_year: int, end_year: int):
+    def _place(self, download: DownloadResult, first: ResourcePlan, resource: ResourcePlan) -> DownloadResult:
+        """
+        Link an already downloaded blob into another year folder.
+        
+        The fetch time and upstream metadata of the original download are
+        copied, so the scheduler treats both year files the same way.
+        """
+        entry = self.raw_store.load_manifest(first.year).get(first.local_name, {})
+        source = {k: entry[k] for k in ('fetched_at', 'source_last_modified', 'source_checksum', 'source_encoding',
+                                        'http_etag', 'http_last_modified')
+                  if k in entry}
+        path = self.raw_store.place(download.sha256, resource.year, resource.local_name,
+                                    url=resource.url, source=source)
+        logger.info(f"Linked {resource.local_name} for {resource.year} to the {first.year} download")
+        return DownloadResult(
+            url=resource.url,
+            path=path,
+            bytes_written=download.bytes_written,
+            elapsed_seconds=0.0,
+            bytes_transferred=0,
+            sha256=download.sha256
+        )
+
+    def _fetch_group(self, group: List[ResourcePlan]) -> List[TaskResult]:
+        """
+        Download a shared resource once and fan it out to every year in `group`.
+        """
+        first = group[0]
+        fetched = self._run_task(first.name, first.year, lambda y: self.fetch_resource(first))
+        results = [fetched]
+        for resource in group[1:]:
+            if fetched.status != TASK_SUCCESS:
+                results.append(TaskResult(name=resource.name, year=resource.year, status=TASK_FAILED,
+                                          error=f"shared download for {first.year} failed"))
+                continue
+            results.append(self._run_task(
+                resource.name, resource.year,
+                lambda y, r=resource: self._place(fetched.downloads[0], first, r)
+            ))
+        return results
+
+    def run_plan(self, plan: IngestionPlan) -> List[TaskResult]:
+        """
+        Execute an ingestion plan.
+        
+        Unique downloads run concurrently in a pool bounded by `max_workers`;
+        each is then linked into the other year folders that need it.
+        
+        Args:
+            plan: Plan returned by `plan_ingestion`
+            
+        Returns:
+            TaskResult per (year, resource), ordered by year
+        """
+        tasks = [
+            TaskResult(name=name, year=year, status=TASK_FAILED, error="resource not found")
+            for name, year in plan.unresolved
+        ]
+        groups = list(plan.fetches.values())
+        if groups:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(groups))) as pool:
+                for group_results in pool.map(self._fetch_group, groups):
+                    tasks.extend(group_results)
+        return sorted(tasks, key=lambda t: t.year)
+
+    def run_multi_year_ingestion(self, start_year: int, end_year: int) -> IngestionResult:
         """
         Run ingestion for a range of years.
         
+        Resources shared between years are downloaded once and linked into
+        each year folder; everything else is fetched concurrently across years.
+        
         Args:
             start_year: Start year (inclusive)
             end_year: End year (inclusive)
+            
+        Returns:
+            IngestionResult covering every year in the range.
         """
         logger.info(f"Starting multi-year ingestion from {start_year} to {end_year}")
-        for year in range(start_year, end_year + 1):
-            self.run_year_ingestion(year)
+        years = list(range(start_year, end_year + 1))
+        start = time.monotonic()
+        
+        plan = self.plan_ingestion(years)
+        logger.info(f"Planned {plan.placements} files from {len(plan.fetches)} unique downloads")
+        
+        result = IngestionResult(years=years, tasks=self.run_plan(plan), elapsed_seconds=time.monotonic() - start)
+        result.log_summary()
+        
+        logger.info(f"Completed ingestion for {start_year}-{end_year}")
+        return result
+
+    def collect_garbage(self, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Remove raw blobs no longer referenced by any year manifest.
+        
+        Files present in year folders but not yet tracked (e.g. written before
+        the raw store existed) are adopted first, so they are deduplicated
+        instead of being treated as garbage.
+        
+        Args:
+            dry_run: Only report what would be removed
+            
+        Returns:
+            Dict with the number of blobs and bytes removed
+        """
+        adopted = self.raw_store.adopt_existing(fallback_encoding=config.datagouv.csv_encoding)
+        if adopted:
+            logger.info(f"Adopted {adopted} untracked raw files into the store")
+        removed = self.raw_store.gc(dry_run=dry_run)
+        logger.info(f"Raw store GC: {removed['blobs']} blobs, {removed['bytes']} bytes {'removable' if dry_run else 'removed'}")
+        return removed
@@ -0,0 +1,280 @@
+"""
+Pluggable CSV readers and writers.
+
+The `pandas` backend is pandas' own parser and writer. The `arrow` backend
+parses with pyarrow's multi-threaded CSV reader and builds each output line
+with Arrow compute kernels. Both backends produce the same DataFrames and the
+same bytes:
+
+- Both readers treat the tokens of `NA_VALUES` as missing values. The Arrow
+  reader loads every field as text, then types columns the way pandas
+  infers them: int64, float64 (ints with gaps become floats), bool, or text.
+- Files with rows that have fewer fields than the header are read with pandas.
+  Pandas pads those rows with missing values, while Arrow can only drop them.
+- The Arrow writer formats text and integer columns itself. Other columns are
+  formatted by pandas, one column at a time. Fields are quoted only when they
+  contain the separator, a quote or a line break, as `csv.QUOTE_MINIMAL` does.
+
+Select a backend with `PipelineConfig.csv_backend` (`CSV_BACKEND`).
+"""
+
+import csv
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+# Field values read as missing by both backends (pandas' default list since 2.0)
+NA_VALUES = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+])
+
+# Literal field values pandas parses as booleans
+_TRUE_VALUES = {'True', 'TRUE', 'true'}
+_FALSE_VALUES = {'False', 'FALSE', 'false'}
+
+
+class PandasCSVBackend:
+    """CSV IO with pandas' parser and writer (reference behaviour)."""
+
+    name = 'pandas'
+
+    def read_csv(self, path: PathLike, sep: str = ',', header: Optional[int] = 0,
+                 names: Optional[List[str]] = None, dtype=None,
+                 usecols: Optional[List[str]] = None, on_bad_lines: str = 'error',
+                 encoding: str = 'utf-8') -> pd.DataFrame:
+        """
+        Read a CSV file.
+
+        Args:
+            path: File to read
+            sep: Field separator
+            header: Row holding the header; with `names`, rows up to and
+                including it are skipped
+            names: Column names to assign
+            dtype: `str` for all columns, or a mapping of column to `str`
+            usecols: Columns to load
+            on_bad_lines: 'error', 'warn' or 'skip' for rows with too many fields
+            encoding: File encoding
+
+        Returns:
+            Parsed DataFrame
+        """
+        return pd.read_csv(path, sep=sep, header=header, names=names, dtype=dtype,
+                           usecols=usecols, on_bad_lines=on_bad_lines, encoding=encoding,
+                           na_values=NA_VALUES, keep_default_na=False, low_memory=False)
+
+    def write_csv(self, df: pd.DataFrame, path: PathLike, sep: str = ',', append: bool = False) -> None:
+        """
+        Write a DataFrame as UTF-8 CSV, without the index.
+
+        Args:
+            df: Data to write
+            path: Destination file
+            sep: Field separator
+            append: Add the rows to the end of `path`, without a header
+        """
+        df.to_csv(path, sep=sep, index=False, encoding='utf-8',
+                  mode='a' if append else 'w', header=not append)
+
+
+class ArrowCSVBackend(PandasCSVBackend):
+    """CSV IO with pyarrow's multi-threaded parser, output identical to pandas."""
+
+    name = 'arrow'
+
+    def read_csv(self, path: PathLike, sep: str = ',', header: Optional[int] = 0,
+                 names: Optional[List[str]] = None, dtype=None,
+                 usecols: Optional[List[str]] = None, on_bad_lines: str = 'error',
+                 encoding: str = 'utf-8') -> pd.DataFrame:
+        """Read a CSV file (same arguments as `PandasCSVBackend.read_csv`)."""
+        short_rows = []
+
+        def handle_invalid(row):
+            if row.actual_columns < row.expected_columns:
+                short_rows.append(row)
+                return 'error'  # Abort: pandas pads short rows, Arrow cannot
+            if on_bad_lines == 'error':
+                return 'error'
+            if on_bad_lines == 'warn':
+                logger.warning(f"Skipping line: expected {row.expected_columns} fields, "
+                               f"saw {row.actual_columns}")
+            return 'skip'
+
+        if names is not None:
+            columns = list(names)
+            read_options = pacsv.ReadOptions(column_names=columns, encoding=encoding,
+                                              skip_rows=0 if header is None else header + 1)
+        else:
+            columns = _header(path, sep, header or 0, encoding)
+            read_options = pacsv.ReadOptions(skip_rows=header or 0, encoding=encoding)
+        convert_options = pacsv.ConvertOptions(
+            # Every field as text; types are inferred afterwards as pandas does
+            column_types={col: pa.string() for col in columns},
+            null_values=sorted(NA_VALUES),
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True,
+            include_columns=[col for col in columns if col in usecols] if usecols is not None else None,
+        )
+        parse_options = pacsv.ParseOptions(delimiter=sep, invalid_row_handler=handle_invalid)
+
+        try:
+            table = pacsv.read_csv(path, read_options=read_options,
+                                   parse_options=parse_options, convert_options=convert_options)
+        except pa.ArrowInvalid:
+            if not short_rows:
+                raise
+            logger.info(f"  {Path(path).name} has rows with missing fields, reading it with pandas")
+            return super().read_csv(path, sep=sep, header=header, names=names, dtype=dtype,
+                                    usecols=usecols, on_bad_lines=on_bad_lines, encoding=encoding)
+
+        text_columns = _text_columns(table.column_names, dtype)
+        return pd.DataFrame({
+            col: _to_pandas(table.column(col), keep_text=col in text_columns)
+            for col in table.column_names
+        })
+
+    def write_csv(self, df: pd.DataFrame, path: PathLike, sep: str = ',', append: bool = False) -> None:
+        """Write a DataFrame as UTF-8 CSV (same arguments as `PandasCSVBackend.write_csv`)."""
+        header = sep.join(_quote_field(str(col), sep) for col in df.columns)
+        columns = [_format_column(df.iloc[:, i], sep) for i in range(df.shape[1])]
+
+        if len(df.columns) == 1:
+            # The csv module quotes a lone empty field so the row is not blank
+            lines = pc.if_else(pc.equal(columns[0], ''), '""', columns[0])
+        elif columns:
+            lines = pc.binary_join_element_wise(*columns, sep)
+        else:
+            lines = pa.array([''] * len(df), type=pa.string())
+
+        with open(path, 'a' if append else 'w', encoding='utf-8', newline='') as f:
+            if not append:
+                f.write(header + '\n')
+            if len(lines):
+                f.write('\n'.join(lines.to_pylist()))
+                f.write('\n')
+
+
+def _header(path: PathLike, sep: str, skip_rows: int, encoding: str = 'utf-8') -> List[str]:
+    """Column names from the header row of a CSV file."""
+    encoding = 'utf-8-sig' if encoding.replace('-', '').lower() == 'utf8' else encoding
+    with open(path, encoding=encoding, newline='') as f:
+        for _ in range(skip_rows):
+            f.readline()
+        return next(csv.reader(f, delimiter=sep), [])
+
+
+def _text_columns(columns: List[str], dtype) -> set:
+    """Columns the caller asked to keep as text."""
+    if dtype is str:
+        return set(columns)
+    if isinstance(dtype, dict):
+        return {col for col, kind in dtype.items() if kind is str}
+    return set()
+
+
+def _to_pandas(column: pa.ChunkedArray, keep_text: bool) -> pd.Series:
+    """Convert a text column with pandas' type inference."""
+    nulls = column.null_count
+    if keep_text:
+        return column.to_pandas()
+    if nulls == len(column):
+        return pd.Series([float('nan')] * len(column), dtype='float64')
+
+    try:
+        values = pc.cast(column, pa.int64())
+        return values.to_pandas() if nulls == 0 else values.to_pandas().astype('float64')
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        pass
+    try:
+        return pc.cast(column, pa.float64()).to_pandas()
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        pass
+
+    distinct = set(pc.unique(column.drop_null()).to_pylist())
+    if distinct <= _TRUE_VALUES | _FALSE_VALUES:
+        booleans = pc.is_in(column, value_set=pa.array(sorted(_TRUE_VALUES)))
+        series = booleans.to_pandas()
+        if nulls:
+            series = series.astype(object).where(column.is_valid().to_pandas(), float('nan'))
+        return series
+    return column.to_pandas()
+
+
+def _quote_field(value: str, sep: str) -> str:
+    """Quote a single field as csv.QUOTE_MINIMAL does."""
+    if sep in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _format_column(series: pd.Series, sep: str) -> pa.Array:
+    """Render a column as CSV fields (missing values become empty fields)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+
+    if pd.api.types.is_string_dtype(series.dtype) and series.dtype != object:
+        text = pa.array(series, type=pa.string(), from_pandas=True)
+    elif pd.api.types.is_integer_dtype(series.dtype):
+        text = pc.cast(pa.array(series, from_pandas=True), pa.string())
+    elif series.dtype == object:
+        text = pa.array([None if _is_missing(v) else str(v) for v in series], type=pa.string())
+    else:
+        # Floats, booleans and dates: pandas renders the values (never multi-line)
+        rendered = series.to_frame().to_csv(index=False, header=False, sep=sep, lineterminator='\n')
+        fields = pa.array(rendered.split('\n')[:-1], type=pa.string())
+        # A lone empty field is written as '""'
+        return pc.if_else(pc.equal(fields, '""'), '', fields)
+
+    text = pc.fill_null(text, '')
+    needs_quotes = pc.match_substring_regex(text, f'[{_regex_class(sep)}"\n\r]')
+    quoted = pc.binary_join_element_wise('"', pc.replace_substring(text, '"', '""'), '"', '')
+    return pc.if_else(needs_quotes, quoted, text)
+
+
+def _is_missing(value) -> bool:
+    """Missing scalar as pandas writes it (empty field)."""
+    return value is None or (isinstance(value, float) and value != value) or value is pd.NA or value is pd.NaT
+
+
+def _regex_class(sep: str) -> str:
+    """Escape a separator for use inside a regex character class."""
+    return '\\' + sep if sep in '\\]^-[' else sep
+
+
+_BACKENDS: Dict[str, PandasCSVBackend] = {
+    PandasCSVBackend.name: PandasCSVBackend(),
+    ArrowCSVBackend.name: ArrowCSVBackend(),
+}
+
+
+def get_csv_backend(name: Optional[str] = None) -> PandasCSVBackend:
+    """
+    Look up a CSV backend by name.
+
+    Args:
+        name: 'pandas' or 'arrow' (default: PipelineConfig.csv_backend)
+
+    Returns:
+        CSV backend instance
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if name is None:
+        name = config.pipeline.csv_backend
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown CSV backend '{name}' (choose from {', '.join(sorted(_BACKENDS))})")
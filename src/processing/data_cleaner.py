@@ -1,22 +1,210 @@
 """
 Data Cleaner: Raw → Bronze Layer
 
-Handles basic data cleaning operations:
-- Load raw data files
-- Handle encoding issues
+Runs the same cleaning for every source declared in source_specs.py:
+- Load raw data files (typed reads, explicit encoding and separator)
 - Standardize column names
+- Convert columns to their declared types
 - Remove duplicates
-- Basic data type conversions
-- Save cleaned data to bronze layer
+- Save cleaned data to bronze layer (Parquet, optional CSV copy)
+
+Sources are independent (separate input and output files), so `clean_year`
+cleans them in parallel worker processes, and skips those whose raw file,
+bronze output and cleaning code are unchanged since the last run
+(see src/storage/build_manifest.py).
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+from src.config import config
+from src.processing import csv_backend as csv_backend_module, excel_reader as excel_reader_module, source_specs, table_io
+from src.processing.csv_backend import NA_VALUES, get_csv_backend
+from src.processing.excel_reader import ExcelReader
+from src.processing.source_specs import (
+    ALL_COLUMNS, FINESS_COLUMNS, HEADERS_ASCII, HEADERS_LOWER, SOURCE_SPECS, SourceSpec
+)
+from src.processing.table_io import apply_dtypes, write_table
+from src.storage.build_manifest import BuildManifest, code_version
+from src.storage.raw_store import RawStore
+from src.storage.transcode import normalize_text_file
 
 logger = logging.getLogger(__name__)
 
+# Rows per chunk when FINESS is cleaned in streaming mode
+DEFAULT_CHUNKSIZE = 100_000
+
+# Numeric prefix of IQSS categorical values ("1- Oui" -> "Oui")
+CATEGORY_PREFIX = r'^\d+\s*-\s*'
+
+# Text values of `boolean` columns
+BOOLEAN_VALUES = {'true': True, 'false': False}
+
+
+@dataclass
+class CleaningResult:
+    """Outcome of cleaning one source (small enough to return from a worker process)."""
+    source: str
+    records: Optional[int] = None
+    elapsed_seconds: float = 0.0
+    output_path: Optional[Path] = None
+    skipped: bool = False  # Up to date, not cleaned again
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the bronze table was written."""
+        return self.records is not None
+
+
+def strip_category_prefix(values: pd.Series, as_category: bool = False) -> pd.Series:
+    """
+    Remove numeric prefixes such as "1- " from a text column, keeping nulls.
+    
+    The column is factorized once and the regex only runs over its distinct
+    values; the result is rebuilt from the integer codes.
+    
+    Args:
+        values: Column to clean (text, or mixed values converted with `str()`)
+        as_category: Return a `category` column instead of text
+        
+    Returns:
+        Cleaned `string` (or `category`) column, nulls kept as missing
+    """
+    codes, uniques = pd.factorize(values)
+    if len(uniques) == 0:
+        return values.astype('category' if as_category else 'string')
+    
+    cleaned = pd.Index(uniques.astype(str)).str.replace(CATEGORY_PREFIX, '', regex=True)
+    # Prefixed and unprefixed spellings of a value become one category
+    cleaned_codes, categories = pd.factorize(cleaned)
+    codes = np.where(codes >= 0, cleaned_codes[codes], -1)
+    result = pd.Series(pd.Categorical.from_codes(codes, categories=categories),
+                       index=values.index, name=values.name)
+    # 'string' keeps nulls missing ('str' writes them as 'nan' before pandas 3)
+    return result if as_category else result.astype('string')
+
+
+def normalize_headers(columns: pd.Index, style: str) -> List[str]:
+    """
+    Normalize column names.
+    
+    Args:
+        columns: Column names as read
+        style: HEADERS_LOWER (lowercase, quotes removed) or
+            HEADERS_ASCII (also accents and punctuation removed, spaces as
+            underscores); any other style keeps the names
+        
+    Returns:
+        Normalized column names
+    """
+    columns = pd.Index(columns).astype(str)
+    if style == HEADERS_LOWER:
+        return [
+            c.lower()
+            .replace('"', '')     # Remove quotes
+            .strip()              # Remove whitespace
+            for c in columns
+        ]
+    if style == HEADERS_ASCII:
+        return list(
+            columns
+            .str.lower()
+            .str.normalize('NFKD')
+            .str.encode('ascii', errors='ignore').str.decode('utf-8')
+            .str.replace(r'[^\w\s]', '', regex=True)
+            .str.replace(r'\s+', '_', regex=True)
+            .str.strip()
+        )
+    return list(columns)
+
+
+def column_dtype(spec: SourceSpec, column: str) -> Optional[str]:
+    """Declared dtype of a column: explicit, then name pattern, then ALL_COLUMNS."""
+    if column in spec.dtypes:
+        return spec.dtypes[column]
+    for pattern, dtype in spec.dtype_patterns:
+        if re.search(pattern, column):
+            return dtype
+    return spec.dtypes.get(ALL_COLUMNS)
+
+
+def convert_column(values: pd.Series, dtype: str, date_format: Optional[str] = None) -> pd.Series:
+    """
+    Convert a column to its declared type, without type inference.
+    
+    Args:
+        values: Column as read (text for CSV sources)
+        dtype: Declared dtype
+        date_format: strptime format of a date column
+        
+    Returns:
+        Converted column (unparseable numbers and dates become missing)
+    """
+    if date_format:
+        return pd.to_datetime(values, format=date_format, errors='coerce').astype(dtype)
+    if dtype in ('Int64', 'float64'):
+        return pd.to_numeric(values, errors='coerce').astype(dtype)
+    if dtype == 'boolean' and not pd.api.types.is_bool_dtype(values.dtype):
+        return values.str.lower().map(BOOLEAN_VALUES).astype('boolean')
+    return values.astype(dtype)
+
+
+class RowHashSet:
+    """
+    Set of 64-bit row hashes, stored as sorted uint64 arrays (8 bytes a hash).
+
+    Added hashes form a sorted run; runs of similar size are merged, so a
+    set of n hashes has O(log n) runs, membership is a binary search in each
+    run, and every hash is re-sorted O(log n) times in total.
+    """
+
+    def __init__(self):
+        self.runs: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self.runs)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Boolean mask of the hashes already in the set."""
+        # Sorted needles make the binary searches walk each run in order
+        order = np.argsort(hashes, kind='stable')
+        needles = hashes[order]
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.minimum(np.searchsorted(run, needles), len(run) - 1)
+            found[order] |= run[positions] == needles
+        return found
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashes that are distinct and not in the set yet."""
+        if len(hashes) == 0:
+            return
+        run = np.sort(hashes)
+        while self.runs and len(self.runs[-1]) <= len(run):
+            run = np.sort(np.concatenate([self.runs.pop(), run]), kind='stable')  # Merges the two sorted runs
+        self.runs.append(run)
+
+
+def cleaning_code_version() -> str:
+    """Version of the cleaning code (this module, the source specs and the IO modules)."""
+    return code_version(sys.modules[__name__], source_specs, table_io, csv_backend_module, excel_reader_module)
+
+
+def _clean_source_worker(settings: dict, source: str, year: int) -> CleaningResult:
+    """Process pool entry point: clean one source with a fresh DataCleaner."""
+    return DataCleaner(**settings).clean_source(source, year)
+
 
 class DataCleaner:
     """
@@ -31,91 +219,98 @@ class DataCleaner:
     Bronze layer provides cleaned, standardized data ready for transformation.
     """
     
-    def __init__(self, raw_base_path: str, bronze_base_path: str):
+    def __init__(self, raw_base_path: str, bronze_base_path: str,
+                 finess_chunksize: Optional[int] = None, export_csv: Optional[bool] = None,
+                 csv_backend: Optional[str] = None, max_workers: Optional[int] = None,
+                 incremental: Optional[bool] = None):
         """
         Initialize DataCleaner.
         
         Args:
             raw_base_path: Path to raw data directory
             bronze_base_path: Path to bronze data directory
+            finess_chunksize: If set, `clean_year` cleans FINESS in streaming
+                mode with chunks of this many rows (see `clean_finess_chunked`)
+            export_csv: Also write each bronze table as CSV
+                (default: PipelineConfig.export_csv)
+            csv_backend: CSV reader/writer, 'pandas' or 'arrow'
+                (default: PipelineConfig.csv_backend)
+            max_workers: Worker processes used by `clean_year`
+                (default: PipelineConfig.max_workers; 1 = no pool)
+            incremental: Skip sources that are up to date in `clean_year`
+                (default: PipelineConfig.incremental_builds)
         """
         self.raw_base_path = Path(raw_base_path)
         self.bronze_base_path = Path(bronze_base_path)
+        self.finess_chunksize = finess_chunksize
+        self.export_csv = config.pipeline.export_csv if export_csv is None else export_csv
+        self.csv_backend = get_csv_backend(csv_backend).name
+        self.max_workers = max(1, max_workers or config.pipeline.max_workers)
+        self.incremental = config.pipeline.incremental_builds if incremental is None else incremental
+        self.excel_reader = ExcelReader.from_config()
     
-    def clean_finess(self, year: int) -> Optional[pd.DataFrame]:
+    def _normalize_untracked(self, file_path: Path, year: int):
+        """
+        Transcode a raw text file to UTF-8 if ingestion did not store it.
+
+        Files listed in the raw manifest were normalized when downloaded;
+        files of a raw tree written before that (or copied in by hand) may
+        still be in the source encoding.
+        """
+        if file_path.name not in RawStore(self.raw_base_path).load_manifest(year):
+            normalize_text_file(file_path, fallback=config.datagouv.csv_encoding)
+
+    def clean_from_spec(self, spec: SourceSpec, year: int) -> Optional[pd.DataFrame]:
         """
-        Clean FINESS establishment data.
+        Clean a raw source as declared by its spec.
         
         Operations:
-        - Load with correct encoding and separator
-        - Assign proper column names based on official FINESS structure
-        - Standardize column names (lowercase, strip)
-        - Remove duplicates
-        - Handle malformed lines
+        - Load the file: CSV as text with the spec's encoding, separator,
+          header row or column names (malformed lines handled per spec);
+          Excel through the cached fast reader
+        - Normalize column names
+        - Remove numeric prefixes like "1- " from text values (if declared)
+        - Convert each column to its declared type (explicit date formats)
+        - Remove exact duplicates, report duplicate keys
+        - Save to bronze (Parquet with declared types, optional CSV copy)
         
         Args:
+            spec: Source spec
             year: Year to process
             
         Returns:
             Cleaned DataFrame or None if file not found
         """
-        file_path = self.raw_base_path / str(year) / "finess.csv"
+        file_path = self.raw_base_path / str(year) / spec.file_name
         if not file_path.exists():
-            logger.error(f"FINESS file not found: {file_path}")
+            logger.error(f"{spec.label} file not found: {file_path}")
             return None
+        self._normalize_untracked(file_path, year)
         
         try:
-            logger.info(f"Cleaning FINESS data for year {year}...")
-            
-            # Define official FINESS column names based on data.gouv.fr structure
-            # Source: https://www.data.gouv.fr/datasets/finess-extraction-des-entites-juridiques
-            finess_columns = [
-                'structureet',           # 0: Structure type
-                'finess_et',             # 1: FINESS Establishment ID
-                'finess_ej',             # 2: FINESS Legal Entity ID
-                'rs',                    # 3: Short name (Raison Sociale)
-                'rslongue',              # 4: Long name (Raison Sociale Longue)
-                'complrs',               # 5: Complement RS
-                'compldistrib',          # 6: Complement distribution
-                'numvoie',               # 7: Street number
-                'typvoie',               # 8: Street type (rue, avenue, etc.)
-                'voie',                  # 9: Street name
-                'compvoie',              # 10: Street complement
-                'lieuditbp',             # 11: Place/BP
-                'commune',               # 12: Municipality code
-                'departement',           # 13: Department code
-                'libdepartement',        # 14: Department name
-                'ligneacheminement',     # 15: Postal routing line (CP + ville)
-                'telephone',             # 16: Phone number
-                'telecopie',             # 17: Fax number
-                'categetab',             # 18: Establishment category code
-                'libcategetab',          # 19: Establishment category name
-                'categagretab',          # 20: Aggregated category code
-                'libcategagretab',       # 21: Aggregated category name
-                'siret',                 # 22: SIRET number
-                'codeape',               # 23: APE code
-                'codemft',               # 24: MFT code
-                'libmft',                # 25: MFT label
-                'codesph',               # 26: SPH code
-                'libsph',                # 27: SPH label (category detail)
-                'dateouv',               # 28: Opening date
-                'dateautor',             # 29: Authorization date
-                'datemaj',               # 30: Last update date
-                'numuai'                 # 31: UAI number
-            ]
+            logger.info(f"Cleaning {spec.label} data for year {year}...")
+            
+            if spec.reader == 'excel':
+                df = self.excel_reader.read(file_path)
+            else:
+                df = get_csv_backend(self.csv_backend).read_csv(
+                    file_path,
+                    sep=spec.sep,
+                    header=spec.header,
+                    names=list(spec.names) if spec.names else None,
+                    dtype=str,  # Typed below from the spec, never inferred
+                    on_bad_lines=spec.on_bad_lines,
+                    encoding=spec.encoding
+                )
+            df.columns = normalize_headers(df.columns, spec.headers)
             
-            # Load with proper encoding and handling of bad lines
-            df = pd.read_csv(
-                file_path, 
-                sep=';', 
-                encoding='utf-8', 
-                header=1, 
-                low_memory=False, 
-                on_bad_lines='warn',
-                names=finess_columns  # Assign proper column names
-            )
-            
-            # Column names are already assigned and standardized
+            for col in df.columns:
+                dtype = column_dtype(spec, col)
+                text = pd.api.types.is_object_dtype(df[col].dtype) or pd.api.types.is_string_dtype(df[col].dtype)
+                if spec.strip_prefixes and text:
+                    df[col] = strip_category_prefix(df[col], as_category=dtype == 'category')
+                if dtype is not None:
+                    df[col] = convert_column(df[col], dtype, spec.date_formats.get(col))
             
             # Remove exact duplicates
             initial_count = len(df)
@@ -125,244 +320,224 @@ class DataCleaner:
             if duplicates_removed > 0:
                 logger.info(f"  Removed {duplicates_removed} duplicate rows")
             
-            # Save to bronze
-            bronze_path = self.bronze_base_path / str(year)
-            bronze_path.mkdir(parents=True, exist_ok=True)
-            output_file = bronze_path / "finess_clean.csv"
+            keys = [col for col in spec.key_columns if col in df.columns]
+            if keys:
+                duplicate_keys = int(df.duplicated(subset=keys).sum())
+                if duplicate_keys > 0:
+                    logger.warning(f"  {duplicate_keys} rows share a key ({', '.join(keys)}) with another row")
             
-            df.to_csv(output_file, index=False, encoding='utf-8')
-            logger.info(f"  ✓ Cleaned FINESS saved to {output_file}")
+            # Save to bronze (Parquet with declared types, optional CSV copy)
+            df = apply_dtypes(df, spec.table)
+            output_file = write_table(df, self.bronze_base_path / str(year), spec.table, export_csv=self.export_csv, csv_backend=self.csv_backend)
+            logger.info(f"  ✓ Cleaned {spec.label} saved to {output_file}")
             logger.info(f"  Records: {len(df)}")
             
             return df
             
         except Exception as e:
-            logger.error(f"  ✗ Error cleaning FINESS data: {e}")
+            logger.error(f"  ✗ Error cleaning {spec.label} data: {e}")
             return None
     
-    def clean_has_demarche(self, year: int) -> Optional[pd.DataFrame]:
+    def clean_finess(self, year: int) -> Optional[pd.DataFrame]:
+        """Clean FINESS establishment data (see SOURCE_SPECS['finess'])."""
+        return self.clean_from_spec(SOURCE_SPECS['finess'], year)
+    
+    def clean_finess_chunked(self, year: int, chunksize: int = DEFAULT_CHUNKSIZE) -> Optional[int]:
         """
-        Clean HAS demarche (certification process) data.
+        Clean FINESS establishment data a chunk at a time.
         
-        Operations:
-        - Load CSV with proper encoding
-        - Clean column names (remove BOM, quotes, normalize)
-        - Remove duplicates
+        Same output as `clean_finess`, but the file is read `chunksize` rows
+        at a time and each chunk is appended to the bronze file as a Parquet
+        row group (and to the CSV side output, if enabled, through the CSV
+        backend); both files are renamed into place once complete. The rows held
+        in memory depend on the chunk size, not on the size of the extraction.
+        Exact duplicates are removed across chunks with a `RowHashSet` of
+        64-bit row hashes, which grows linearly with the number of distinct
+        rows (8 bytes each instead of the row itself).
+        
+        Columns are read as text, the declared type of every FINESS column,
+        so that every chunk is parsed the same way.
         
         Args:
             year: Year to process
+            chunksize: Number of rows per chunk
             
         Returns:
-            Cleaned DataFrame or None if file not found
+            Number of rows written, or None if the file is missing or unparseable
         """
-        file_path = self.raw_base_path / str(year) / "has_demarche.csv"
+        spec = SOURCE_SPECS['finess']
+        file_path = self.raw_base_path / str(year) / spec.file_name
         if not file_path.exists():
-            logger.error(f"HAS demarche file not found: {file_path}")
+            logger.error(f"FINESS file not found: {file_path}")
             return None
+        self._normalize_untracked(file_path, year)
+        
+        bronze_path = self.bronze_base_path / str(year)
+        bronze_path.mkdir(parents=True, exist_ok=True)
+        output_file = bronze_path / f"{spec.table}.parquet"
+        tmp_file = output_file.with_suffix(".parquet.tmp")
+        csv_file = bronze_path / f"{spec.table}.csv"
+        csv_tmp_file = csv_file.with_suffix(".csv.tmp")
+        csv_writer = get_csv_backend(self.csv_backend)
+        # Declared types and pandas metadata, as `write_table` stores them
+        schema = pa.Schema.from_pandas(apply_dtypes(pd.DataFrame(columns=list(spec.names)), spec.table),
+                                       preserve_index=False)
         
         try:
-            logger.info(f"Cleaning HAS demarche data for year {year}...")
-            
-            df = pd.read_csv(file_path, encoding='utf-8')
+            logger.info(f"Cleaning FINESS data for year {year} in chunks of {chunksize} rows...")
+            
+            reader = pd.read_csv(
+                file_path,
+                sep=spec.sep,
+                encoding=spec.encoding,
+                header=spec.header,
+                dtype=str,
+                on_bad_lines=spec.on_bad_lines,
+                names=list(spec.names),
+                na_values=NA_VALUES,  # Same missing values as the CSV backends
+                keep_default_na=False,
+                chunksize=chunksize
+            )
             
-            # Clean column names (remove BOM, quotes, normalize)
-            df.columns = [
-                c.lower()
-                .replace('ï»¿', '')  # Remove BOM
-                .replace('"', '')     # Remove quotes
-                .strip()              # Remove whitespace
-                for c in df.columns
-            ]
-            
-            # Remove duplicates
-            initial_count = len(df)
-            df = df.drop_duplicates()
-            duplicates_removed = initial_count - len(df)
+            seen_hashes = RowHashSet()
+            rows_written = 0
+            duplicates_removed = 0
+            # Each chunk becomes one Parquet row group
+            with reader, pq.ParquetWriter(tmp_file, schema) as writer:
+                for i, chunk in enumerate(reader):
+                    hashes = pd.util.hash_pandas_object(chunk, index=False).to_numpy(dtype=np.uint64)
+                    # Duplicates within the chunk, then rows already written by earlier chunks
+                    keep = np.zeros(len(hashes), dtype=bool)
+                    keep[np.unique(hashes, return_index=True)[1]] = True
+                    keep &= ~seen_hashes.contains(hashes)
+                    seen_hashes.add(hashes[keep])
+                    
+                    duplicates_removed += int((~keep).sum())
+                    chunk = apply_dtypes(chunk[keep], spec.table)
+                    writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                    if self.export_csv:
+                        csv_writer.write_csv(chunk, csv_tmp_file, append=i > 0)
+                    rows_written += len(chunk)
+            
+            os.replace(tmp_file, output_file)
+            if self.export_csv:
+                os.replace(csv_tmp_file, csv_file)
             
             if duplicates_removed > 0:
                 logger.info(f"  Removed {duplicates_removed} duplicate rows")
+            logger.info(f"  ✓ Cleaned FINESS saved to {output_file}")
+            logger.info(f"  Records: {rows_written}")
             
-            # Save to bronze
-            bronze_path = self.bronze_base_path / str(year)
-            bronze_path.mkdir(parents=True, exist_ok=True)
-            output_file = bronze_path / "has_demarche_clean.csv"
-            
-            df.to_csv(output_file, index=False, encoding='utf-8')
-            logger.info(f"  ✓ Cleaned HAS demarche saved to {output_file}")
-            logger.info(f"  Records: {len(df)}")
-            
-            return df
+            return rows_written
             
         except Exception as e:
-            logger.error(f"  ✗ Error cleaning HAS demarche data: {e}")
+            logger.error(f"  ✗ Error cleaning FINESS data: {e}")
+            for partial in (tmp_file, csv_tmp_file):
+                if partial.exists():
+                    partial.unlink()
             return None
     
+    def clean_has_demarche(self, year: int) -> Optional[pd.DataFrame]:
+        """Clean HAS demarche (certification process) data (see SOURCE_SPECS['has_demarche'])."""
+        return self.clean_from_spec(SOURCE_SPECS['has_demarche'], year)
+    
     def clean_has_etab_geo(self, year: int) -> Optional[pd.DataFrame]:
-        """
-        Clean HAS establishment geography data.
-        
-        Operations:
-        - Load CSV with proper encoding
-        - Clean column names (remove BOM, quotes, normalize)
-        - Remove duplicates
-        
-        Args:
-            year: Year to process
-            
-        Returns:
-            Cleaned DataFrame or None if file not found
-        """
-        file_path = self.raw_base_path / str(year) / "has_etab_geo.csv"
-        if not file_path.exists():
-            logger.error(f"HAS etab geo file not found: {file_path}")
-            return None
-        
-        try:
-            logger.info(f"Cleaning HAS establishment geo data for year {year}...")
-            
-            df = pd.read_csv(file_path, encoding='utf-8')
-            
-            # Clean column names (remove BOM, quotes, normalize)
-            df.columns = [
-                c.lower()
-                .replace('ï»¿', '')  # Remove BOM
-                .replace('"', '')     # Remove quotes
-                .strip()              # Remove whitespace
-                for c in df.columns
-            ]
-            
-            # Remove duplicates
-            initial_count = len(df)
-            df = df.drop_duplicates()
-            duplicates_removed = initial_count - len(df)
-            
-            if duplicates_removed > 0:
-                logger.info(f"  Removed {duplicates_removed} duplicate rows")
-            
-            # Save to bronze
-            bronze_path = self.bronze_base_path / str(year)
-            bronze_path.mkdir(parents=True, exist_ok=True)
-            output_file = bronze_path / "has_etab_geo_clean.csv"
-            
-            df.to_csv(output_file, index=False, encoding='utf-8')
-            logger.info(f"  ✓ Cleaned HAS etab geo saved to {output_file}")
-            logger.info(f"  Records: {len(df)}")
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"  ✗ Error cleaning HAS etab geo data: {e}")
-            return None
+        """Clean HAS establishment geography data (see SOURCE_SPECS['has_etab_geo'])."""
+        return self.clean_from_spec(SOURCE_SPECS['has_etab_geo'], year)
     
     def clean_health_metrics(self, year: int) -> Optional[pd.DataFrame]:
+        """Clean health metrics (IQSS) data (see SOURCE_SPECS['health_metrics'])."""
+        return self.clean_from_spec(SOURCE_SPECS['health_metrics'], year)
+    
+    def clean_source(self, source: str, year: int) -> CleaningResult:
         """
-        Clean health metrics (IQSS) data.
+        Clean one source and summarize the result.
         
-        Operations:
-        - Load Excel file
-        - Standardize column names (lowercase, remove accents, underscores)
-        - Clean categorical values (remove numeric prefixes like "1- ")
-        - Remove duplicates
+        With `incremental`, the source is skipped when its raw file, its
+        bronze output(s), the cleaning code and the export options all match
+        the build manifest of the last successful run.
         
         Args:
+            source: Source name (key of SOURCE_SPECS)
             year: Year to process
             
         Returns:
-            Cleaned DataFrame or None if file not found
+            CleaningResult with the row count, timing and bronze file path
+            (row count None on failure)
         """
-        file_path = self.raw_base_path / str(year) / "health_metrics.xlsx"
-        if not file_path.exists():
-            logger.error(f"Health metrics file not found: {file_path}")
-            return None
+        start = time.monotonic()
+        spec = SOURCE_SPECS[source]
+        bronze_path = self.bronze_base_path / str(year)
+        output_path = bronze_path / f"{spec.table}.parquet"
+        inputs = [self.raw_base_path / str(year) / spec.file_name]
+        options = {'export_csv': self.export_csv}
+        manifest = BuildManifest(bronze_path)
+        version = cleaning_code_version()
         
-        try:
-            logger.info(f"Cleaning health metrics data for year {year}...")
-            
-            # Load Excel file
-            df = pd.read_excel(file_path)
-            
-            # Standardize column names
-            df.columns = (
-                df.columns.astype(str)
-                .str.lower()
-                .str.normalize('NFKD')
-                .str.encode('ascii', errors='ignore').str.decode('utf-8')
-                .str.replace(r'[^\w\s]', '', regex=True)
-                .str.replace(r'\s+', '_', regex=True)
-                .str.strip()
-            )
-            
-            # Clean categorical values - remove numeric prefixes
-            # Examples: "1- Oui" -> "Oui", "2- Facultatif" -> "Facultatif"
-            object_cols = df.select_dtypes(include=['object']).columns
-            for col in object_cols:
-                df[col] = df[col].astype(str).str.replace(r'^\d+\s*-\s*', '', regex=True)
-                # Convert 'nan' strings back to None
-                df.loc[df[col] == 'nan', col] = None
-            
-            # Convert numeric columns
-            for col in df.columns:
-                if 'score' in col or 'taux' in col or 'valeur' in col:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            # Convert 'nb' columns to integer (nullable Int64 to handle NaN)
-            for col in df.columns:
-                if col.startswith('nb'):
-                    df[col] = pd.to_numeric(df[col], errors='coerce').astype('Int64')
-            
-            # Remove duplicates
-            initial_count = len(df)
-            df = df.drop_duplicates()
-            duplicates_removed = initial_count - len(df)
-            
-            if duplicates_removed > 0:
-                logger.info(f"  Removed {duplicates_removed} duplicate rows")
-            
-            # Save to bronze
-            bronze_path = self.bronze_base_path / str(year)
-            bronze_path.mkdir(parents=True, exist_ok=True)
-            output_file = bronze_path / "health_metrics_clean.csv"
-            
-            df.to_csv(output_file, index=False, encoding='utf-8')
-            logger.info(f"  ✓ Cleaned health metrics saved to {output_file}")
-            logger.info(f"  Records: {len(df)}")
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"  ✗ Error cleaning health metrics data: {e}")
-            return None
+        if self.incremental and manifest.is_current(source, inputs, version, options):
+            logger.info(f"  ✓ {source} is up to date, skipped")
+            return CleaningResult(source=source, records=manifest.load(source).get('records'),
+                                  elapsed_seconds=time.monotonic() - start,
+                                  output_path=output_path, skipped=True)
+        
+        if source == 'finess' and self.finess_chunksize:
+            output = self.clean_finess_chunked(year, self.finess_chunksize)
+        else:
+            output = self.clean_from_spec(spec, year)
+        
+        result = CleaningResult(source=source, elapsed_seconds=time.monotonic() - start)
+        if output is not None:
+            result.records = output if isinstance(output, int) else len(output)
+            result.output_path = output_path
+            outputs = [output_path]
+            if self.export_csv:
+                outputs.append(output_path.with_suffix(".csv"))
+            manifest.record(source, inputs, outputs, version, options, records=result.records)
+        return result
     
-    def clean_year(self, year: int) -> dict:
+    def clean_year(self, year: int) -> Dict[str, CleaningResult]:
         """
         Clean all data sources for a given year.
         
+        Sources are cleaned in a pool of `max_workers` processes (in this
+        process when `max_workers` is 1). Workers write their bronze tables
+        and only send back a summary, not the DataFrames. With `incremental`,
+        sources that are up to date are skipped (see `clean_source`).
+        
         Args:
             year: Year to process
             
         Returns:
-            Dictionary with cleaned DataFrames
+            CleaningResult per source, in SOURCE_SPECS order
         """
         logger.info("=" * 60)
         logger.info(f"CLEANING DATA FOR YEAR {year} (Raw → Bronze)")
         logger.info("=" * 60)
         
-        results = {}
-        
-        # Clean FINESS
-        df_finess = self.clean_finess(year)
-        results['finess'] = df_finess
-        
-        # Clean HAS data
-        df_has_demarche = self.clean_has_demarche(year)
-        results['has_demarche'] = df_has_demarche
-        
-        df_has_etab = self.clean_has_etab_geo(year)
-        results['has_etab_geo'] = df_has_etab
-        
-        # Clean health metrics
-        df_metrics = self.clean_health_metrics(year)
-        results['health_metrics'] = df_metrics
+        sources = list(SOURCE_SPECS)
+        workers = min(self.max_workers, len(sources))
+        if workers == 1:
+            results = {source: self.clean_source(source, year) for source in sources}
+        else:
+            settings = {
+                'raw_base_path': self.raw_base_path,
+                'bronze_base_path': self.bronze_base_path,
+                'finess_chunksize': self.finess_chunksize,
+                'export_csv': self.export_csv,
+                'csv_backend': self.csv_backend,
+                'max_workers': 1,
+                'incremental': self.incremental,
+            }
+            results = {}
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {source: pool.submit(_clean_source_worker, settings, source, year)
+                           for source in sources}
+                for source, future in futures.items():
+                    try:
+                        results[source] = future.result()
+                    except Exception as e:
+                        logger.error(f"  ✗ Worker cleaning {source} failed: {e}")
+                        results[source] = CleaningResult(source=source)
         
         logger.info("=" * 60)
         logger.info(f"CLEANING COMPLETE FOR YEAR {year}")
@@ -1,15 +1,118 @@
 
 import pandas as pd
 import logging
+import sys
 from pathlib import Path
-from typing import Optional, Dict
-import uuid
-import re
+from typing import Optional, Dict, List
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+from src.config import config
+from src.models import schemas
 from src.models.schemas import Etablissement, Qualification, HealthMetrics
+from src.processing import csv_backend as csv_backend_module, identifiers, joins, keys, table_io
+from src.processing.csv_backend import get_csv_backend
+from src.processing.identifiers import ETABLISSEMENT, HEALTH_METRIC, QUALIFICATION, record_ids
+from src.processing.joins import JOIN_DEDUPE, JOIN_FAIL, JoinFanOutError, JoinStats, link_join
+from src.processing.keys import decode_finess, encode_finess
+from src.processing.source_specs import SOURCE_SPECS
+from src.processing.table_io import read_table, table_path, write_table
+from src.storage import key_registry as key_registry_module
+from src.storage.build_manifest import BuildManifest, code_version
+from src.storage.key_registry import REGISTRY_FILENAME, KeyRegistry
 import dataclasses
+from dataclasses import asdict
+
+# Bronze columns used to build the Etablissement table
+FINESS_USED_COLUMNS = [
+    'structureet', 'finess_et', 'siret', 'rs', 'rslongue', 'numvoie', 'typvoie', 'voie', 'lieuditbp',
+    'ligneacheminement', 'libsph'
+]
+
+# FINESS record type of establishment rows (others: 'geolocalisation')
+STRUCTURE_RECORD = 'structureet'
+
+# FINESS address parts, joined with spaces when present
+ADDRESS_COLUMNS = ['numvoie', 'typvoie', 'voie', 'lieuditbp']
+
+
+def _departement_for_prefix(prefix: int) -> str:
+    """Department of the postal codes starting with a 3-digit prefix."""
+    s_prefix = str(prefix).zfill(3)
+    # DOM-TOM (97x): 3-digit department codes
+    if s_prefix.startswith('97'):
+        return s_prefix
+    # Corsica: 200xx-201xx is Corse-du-Sud, 202xx-206xx is Haute-Corse
+    if s_prefix.startswith('20'):
+        return '2A' if prefix < 202 else '2B'
+    # Standard mainland departments (first 2 digits)
+    return s_prefix[:2]
+
+
+# Department by postal code prefix (code_postal // 100)
+DEPARTEMENT_BY_PREFIX = np.array([_departement_for_prefix(p) for p in range(1000)], dtype=object)
+
+
+def departement_from_postal_code(code_postal: pd.Series) -> pd.Series:
+    """
+    Derive department codes from postal codes with a table lookup.
+
+    Args:
+        code_postal: Postal codes as integers (nullable)
+
+    Returns:
+        Department codes as strings (e.g. "01", "2A", "974"), NA where
+        the postal code is missing or not a 5-digit code
+    """
+    prefix = code_postal.astype('Int64') // 100
+    valid = (prefix.notna() & prefix.between(0, len(DEPARTEMENT_BY_PREFIX) - 1)).to_numpy(dtype=bool)
+    departement = np.full(len(code_postal), None, dtype=object)
+    departement[valid] = DEPARTEMENT_BY_PREFIX[prefix[valid].to_numpy(dtype='int64')]
+    return pd.Series(departement, index=code_postal.index, dtype='string')
+
+
+def join_present(parts: pd.DataFrame, sep: str = ' ') -> pd.Series:
+    """
+    Join the non-null values of each row, column by column.
+
+    Args:
+        parts: Columns to join, in order
+        sep: Separator between values
+
+    Returns:
+        Joined values ('' where every part is null)
+    """
+    joined = pd.Series(pd.NA, index=parts.index, dtype='string')
+    for col in parts.columns:
+        part = parts[col].astype('string')
+        both = joined.notna() & part.notna()
+        joined = joined.where(~both, joined + sep + part).fillna(part)
+    return joined.fillna('')
+
+
+# Bronze tables read by the load_clean_* steps
+BRONZE_TABLES = ['finess_clean', 'has_demarche_clean', 'has_etab_geo_clean', 'health_metrics_clean']
+
+# Silver tables written by process_year
+SILVER_TABLES = ['etablissements', 'qualifications', 'health_metrics']
+
+# Policy for duplicated lookup keys of each link join (see joins.link_join)
+LINK_JOIN_POLICIES = {
+    'has_demarche': JOIN_FAIL,      # HAS sites -> demarche (a repeated code_demarche is a source error)
+    'qualifications': JOIN_DEDUPE,  # Qualifications -> establishment
+    'health_metrics': JOIN_DEDUPE,  # Metrics -> establishment
+}
+
+# Build manifest step of process_year
+PROCESS_STEP = 'process'
+
+
+def processing_code_version() -> str:
+    """Version of the processing code (this module, the schemas, the IDs and keys, the registry and the IO modules)."""
+    return code_version(sys.modules[__name__], schemas, identifiers, joins, keys, key_registry_module, table_io,
+                        csv_backend_module)
 
 class DataProcessor:
     """
@@ -24,18 +127,34 @@ class DataProcessor:
     Produces normalized tables: Etablissement, Qualification, and HealthMetrics.
     """
     
-    def __init__(self, bronze_base_path: str):
+    def __init__(self, bronze_base_path: str, export_csv: Optional[bool] = None,
+                 csv_backend: Optional[str] = None, incremental: Optional[bool] = None,
+                 key_registry: Optional[bool] = None, join_policies: Optional[Dict[str, str]] = None):
         """
         Initialize DataProcessor.
         
         Args:
             bronze_base_path: Path to bronze data directory
+            export_csv: Also write each silver table as CSV
+                (default: PipelineConfig.export_csv)
+            csv_backend: CSV reader/writer, 'pandas' or 'arrow'
+                (default: PipelineConfig.csv_backend)
+            incremental: Skip `process_year` when its inputs, code and
+                outputs are unchanged (default: PipelineConfig.incremental_builds)
+            key_registry: Link records through the FINESS → vel_id registry
+                shared by all years (default: PipelineConfig.key_registry_enabled)
+            join_policies: Policies overriding LINK_JOIN_POLICIES, by join name
         """
         self.bronze_base_path = Path(bronze_base_path)
+        self.export_csv = config.pipeline.export_csv if export_csv is None else export_csv
+        self.csv_backend = get_csv_backend(csv_backend).name
+        self.incremental = config.pipeline.incremental_builds if incremental is None else incremental
+        use_registry = config.pipeline.key_registry_enabled if key_registry is None else key_registry
+        self.registry = KeyRegistry(self.bronze_base_path.parent / "silver" / REGISTRY_FILENAME) if use_registry else None
+        self.join_policies = {**LINK_JOIN_POLICIES, **(join_policies or {})}
+        self.join_stats: List[JoinStats] = []  # Link joins of the last process_year run
+        self.failed_steps: List[str] = []  # load_clean_* steps that failed in the last process_year run
     
-    def _generate_uuid(self, val):
-        return uuid.uuid4()
-
     def _map_category(self, val):
         val = str(val).lower()
         if 'public' in val:
@@ -71,8 +190,10 @@ class DataProcessor:
         """
         Load and transform FINESS data from bronze layer.
 
-        Reads cleaned FINESS CSV from bronze, transforms to Etablissement schema.
+        Reads the cleaned FINESS table from bronze (only the columns it uses),
+        transforms to Etablissement schema.
         Applies business logic:
+        - Keeps one row per establishment (the `structureet` records)
         - Constructs standardized addresses
         - Generates UUIDs
         - Extracts department codes
@@ -85,32 +206,36 @@ class DataProcessor:
             Optional[pd.DataFrame]: A DataFrame conforming to the `Etablissement` schema,
             or None if the file is missing or unparseable.
         """
-        file_path = self.bronze_base_path / str(year) / "finess_clean.csv"
-        if not file_path.exists():
-            logger.error(f"FINESS file not found: {file_path}")
+        year_path = self.bronze_base_path / str(year)
+        if table_path(year_path, "finess_clean") is None:
+            logger.error(f"FINESS file not found in {year_path}")
             return None
             
         try:
             # Load cleaned data from bronze layer
-            # Column names are already cleaned and standardized
-            df = pd.read_csv(file_path, encoding='utf-8', low_memory=False)
+            # Column names are already standardized and IDs are stored as text
+            df = read_table(year_path, "finess_clean", columns=FINESS_USED_COLUMNS, csv_backend=self.csv_backend)
+            
+            # One row per establishment: the extract also holds a 'geolocalisation'
+            # row per FINESS number, which shares its finess_et
+            establishments = df['structureet'] == STRUCTURE_RECORD
+            if establishments.any():
+                df = df[establishments.fillna(False).to_numpy(dtype=bool)]
+            df = df.drop_duplicates(subset=['finess_et'], keep='first').reset_index(drop=True)
             
             clean_df = pd.DataFrame()
             
             # Extract basic columns using named columns (more maintainable)
-            # Strip trailing .0 that sometimes appears when IDs are read as floats
-            clean_df['finess_et'] = df['finess_et'].astype(str).str.replace(r'\.0$', '', regex=True).str.zfill(9)
-            clean_df['siret'] = df['siret'].astype(str).str.replace(r'\.0$', '', regex=True)
+            clean_df['finess_et'] = df['finess_et'].str.zfill(9)
+            clean_df['finess_key'] = encode_finess(clean_df['finess_et'])  # Join key
+            clean_df['siret'] = df['siret']
             
             # Use Long Name, fall back to Short Name if missing
             clean_df['raison_sociale'] = df['rslongue'].fillna(df['rs'])
             
             # Address construction
             # Concatenate non-null address parts to form a full string
-            addr_parts = df[['numvoie', 'typvoie', 'voie', 'lieuditbp']].apply(
-                lambda x: ' '.join(x.dropna().astype(str)), axis=1
-            )
-            clean_df['adresse_postale'] = addr_parts
+            clean_df['adresse_postale'] = join_present(df[ADDRESS_COLUMNS])
             
             # CP and City Extraction from ligneacheminement
             # Expected format: "01300 BELLEY"
@@ -126,25 +251,18 @@ class DataProcessor:
             # Category Mapping
             # Detailed: SPH label (e.g., "Etablissement public de santé")
             clean_df['categorie_detail'] = df['libsph'].astype(str).str.strip()
-            # Simplified: Public/Private mapping using helper map function
-            clean_df['categorie_etab'] = df['libsph'].apply(self._map_category)
-            
-            # Geography: Departement extraction
-            def extract_dept(cp):
-                if pd.isna(cp):
-                    return None
-                # Cast to int to avoid "1300.0" string from float conversion
-                s_cp = str(int(cp)).zfill(5)
-                # DOM-TOM (97x) handling
-                if s_cp.startswith('97'):
-                    return s_cp[:3]
-                # Standard mainland departments (first 2 digits)
-                return s_cp[:2]
-
-            clean_df['departement'] = clean_df['code_postal'].apply(extract_dept)
-            
-            # Generate UUIDs for internal linking
-            clean_df['vel_id'] = [uuid.uuid4() for _ in range(len(clean_df))]
+            # Simplified: Public/Private mapping, computed once per distinct label
+            codes, labels = pd.factorize(df['libsph'], use_na_sentinel=False)
+            categories = np.array([self._map_category(label) for label in labels], dtype=object)
+            clean_df['categorie_etab'] = categories[codes]
+            
+            # Geography: Departement from the postal code table (DOM-TOM, Corsica)
+            clean_df['departement'] = departement_from_postal_code(clean_df['code_postal'])
+            
+            # Stable UUIDs for internal linking, derived from the FINESS number
+            clean_df['vel_id'] = record_ids(ETABLISSEMENT, clean_df['finess_et'])
+            if not clean_df['vel_id'].is_unique:
+                raise ValueError("Duplicate vel_id in Etablissement data")
             
             # Metadata fields
             clean_df['date_created'] = pd.Timestamp.now()
@@ -162,7 +280,7 @@ class DataProcessor:
         """
         Load and transform HAS data from bronze layer to produce Qualification data.
 
-        Reads cleaned `has_demarche_clean.csv` and `has_etab_geo_clean.csv`,
+        Reads the cleaned `has_demarche_clean` and `has_etab_geo_clean` tables,
         merges them on `code_demarche`, and prepares for linking to FINESS.
 
         Args:
@@ -171,25 +289,29 @@ class DataProcessor:
         Returns:
             Optional[pd.DataFrame]: A DataFrame conforming to the `Qualification` schema
             (pre-merge state), or None if files are missing.
+
+        Raises:
+            JoinFanOutError: If a code_demarche is repeated and the
+                'has_demarche' join policy is JOIN_FAIL
         """
         year_path = self.bronze_base_path / str(year)
-        demarche_path = year_path / "has_demarche_clean.csv"
-        geo_path = year_path / "has_etab_geo_clean.csv"
         
-        if not demarche_path.exists() or not geo_path.exists():
+        if table_path(year_path, "has_demarche_clean") is None or table_path(year_path, "has_etab_geo_clean") is None:
              logger.error(f"HAS files missing in {year_path}")
              return None
              
         try:
             # Load cleaned data from bronze - column names already normalized
-            df_dem = pd.read_csv(demarche_path, encoding='utf-8')
-            df_geo = pd.read_csv(geo_path, encoding='utf-8')
+            df_dem = read_table(year_path, "has_demarche_clean", csv_backend=self.csv_backend)
+            df_geo = read_table(year_path, "has_etab_geo_clean", csv_backend=self.csv_backend)
             
             if 'code_demarche' not in df_dem.columns or 'code_demarche' not in df_geo.columns:
                 logger.error("Missing code_demarche column in HAS files")
                 return None
                 
-            merged = pd.merge(df_dem, df_geo, on='code_demarche', how='inner')
+            # One row per HAS site, with the attributes of its demarche
+            merged = link_join(df_geo, df_dem, on='code_demarche', name='has_demarche',
+                               policy=self.join_policies['has_demarche'], stats=self.join_stats)
             
             # Check for FINESS column in merged data (from geo)
             # Usually 'finess_eg' or 'finess_ej'
@@ -200,10 +322,10 @@ class DataProcessor:
                 return None
             
             clean_df = pd.DataFrame()
-            clean_df['finess_et_link'] = merged[finess_col].astype(str).str.replace(r'\.0$', '', regex=True).str.zfill(9)
+            clean_df['finess_key'] = encode_finess(merged[finess_col])  # Join key
             
             # Qualification Columns
-            clean_df['qua_id'] = [uuid.uuid4() for _ in range(len(clean_df))]
+            clean_df['qua_id'] = record_ids(QUALIFICATION, merged['code_demarche'], decode_finess(clean_df['finess_key']))
             clean_df['niveau_certification'] = merged['decision_de_la_cces']
             
             # Construct URL (Heuristic)
@@ -224,8 +346,11 @@ class DataProcessor:
             logger.info(f"Transformed HAS (Qualification) data for {year}: {len(clean_df)} records")
             return clean_df
             
+        except JoinFanOutError:
+            raise
         except Exception as e:
             logger.error(f"Error processing HAS data: {e}")
+            self.failed_steps.append('has')
             return None
 
     def load_clean_health_metrics(self, year: int) -> Optional[pd.DataFrame]:
@@ -238,27 +363,28 @@ class DataProcessor:
         Returns:
             Optional[pd.DataFrame]: Transformed metrics data.
         """
-        file_path = self.bronze_base_path / str(year) / "health_metrics_clean.csv"
-        if not file_path.exists():
-            logger.error(f"Health Metrics file not found: {file_path}")
+        year_path = self.bronze_base_path / str(year)
+        if table_path(year_path, "health_metrics_clean") is None:
+            logger.error(f"Health Metrics file not found in {year_path}")
             return None
             
         try:
-            # Load cleaned CSV from bronze - already normalized
-            df = pd.read_csv(file_path, encoding='utf-8', low_memory=False)
+            # Load cleaned table from bronze - already normalized
+            df = read_table(year_path, "health_metrics_clean", csv_backend=self.csv_backend)
             
             # Find FINESS column (already normalized in bronze)
             finess_col = next((c for c in df.columns if 'finess' in c), None)
             
             clean_df = df.copy()
             if finess_col:
-                # Ensure FINESS format is consistent
-                clean_df['finess_et_link'] = clean_df[finess_col].astype(str).str.replace(r'\.0$', '', regex=True).str.zfill(9)
+                clean_df['finess_key'] = encode_finess(clean_df[finess_col])  # Join key
             else:
                 logger.warning("No FINESS column found in Health Metrics. Linking will be impossible.")
 
             # Metadata
-            clean_df['metric_id'] = [uuid.uuid4() for _ in range(len(clean_df))]
+            # Stable IDs: the IQSS row key (geographical FINESS) and the year
+            key_columns = [c for c in SOURCE_SPECS['health_metrics'].key_columns if c in clean_df.columns] or [finess_col]
+            clean_df['metric_id'] = record_ids(HEALTH_METRIC, *[clean_df[c] for c in key_columns if c], year)
             clean_df['source_file'] = 'health_metrics.xlsx'
             clean_df['processed_at'] = pd.Timestamp.now()
             
@@ -267,10 +393,90 @@ class DataProcessor:
             
         except Exception as e:
             logger.error(f"Error processing Health Metrics: {e}")
+            self.failed_steps.append('health_metrics')
             return None
 
 
+    def _silver_path(self, year: int) -> Path:
+        return self.bronze_base_path.parent / "silver" / str(year)
+
+    def _establishment_links(self, keys: pd.Series, df_etab: pd.DataFrame) -> pd.DataFrame:
+        """FINESS key → vel_id pairs to link records to (registry, else the year's establishments)."""
+        if self.registry is None:
+            return df_etab[['finess_key', 'vel_id']]
+        return self.registry.lookup(keys)
+
+    def _registry_version(self) -> Optional[int]:
+        """Number of registered establishments (None without a registry); it only grows."""
+        return len(self.registry) if self.registry is not None else None
+
+    def _link_establishments(self, df: pd.DataFrame, df_etab: pd.DataFrame, name: str) -> pd.DataFrame:
+        """
+        Attach the establishment vel_id to records by FINESS number.
+
+        The join runs on packed integer keys (`keys.encode_finess`); records
+        without a valid FINESS number are dropped, like unknown ones.
+        Duplicated establishment keys are handled by the join's policy.
+
+        Args:
+            df: Records with a `finess_key` column
+            df_etab: Establishments of the year
+            name: Join name (key of `join_policies`)
+
+        Returns:
+            Linked records with a `vel_id` column
+        """
+        links = self._establishment_links(df['finess_key'], df_etab)
+        return link_join(df.dropna(subset=['finess_key']), links.dropna(subset=['finess_key']), on='finess_key',
+                         name=name, policy=self.join_policies[name], stats=self.join_stats)
+
+    def _load_processed(self, year: int, tables: List[str]) -> Dict[str, pd.DataFrame]:
+        """Silver tables of a previous run (empty DataFrame for tables not written)."""
+        silver_path = self._silver_path(year)
+        return {
+            table: read_table(silver_path, table, csv_backend=self.csv_backend) if table in tables else pd.DataFrame()
+            for table in SILVER_TABLES
+        }
+
     def process_year(self, year: int) -> Dict[str, pd.DataFrame]:
+        """
+        Build the silver tables of a year from the bronze layer.
+        
+        The run is one build step whose inputs are the bronze tables read by
+        the load_clean_* steps. It is skipped, and the stored silver tables
+        returned, when those tables, the processing code and the silver
+        outputs are unchanged since the last run.
+        
+        The year's establishments are added to the key registry, and
+        qualifications and metrics are linked through it: a record whose
+        FINESS appeared in any processed year gets its vel_id. The registry
+        size is part of the step options, so a year is relinked once other
+        years have added establishments. A run where a load_clean_* step
+        failed is not recorded, so the next run processes the year again.
+        
+        Args:
+            year (int): Year to process.
+            
+        Returns:
+            Dict of silver DataFrames, or None without FINESS data.
+
+        Raises:
+            JoinFanOutError: If a link join with policy JOIN_FAIL meets
+                duplicated lookup keys
+        """
+        bronze_path = self.bronze_base_path / str(year)
+        inputs = [path for path in (table_path(bronze_path, t) for t in BRONZE_TABLES) if path is not None]
+        options = {'export_csv': self.export_csv, 'key_registry': self._registry_version(),
+                   'join_policies': self.join_policies}
+        manifest = BuildManifest(self._silver_path(year))
+        version = processing_code_version()
+        
+        if self.incremental and manifest.is_current(PROCESS_STEP, inputs, version, options):
+            logger.info(f"Silver tables for {year} are up to date, skipped")
+            return self._load_processed(year, manifest.load(PROCESS_STEP).get('tables', []))
+        
+        self.join_stats = []
+        self.failed_steps = []
         df_etab = self.load_clean_finess(year)
         df_qual_raw = self.load_clean_has(year)
         df_metrics_raw = self.load_clean_health_metrics(year)
@@ -279,6 +485,13 @@ class DataProcessor:
             logger.error("Cannot proceed without Etablissement data.")
             return
         
+        if self.registry is not None:
+            # Known establishments keep the vel_id they were first given
+            self.registry.register(df_etab['finess_et'], year)
+            known_ids = self.registry.lookup(df_etab['finess_key']).set_index('finess_key')['vel_id']
+            # FINESS numbers without a valid key are not registered: they keep their own vel_id
+            df_etab['vel_id'] = df_etab['finess_key'].map(known_ids).fillna(df_etab['vel_id'])
+        
         # --- ETABLISSEMENT ---
         # Already mostly aligned, but run enforcement to strip extra temp cols
         df_etab_final = self._enforce_schema(df_etab, Etablissement)
@@ -287,13 +500,7 @@ class DataProcessor:
         df_qual_final = pd.DataFrame()
         if df_qual_raw is not None:
              # Merge to get vel_id
-            merged_qual = pd.merge(
-                df_qual_raw, 
-                df_etab[['finess_et', 'vel_id']], 
-                left_on='finess_et_link', 
-                right_on='finess_et', 
-                how='inner'
-            )
+            merged_qual = self._link_establishments(df_qual_raw, df_etab, 'qualifications')
             
             # Construct URL - Moved to load_clean_has
             # merged_qual already has url_rapport if available
@@ -307,14 +514,8 @@ class DataProcessor:
         # --- HEALTH METRICS ---
         df_metrics_final = pd.DataFrame()
         if df_metrics_raw is not None:
-             if 'finess_et_link' in df_metrics_raw.columns:
-                merged_metrics = pd.merge(
-                    df_metrics_raw,
-                    df_etab[['finess_et', 'vel_id']],
-                    left_on='finess_et_link',
-                    right_on='finess_et',
-                    how='inner'
-                )
+             if 'finess_key' in df_metrics_raw.columns:
+                merged_metrics = self._link_establishments(df_metrics_raw, df_etab, 'health_metrics')
                 
                 # Metadata
                 merged_metrics['annee'] = year
@@ -333,23 +534,42 @@ class DataProcessor:
                 logger.info(f"Linked {len(df_metrics_final)} health metrics records")
 
         # Save outputs
-        self.save_processed(df_etab_final, df_qual_final, df_metrics_final, year)
+        outputs = self.save_processed(df_etab_final, df_qual_final, df_metrics_final, year)
+        if self.failed_steps:
+            # Incomplete outputs: the next run must process the year again
+            logger.warning(f"✗ Steps failed for {year} ({', '.join(self.failed_steps)}), build not recorded")
+        else:
+            # Recorded with the registry as this year left it: an unchanged rerun is skipped
+            options['key_registry'] = self._registry_version()
+            manifest.record(PROCESS_STEP, inputs, outputs, version, options,
+                            tables=sorted({Path(path).stem for path in outputs}),
+                            joins=[{**asdict(stats), 'fan_out': round(stats.fan_out, 3)} for stats in self.join_stats])
         return {'etablissements': df_etab_final, 'qualifications': df_qual_final, 'health_metrics': df_metrics_final}
 
-    def save_processed(self, df_etab: pd.DataFrame, df_qual: pd.DataFrame, df_metrics: pd.DataFrame, year: int):
-         save_path = self.bronze_base_path.parent / "silver" / str(year)
-         save_path.mkdir(parents=True, exist_ok=True)
+    def save_processed(self, df_etab: pd.DataFrame, df_qual: pd.DataFrame, df_metrics: pd.DataFrame, year: int) -> List[Path]:
+         """
+         Write the silver tables as Parquet (plus CSV copies if `export_csv`).
+
+         Returns:
+             Paths of the files written
+         """
+         save_path = self._silver_path(year)
+         written = []
          
-         etab_path = save_path / "etablissements.csv"
-         df_etab.to_csv(etab_path, index=False)
+         etab_path = write_table(df_etab, save_path, "etablissements", export_csv=self.export_csv, csv_backend=self.csv_backend)
          logger.info(f"Saved Etablissements to {etab_path}")
+         written.append(etab_path)
          
          if not df_qual.empty:
-             qual_path = save_path / "qualifications.csv"
-             df_qual.to_csv(qual_path, index=False)
+             qual_path = write_table(df_qual, save_path, "qualifications", export_csv=self.export_csv, csv_backend=self.csv_backend)
              logger.info(f"Saved Qualifications to {qual_path}")
+             written.append(qual_path)
 
          if not df_metrics.empty:
-             metrics_path = save_path / "health_metrics.csv"
-             df_metrics.to_csv(metrics_path, index=False)
+             metrics_path = write_table(df_metrics, save_path, "health_metrics", export_csv=self.export_csv, csv_backend=self.csv_backend)
              logger.info(f"Saved Health Metrics to {metrics_path}")
+             written.append(metrics_path)
+
+         if self.export_csv:
+             written += [path.with_suffix(".csv") for path in written]
+         return written
@@ -0,0 +1,100 @@
+"""
+Excel reading for the cleaning step.
+
+Workbooks are parsed with the native calamine engine when `python-calamine`
+is installed (several times faster than openpyxl, same DataFrame), and the
+parsed sheet is cached as Parquet under a name derived from the SHA-256 of
+the workbook. A workbook that has not changed since the last run is loaded
+from its cache file instead of being parsed again.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+try:
+    import python_calamine
+except ImportError:  # pragma: no cover - optional dependency
+    python_calamine = None
+
+from src.config import config
+from src.storage.raw_store import file_sha256
+
+logger = logging.getLogger(__name__)
+
+AUTO_ENGINE = "auto"
+
+
+def default_engine() -> str:
+    """Fastest installed engine: calamine, else openpyxl."""
+    return "calamine" if python_calamine is not None else "openpyxl"
+
+
+class ExcelReader:
+    """
+    Reads the first sheet of a workbook, with a content-addressed Parquet cache.
+    """
+
+    def __init__(self, engine: str = AUTO_ENGINE, cache_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize ExcelReader.
+
+        Args:
+            engine: pandas Excel engine ('calamine', 'openpyxl', ...) or 'auto'
+            cache_path: Directory of cached sheets (None disables the cache)
+        """
+        self.engine = default_engine() if engine == AUTO_ENGINE else engine
+        self.cache_path = Path(cache_path) if cache_path else None
+
+    @classmethod
+    def from_config(cls) -> "ExcelReader":
+        """ExcelReader configured from PipelineConfig (excel_engine, excel_cache_*)."""
+        pipeline = config.pipeline
+        return cls(
+            engine=pipeline.excel_engine,
+            cache_path=pipeline.excel_cache_path if pipeline.excel_cache_enabled else None
+        )
+
+    def read(self, file_path: Union[str, Path]) -> pd.DataFrame:
+        """
+        Load the first sheet of a workbook.
+
+        Args:
+            file_path: Workbook to read
+
+        Returns:
+            Sheet content as parsed by pandas
+        """
+        if self.cache_path is None:
+            return pd.read_excel(file_path, engine=self.engine)
+
+        cache_file = self.cache_path / f"{file_sha256(file_path)}.parquet"
+        if cache_file.exists():
+            try:
+                df = pd.read_parquet(cache_file)
+                logger.info(f"  Loaded {Path(file_path).name} from conversion cache")
+                return df
+            except Exception as e:
+                logger.warning(f"  Ignoring unreadable cache file {cache_file}: {e}")
+
+        df = pd.read_excel(file_path, engine=self.engine)
+        self._store(df, cache_file)
+        return df
+
+    def _store(self, df: pd.DataFrame, cache_file: Path) -> None:
+        """Write a parsed sheet to the cache (skipped if Parquet cannot hold it)."""
+        if not all(isinstance(col, str) for col in df.columns):
+            return
+        tmp_file = cache_file.with_suffix(".parquet.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_file, index=False)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            # e.g. object columns mixing numbers and text
+            logger.warning(f"  Sheet not cached ({e})")
+            if tmp_file.exists():
+                tmp_file.unlink()
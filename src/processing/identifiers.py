@@ -0,0 +1,83 @@
+"""
+Deterministic identifiers of the silver tables.
+
+`vel_id`, `qua_id` and `metric_id` are name-based UUIDs (RFC 4122 version 5)
+derived from the natural keys of each record, so a record keeps its ID from
+one run to the next and only real changes need to be loaded downstream.
+IDs are built for a whole column at once: each distinct key is hashed once
+and the UUID bits and text are produced with array operations, without
+creating a `uuid.UUID` object per row. The result is identical to
+`str(uuid.uuid5(namespace, name))`.
+"""
+
+import hashlib
+import uuid
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+# Namespace of every Veltis identifier
+VELTIS_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "veltis")
+
+# Prefix of the UUID name of each kind of record
+ETABLISSEMENT = "etablissement"
+QUALIFICATION = "qualification"
+HEALTH_METRIC = "health_metric"
+
+KEY_SEPARATOR = ":"
+
+_HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+# Positions of the 32 hex digits in the 36-character text form
+_DIGIT_POSITIONS = np.array([i for i in range(36) if i not in (8, 13, 18, 23)])
+
+
+def uuid5_column(names: Iterable[str], namespace: uuid.UUID = VELTIS_NAMESPACE) -> np.ndarray:
+    """
+    Build version 5 UUIDs for many names.
+
+    Args:
+        names: UUID names (one per row, missing names are hashed as '')
+        namespace: UUID namespace
+
+    Returns:
+        Array of UUID strings (e.g. "1b4e28ba-2fa1-5d1c-...")
+    """
+    codes, uniques = pd.factorize(pd.Series(names, dtype="string").fillna(""))
+    prefix = namespace.bytes
+    digests = b"".join(hashlib.sha1(prefix + name.encode("utf-8")).digest()[:16] for name in uniques)
+    raw = np.frombuffer(digests, dtype=np.uint8).reshape(-1, 16).copy()
+
+    # Version 5 and RFC 4122 variant bits
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x50
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+
+    # Hex digits, with dashes at 8-4-4-4-12
+    text = np.full((len(raw), 36), ord("-"), dtype=np.uint8)
+    nibbles = np.stack([raw >> 4, raw & 0x0F], axis=2).reshape(len(raw), 32)
+    text[:, _DIGIT_POSITIONS] = _HEX_DIGITS[nibbles]
+    ids = text.view("S36").ravel().astype(str)
+    return ids[codes]
+
+
+def record_ids(kind: str, *keys: Union[pd.Series, str, int]) -> pd.Series:
+    """
+    Identifiers of records from their natural key.
+
+    Args:
+        kind: Record kind (ETABLISSEMENT, QUALIFICATION or HEALTH_METRIC)
+        *keys: Key columns, in order; scalars (e.g. the year) apply to every row
+
+    Returns:
+        UUID strings aligned with the key columns (missing key parts are
+        written as empty strings)
+    """
+    columns = [key for key in keys if isinstance(key, pd.Series)]
+    if not columns:
+        raise ValueError("record_ids needs at least one key column")
+    index = columns[0].index
+    names = pd.Series(kind, index=index, dtype="string")
+    for key in keys:
+        part = key.astype("string").fillna("") if isinstance(key, pd.Series) else str(key)
+        names = names + KEY_SEPARATOR + part
+    return pd.Series(uuid5_column(names.tolist()), index=index, dtype="string")
@@ -0,0 +1,121 @@
+"""
+Guarded link joins for the silver layer.
+
+A link join attaches the attributes of a lookup table (demarches,
+establishments) to records (HAS sites, metrics). Each lookup key should
+appear once; a duplicated key multiplies the records matching it, and with
+keys duplicated on both sides the output grows as a many-to-many product.
+`link_join` measures both sides and the output size before merging, then
+applies the join's policy to duplicated lookup keys:
+- JOIN_FAIL: raise JoinFanOutError
+- JOIN_DEDUPE: keep the first lookup row of each key
+- JOIN_ALLOW: merge anyway
+Every join reports its statistics (`JoinStats`), including the fan-out
+ratio: output rows per input record.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+JOIN_FAIL = "fail"
+JOIN_DEDUPE = "dedupe"
+JOIN_ALLOW = "allow"
+JOIN_POLICIES = (JOIN_FAIL, JOIN_DEDUPE, JOIN_ALLOW)
+
+
+class JoinFanOutError(ValueError):
+    """A lookup table has duplicated keys and its join policy is JOIN_FAIL."""
+
+
+@dataclass
+class JoinStats:
+    """Cardinality of one link join."""
+    name: str
+    policy: str
+    records: int                  # Rows of the record side
+    lookup_rows: int              # Rows of the lookup side
+    records_unique_keys: bool     # Each record key appears once
+    duplicate_lookup_keys: int    # Lookup keys appearing more than once
+    expected_rows: int            # Output size of the merge as requested
+    output_rows: int = 0          # Output size after the policy was applied
+
+    @property
+    def fan_out(self) -> float:
+        """Expected output rows per record (above 1 only with duplicated lookup keys)."""
+        return self.expected_rows / self.records if self.records else 0.0
+
+
+def join_stats(records: pd.DataFrame, lookup: pd.DataFrame, on: str, name: str,
+               policy: str = JOIN_FAIL) -> JoinStats:
+    """
+    Measure a join from the key counts of both sides, without merging.
+
+    Args:
+        records: Record side of the join
+        lookup: Lookup side, expected to have one row per key
+        on: Key column
+        name: Join name used in reports
+        policy: Policy the join runs with
+
+    Returns:
+        JoinStats (output_rows not set yet)
+    """
+    record_counts = records[on].value_counts(dropna=False)
+    lookup_counts = lookup[on].value_counts(dropna=False)
+    expected = (record_counts * lookup_counts.reindex(record_counts.index, fill_value=0)).sum()
+    return JoinStats(
+        name=name,
+        policy=policy,
+        records=len(records),
+        lookup_rows=len(lookup),
+        records_unique_keys=bool((record_counts <= 1).all()),
+        duplicate_lookup_keys=int((lookup_counts > 1).sum()),
+        expected_rows=int(expected),
+    )
+
+
+def link_join(records: pd.DataFrame, lookup: pd.DataFrame, on: str, name: str,
+              policy: str = JOIN_FAIL, stats: Optional[list] = None) -> pd.DataFrame:
+    """
+    Inner-join records to a lookup table, guarding against fan-out.
+
+    Args:
+        records: Record side of the join (left)
+        lookup: Lookup side (right), expected to have one row per key
+        on: Key column
+        name: Join name used in reports
+        policy: JOIN_FAIL, JOIN_DEDUPE or JOIN_ALLOW for duplicated lookup keys
+        stats: List the join's JoinStats is appended to
+
+    Returns:
+        Merged DataFrame
+
+    Raises:
+        JoinFanOutError: If lookup keys are duplicated and policy is JOIN_FAIL
+        ValueError: If the policy is unknown
+    """
+    if policy not in JOIN_POLICIES:
+        raise ValueError(f"Unknown join policy '{policy}' for {name}, expected one of {JOIN_POLICIES}")
+
+    report = join_stats(records, lookup, on, name, policy)
+    if report.duplicate_lookup_keys:
+        message = (f"Join {name}: {report.duplicate_lookup_keys} duplicated '{on}' keys in lookup, "
+                   f"{report.records} records would give {report.expected_rows} rows ({report.fan_out:.2f}x)")
+        if policy == JOIN_FAIL:
+            raise JoinFanOutError(message)
+        logger.warning(f"  {message}" + (", keeping the first row of each key" if policy == JOIN_DEDUPE else ""))
+        if policy == JOIN_DEDUPE:
+            lookup = lookup.drop_duplicates(subset=[on], keep='first')
+
+    merged = pd.merge(records, lookup, on=on, how='inner')
+    report.output_rows = len(merged)
+    logger.info(f"  Join {name}: {report.records} records x {report.lookup_rows} lookup rows -> "
+                f"{report.output_rows} rows (fan-out {report.fan_out:.2f}x)")
+    if stats is not None:
+        stats.append(report)
+    return merged
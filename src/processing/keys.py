@@ -0,0 +1,100 @@
+"""
+Integer codec for FINESS numbers.
+
+FINESS numbers (9 characters, the second one is a letter for Corsica: 2A/2B)
+are packed into int64 values, so joins hash fixed-width integers instead of
+strings and key columns take 8 bytes a row. Records carry only the packed
+key; it is decoded back to text where a FINESS number is needed (e.g. in a
+record ID).
+
+FINESS packing: the first character (0-9) and the second one (0-9, A=10,
+B=11) form a base-12 department number, followed by the 7 remaining digits:
+    (c0 * 12 + c1) * 10**7 + int(c2..c8)
+Values that are not valid numbers encode as NA and never match in a join.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+FINESS_LENGTH = 9
+
+FINESS_PATTERN = r"\d[\dAB]\d{7}"
+
+# Second FINESS character: Corsican departments
+_CORSICA_DIGITS = {ord("A") - ord("0"): 10, ord("B") - ord("0"): 11}
+_TAIL_WEIGHTS = 10 ** np.arange(FINESS_LENGTH - 3, -1, -1, dtype=np.int64)
+_TAIL_BASE = 10 ** (FINESS_LENGTH - 2)
+
+
+def _valid_codes(values: pd.Series, length: int, pattern: str) -> Tuple[pa.Array, np.ndarray]:
+    """Padded, uppercased codes and the mask of those matching `pattern`."""
+    codes = pa.array(values.astype("string"), type=pa.string())
+    codes = pc.utf8_lpad(pc.utf8_upper(pc.utf8_trim_whitespace(codes)), length, "0")
+    valid = pc.fill_null(pc.match_substring_regex(codes, f"^{pattern}$"), False)
+    return codes, valid.to_numpy(zero_copy_only=False)
+
+
+def _char_matrix(codes: pa.Array, valid: np.ndarray, length: int) -> np.ndarray:
+    """Characters of the valid codes as a (rows, length) array of offsets from '0'."""
+    codes = codes.filter(pa.array(valid))
+    if len(codes) == 0:
+        return np.empty((0, length), dtype=np.int64)
+    # Valid codes are ASCII and `length` bytes long: the data buffer is the matrix
+    offsets = np.frombuffer(codes.buffers()[1], dtype=np.int32)[codes.offset:codes.offset + len(codes) + 1]
+    data = np.frombuffer(codes.buffers()[2], dtype=np.uint8)[offsets[0]:offsets[-1]]
+    return data.reshape(-1, length).astype(np.int64) - ord("0")
+
+
+def encode_finess(values: pd.Series) -> pd.Series:
+    """
+    Pack FINESS numbers into integers.
+
+    Args:
+        values: FINESS numbers as text (leading zeros may be missing)
+
+    Returns:
+        Int64 Series aligned with `values` (NA for missing or invalid numbers)
+    """
+    codes, valid = _valid_codes(values, FINESS_LENGTH, FINESS_PATTERN)
+    chars = _char_matrix(codes, valid, FINESS_LENGTH)
+    second = chars[:, 1]
+    for offset, digit in _CORSICA_DIGITS.items():
+        second = np.where(second == offset, digit, second)
+    packed = (chars[:, 0] * 12 + second) * _TAIL_BASE + chars[:, 2:] @ _TAIL_WEIGHTS
+
+    result = np.zeros(len(values), dtype=np.int64)
+    result[valid] = packed
+    return pd.Series(pd.arrays.IntegerArray(result, ~valid), index=values.index)
+
+
+def decode_finess(keys: pd.Series) -> pd.Series:
+    """
+    Turn packed FINESS numbers back into text.
+
+    Args:
+        keys: Integers returned by `encode_finess`
+
+    Returns:
+        string Series of 9-character FINESS numbers (NA where `keys` is NA)
+    """
+    keys = keys.astype("Int64")
+    valid = keys.notna().to_numpy(dtype=bool)
+    packed = keys.fillna(0).to_numpy(dtype=np.int64)
+
+    department, tail = np.divmod(packed, _TAIL_BASE)
+    first, second = np.divmod(department, 12)
+    chars = np.empty((len(packed), FINESS_LENGTH), dtype=np.uint8)
+    chars[:, 0] = first + ord("0")
+    chars[:, 1] = np.where(second >= 10, second - 10 + ord("A"), second + ord("0"))
+    chars[:, 2:] = (tail[:, None] // _TAIL_WEIGHTS) % 10 + ord("0")
+
+    # Fixed-width rows: the matrix is the data buffer of an Arrow string array
+    offsets = np.arange(len(packed) + 1, dtype=np.int32) * FINESS_LENGTH
+    codes = pa.StringArray.from_buffers(len(packed), pa.py_buffer(offsets), pa.py_buffer(chars.tobytes()))
+    codes = pc.if_else(pa.array(valid), codes, pa.scalar(None, pa.string()))
+    return pd.Series(pd.array(codes, dtype="string"), index=keys.index)
+
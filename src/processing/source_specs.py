@@ -0,0 +1,163 @@
+"""
+Declarative specs of the raw sources cleaned into the bronze layer.
+
+A spec says where a source is (raw file, reader, encoding, separator, header
+row or column names), how its headers are normalized, the type of every
+column (including explicit date formats) and the columns identifying a row.
+`DataCleaner.clean_from_spec` runs the same cleaning for every spec. CSV
+files are read as text and each column is then converted to its declared
+type, so pandas never infers types. Adding a source means adding a spec to
+SOURCE_SPECS.
+
+The declared types are also the bronze table types (see table_io).
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+# Key applying a dtype to every column not listed explicitly
+ALL_COLUMNS = "*"
+
+DATETIME = "datetime64[us]"
+
+# Header normalization styles
+HEADERS_AS_IS = "as_is"
+HEADERS_LOWER = "lower"  # Lowercase, quotes removed
+HEADERS_ASCII = "ascii"  # Also accents and punctuation removed, spaces as underscores
+
+# Define official FINESS column names based on data.gouv.fr structure
+# Source: https://www.data.gouv.fr/datasets/finess-extraction-des-entites-juridiques
+FINESS_COLUMNS = [
+    'structureet',           # 0: Structure type
+    'finess_et',             # 1: FINESS Establishment ID
+    'finess_ej',             # 2: FINESS Legal Entity ID
+    'rs',                    # 3: Short name (Raison Sociale)
+    'rslongue',              # 4: Long name (Raison Sociale Longue)
+    'complrs',               # 5: Complement RS
+    'compldistrib',          # 6: Complement distribution
+    'numvoie',               # 7: Street number
+    'typvoie',               # 8: Street type (rue, avenue, etc.)
+    'voie',                  # 9: Street name
+    'compvoie',              # 10: Street complement
+    'lieuditbp',             # 11: Place/BP
+    'commune',               # 12: Municipality code
+    'departement',           # 13: Department code
+    'libdepartement',        # 14: Department name
+    'ligneacheminement',     # 15: Postal routing line (CP + ville)
+    'telephone',             # 16: Phone number
+    'telecopie',             # 17: Fax number
+    'categetab',             # 18: Establishment category code
+    'libcategetab',          # 19: Establishment category name
+    'categagretab',          # 20: Aggregated category code
+    'libcategagretab',       # 21: Aggregated category name
+    'siret',                 # 22: SIRET number
+    'codeape',               # 23: APE code
+    'codemft',               # 24: MFT code
+    'libmft',                # 25: MFT label
+    'codesph',               # 26: SPH code
+    'libsph',                # 27: SPH label (category detail)
+    'dateouv',               # 28: Opening date
+    'dateautor',             # 29: Authorization date
+    'datemaj',               # 30: Last update date
+    'numuai'                 # 31: UAI number
+]
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """How to read, type and deduplicate one raw source."""
+    name: str                                   # Source name (clean_year result key)
+    label: str                                  # Name used in log messages
+    file_name: str                              # File in raw/{year}/
+    table: str                                  # Bronze table it produces
+    reader: str = "csv"                         # 'csv' or 'excel'
+    encoding: str = "utf-8"                     # Raw text files are UTF-8 since ingestion
+    sep: str = ","
+    header: Optional[int] = 0                   # Row holding the header
+    names: Optional[Tuple[str, ...]] = None     # Column names replacing the header
+    on_bad_lines: str = "error"                 # Rows with too many fields: 'error', 'warn', 'skip'
+    headers: str = HEADERS_AS_IS                # Header normalization style
+    dtypes: Dict[str, str] = field(default_factory=dict)            # Column (or ALL_COLUMNS) -> dtype
+    dtype_patterns: Tuple[Tuple[str, str], ...] = ()                # (column regex, dtype), first match wins
+    date_formats: Dict[str, str] = field(default_factory=dict)      # Column -> strptime format
+    strip_prefixes: bool = False                # Remove "1- " prefixes from text values
+    key_columns: Tuple[str, ...] = ()           # Columns identifying a row
+
+
+SOURCE_SPECS: Dict[str, SourceSpec] = {spec.name: spec for spec in [
+    SourceSpec(
+        name='finess',
+        label='FINESS',
+        file_name='finess.csv',
+        table='finess_clean',
+        sep=';',
+        header=1,  # Line 0 is the extraction banner
+        names=tuple(FINESS_COLUMNS),
+        on_bad_lines='warn',
+        dtypes={ALL_COLUMNS: 'string'},  # Codes and labels only
+        key_columns=('finess_et',),
+    ),
+    SourceSpec(
+        name='has_demarche',
+        label='HAS demarche',
+        file_name='has_demarche.csv',
+        table='has_demarche_clean',
+        headers=HEADERS_LOWER,
+        dtypes={
+            'code_demarche': 'string',
+            'annee_visite': 'Int64',
+            'mois_visite': 'string',
+            'date_deb_visite': DATETIME,
+            'date_de_decision': DATETIME,
+            'decision_de_la_cces': 'string',
+        },
+        date_formats={
+            'date_deb_visite': '%d/%m/%Y',
+            'date_de_decision': '%d/%m/%Y',
+        },
+        key_columns=('code_demarche',),
+    ),
+    SourceSpec(
+        name='has_etab_geo',
+        label='HAS etab geo',
+        file_name='has_etab_geo.csv',
+        table='has_etab_geo_clean',
+        headers=HEADERS_LOWER,
+        dtypes={
+            'code_demarche': 'string',
+            'finess_ej': 'string',
+            'finess_eg': 'string',
+            'rs_eg': 'string',
+            'site_principal': 'boolean',
+        },
+        key_columns=('code_demarche', 'finess_eg'),
+    ),
+    SourceSpec(
+        name='health_metrics',
+        label='health metrics',
+        file_name='health_metrics.xlsx',
+        table='health_metrics_clean',
+        reader='excel',
+        headers=HEADERS_ASCII,
+        dtypes={
+            'finess': 'string',
+            'rs_finess': 'string',
+            'finess_geo': 'string',
+            'rs_finess_geo': 'string',
+            'region': 'string',
+            'type': 'string',
+            # Low-cardinality IQSS columns
+            'participation': 'category',
+            'depot': 'category',
+            'classement': 'category',
+            'evolution': 'category',
+        },
+        # Indicator columns vary by year: typed by name
+        dtype_patterns=(
+            (r'^nb', 'Int64'),
+            (r'score|taux|valeur', 'float64'),
+        ),
+        strip_prefixes=True,  # "1- Oui" -> "Oui"
+        key_columns=('finess_geo',),
+    ),
+]}
@@ -0,0 +1,194 @@
+"""
+Typed table storage for the bronze and silver layers.
+
+Tables are stored as Parquet with the column types declared below, so IDs
+such as FINESS or SIRET numbers are kept as text (no float coercion, no lost
+leading zeros) and readers can load only the columns they need. A CSV copy
+can be written next to each Parquet file as an optional side output.
+
+Tables written before the Parquet layers existed are still readable: when
+no Parquet file is found, the CSV file is loaded with the same declared types.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+
+from src.processing.csv_backend import get_csv_backend
+from src.processing.source_specs import ALL_COLUMNS, DATETIME, SOURCE_SPECS
+
+logger = logging.getLogger(__name__)
+
+PARQUET_SUFFIX = ".parquet"
+CSV_SUFFIX = ".csv"
+
+# Declared column types per table (columns not listed keep their type).
+# Bronze tables are typed by their source specs.
+TABLE_DTYPES: Dict[str, Dict[str, str]] = {
+    **{spec.table: dict(spec.dtypes) for spec in SOURCE_SPECS.values()},
+    # Silver
+    'etablissements': {
+        'vel_id': 'string',
+        'finess_et': 'string',
+        'siret': 'string',
+        'raison_sociale': 'string',
+        'categorie_etab': 'string',
+        'categorie_detail': 'string',
+        'adresse_postale': 'string',
+        'code_postal': 'Int64',
+        'departement': 'string',
+        'date_created': DATETIME,
+        'date_updated': DATETIME,
+    },
+    'qualifications': {
+        'qua_id': 'string',
+        'vel_id': 'string',
+        'niveau_certification': 'string',
+        'date_visite': DATETIME,
+        'url_rapport': 'string',
+        'date_created': DATETIME,
+        'date_updated': DATETIME,
+        'source': 'string',
+        'freshness': 'string',
+    },
+    'health_metrics': {
+        'metric_id': 'string',
+        'vel_id': 'string',
+        'classement': 'category',
+        'evolution': 'category',
+        'participation': 'category',
+        'depot': 'category',
+        'annee': 'Int64',
+        'date_created': DATETIME,
+        'source': 'string',
+    },
+}
+
+
+def declared_dtypes(table: str, columns: List[str]) -> Dict[str, str]:
+    """
+    Declared dtype of each of `columns` for a table.
+
+    Args:
+        table: Table name (file name without extension)
+        columns: Columns present in the data
+
+    Returns:
+        Mapping of column to dtype, for columns with a declared type
+    """
+    declared = TABLE_DTYPES.get(table, {})
+    default = declared.get(ALL_COLUMNS)
+    dtypes = {}
+    for col in columns:
+        dtype = declared.get(col, default)
+        if dtype is not None:
+            dtypes[col] = dtype
+    return dtypes
+
+
+def apply_dtypes(df: pd.DataFrame, table: str) -> pd.DataFrame:
+    """
+    Cast a DataFrame to the declared column types of a table.
+
+    UUID objects and other Python values in object columns declared as
+    `string` are converted with `str()`; missing values stay missing.
+
+    Args:
+        df: Data to cast
+        table: Table name
+
+    Returns:
+        DataFrame with declared columns cast
+    """
+    dtypes = declared_dtypes(table, list(df.columns))
+    if not dtypes:
+        return df
+    df = df.copy()
+    for col, dtype in dtypes.items():
+        if dtype == 'string' and df[col].dtype == object:
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+        df[col] = df[col].astype(dtype)
+    return df
+
+
+def table_path(directory: Union[str, Path], table: str) -> Optional[Path]:
+    """
+    Location of a stored table, preferring Parquet over a legacy CSV file.
+
+    Returns:
+        Path of the file to read, or None if the table does not exist
+    """
+    directory = Path(directory)
+    for suffix in (PARQUET_SUFFIX, CSV_SUFFIX):
+        path = directory / f"{table}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def write_table(df: pd.DataFrame, directory: Union[str, Path], table: str,
+                export_csv: bool = False, csv_backend: Optional[str] = None) -> Path:
+    """
+    Write a table as Parquet with its declared column types.
+
+    The Parquet file is written to a temporary name and renamed, so readers
+    never see a partial file.
+
+    Args:
+        df: Data to write
+        directory: Layer directory (e.g. bronze/2024)
+        table: Table name (file name without extension)
+        export_csv: Also write `<table>.csv` as a side output
+        csv_backend: CSV writer for the side output (default: PipelineConfig.csv_backend)
+
+    Returns:
+        Path of the Parquet file
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    df = apply_dtypes(df, table)
+
+    path = directory / f"{table}{PARQUET_SUFFIX}"
+    tmp_path = path.with_suffix(".parquet.tmp")
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+    if export_csv:
+        get_csv_backend(csv_backend).write_csv(df, directory / f"{table}{CSV_SUFFIX}")
+    return path
+
+
+def read_table(directory: Union[str, Path], table: str,
+               columns: Optional[List[str]] = None, csv_backend: Optional[str] = None) -> pd.DataFrame:
+    """
+    Read a table, loading only the requested columns.
+
+    Args:
+        directory: Layer directory (e.g. bronze/2024)
+        table: Table name (file name without extension)
+        columns: Columns to load (default: all)
+        csv_backend: CSV reader for legacy CSV tables (default: PipelineConfig.csv_backend)
+
+    Returns:
+        DataFrame with declared column types
+
+    Raises:
+        FileNotFoundError: If neither a Parquet nor a CSV file exists
+    """
+    path = table_path(directory, table)
+    if path is None:
+        raise FileNotFoundError(f"Table {table} not found in {directory}")
+
+    if path.suffix == PARQUET_SUFFIX:
+        return pd.read_parquet(path, columns=columns)
+
+    # Legacy CSV: read declared text columns as text so IDs are not coerced
+    header = pd.read_csv(path, nrows=0, encoding='utf-8').columns
+    wanted = list(columns) if columns is not None else list(header)
+    dtypes = declared_dtypes(table, wanted)
+    text_columns = {col: str for col, dtype in dtypes.items() if dtype == 'string'}
+    df = get_csv_backend(csv_backend).read_csv(path, usecols=wanted, dtype=text_columns)
+    return apply_dtypes(df[wanted], table)
@@ -0,0 +1 @@
+# Storage helpers for the raw/bronze/silver data layers
@@ -0,0 +1,163 @@
+"""
+Incremental build state for the bronze and silver layers.
+
+Each build step (cleaning one source, processing one year) writes a record
+to `<layer>/{year}/.build/<step>.json`. The record holds the SHA-256 of every
+input and output file, the version of the code that ran the step, and the
+options it ran with. When all of these still match, the step is up to date
+and is skipped, like a `make` target whose prerequisites have not changed.
+File hashes are cached by size and modification time, so an unchanged file
+is not read again.
+
+Steps write separate files, so steps running in parallel worker processes
+never write to the same record.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .raw_store import file_sha256
+
+
+logger = logging.getLogger(__name__)
+
+BUILD_DIRNAME = ".build"
+
+
+@lru_cache(maxsize=None)
+def code_version(*objects) -> str:
+    """
+    Version of the code run by a build step.
+
+    Args:
+        objects: Modules (or functions) whose source the step depends on
+
+    Returns:
+        Short hash of their source code
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        digest.update(inspect.getsource(obj).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class BuildManifest:
+    """
+    Per-directory record of build steps, their inputs and their outputs.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initialize BuildManifest.
+
+        Args:
+            directory: Output directory of the steps (e.g. bronze/2024)
+        """
+        self.path = Path(directory) / BUILD_DIRNAME
+
+    def _step_file(self, step: str) -> Path:
+        return self.path / f"{step}.json"
+
+    def load(self, step: str) -> Dict[str, Any]:
+        """Last record of a step ({} if it never ran or the record is unreadable)."""
+        step_file = self._step_file(step)
+        if not step_file.exists():
+            return {}
+        try:
+            with open(step_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable build record {step_file}: {e}")
+            return {}
+
+    @staticmethod
+    def fingerprint(path: Union[str, Path], previous: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Content fingerprint of a file.
+
+        Args:
+            path: File to fingerprint
+            previous: Earlier fingerprint of the same file; its hash is
+                reused when size and modification time are unchanged
+
+        Returns:
+            Dict with sha256, size and mtime_ns, or None if the file is missing
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        if previous and previous.get('size') == stat.st_size and previous.get('mtime_ns') == stat.st_mtime_ns:
+            return dict(previous)
+        return {'sha256': file_sha256(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def _matches(self, recorded: Dict[str, Any], paths: Iterable[Union[str, Path]]) -> bool:
+        """True if `paths` are exactly the recorded files, with the same content."""
+        paths = [str(p) for p in paths]
+        if set(paths) != set(recorded):
+            return False
+        for path in paths:
+            current = self.fingerprint(path, recorded[path])
+            if current is None or current['sha256'] != recorded[path].get('sha256'):
+                return False
+        return True
+
+    def is_current(self, step: str, inputs: Iterable[Union[str, Path]], version: str,
+                   options: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether a step can be skipped.
+
+        Args:
+            step: Step name
+            inputs: Files the step reads
+            version: Code version of the step (see `code_version`)
+            options: Settings that change the step's output
+
+        Returns:
+            True if the inputs, code version, options and outputs all match
+            the last successful run
+        """
+        record = self.load(step)
+        if not record:
+            return False
+        if record.get('code_version') != version or record.get('options') != (options or {}):
+            return False
+        return self._matches(record.get('inputs', {}), inputs) and \
+            self._matches(record.get('outputs', {}), record.get('outputs', {}))
+
+    def record(self, step: str, inputs: Iterable[Union[str, Path]], outputs: Iterable[Union[str, Path]],
+               version: str, options: Optional[Dict[str, Any]] = None, **details) -> None:
+        """
+        Record a successful run of a step.
+
+        Args:
+            step: Step name
+            inputs: Files the step read
+            outputs: Files the step wrote
+            version: Code version of the step
+            options: Settings that change the step's output
+            **details: Extra values kept with the record (e.g. row counts)
+        """
+        previous = self.load(step)
+        known = {**previous.get('inputs', {}), **previous.get('outputs', {})}
+        entry = {
+            'inputs': {str(p): self.fingerprint(p, known.get(str(p))) for p in inputs},
+            'outputs': {str(p): self.fingerprint(p) for p in outputs},
+            'code_version': version,
+            'options': options or {},
+            'built_at': datetime.utcnow().isoformat(),
+            **details,
+        }
+        self.path.mkdir(parents=True, exist_ok=True)
+        step_file = self._step_file(step)
+        tmp_file = step_file.with_suffix(".json.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
+        os.replace(tmp_file, step_file)
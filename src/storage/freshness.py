@@ -0,0 +1,94 @@
+"""
+Freshness checks for raw artifacts.
+
+Decides whether a resolved resource needs downloading again, using what the
+raw store manifest recorded when the file was last fetched (fetch time,
+upstream `last_modified` and checksum) and the per-source refresh intervals
+of `PipelineConfig` (`finess_refresh_hours`, `has_refresh_hours`, ...).
+When the catalog gives a checksum, it alone decides; `last_modified` and the
+file age are only used for resources without one.
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional, Dict
+
+from .raw_store import RawStore
+
+
+logger = logging.getLogger(__name__)
+
+# Ingestion task name -> PipelineConfig field holding its refresh interval
+REFRESH_SETTINGS = {
+    'finess': 'finess_refresh_hours',
+    'health_metrics': 'has_refresh_hours',  # IQSS indicators are published by the HAS
+    'has_demarche': 'has_refresh_hours',
+    'has_etab_geo': 'has_refresh_hours',
+}
+
+
+class FreshnessScheduler:
+    """
+    Skips raw downloads that are still fresh or unchanged upstream.
+    """
+
+    def __init__(self, raw_store: RawStore, pipeline_config):
+        """
+        Initialize FreshnessScheduler.
+
+        Args:
+            raw_store: Raw store whose manifests record previous fetches
+            pipeline_config: PipelineConfig with the *_refresh_hours settings
+        """
+        self.raw_store = raw_store
+        self.pipeline_config = pipeline_config
+
+    def refresh_hours(self, name: str) -> float:
+        """Refresh interval of a source (0 = always re-fetch)."""
+        setting = REFRESH_SETTINGS.get(name)
+        return getattr(self.pipeline_config, setting, 0) if setting else 0
+
+    @staticmethod
+    def source_fields(last_modified: Optional[str], checksum: Optional[str]) -> Dict[str, Optional[str]]:
+        """Manifest fields describing a fetch made now."""
+        return {
+            'fetched_at': datetime.utcnow().isoformat(),
+            'source_last_modified': last_modified,
+            'source_checksum': checksum,
+        }
+
+    def skip_reason(self, name: str, year: int, local_name: str, url: str,
+                    last_modified: Optional[str] = None,
+                    checksum: Optional[str] = None) -> Optional[str]:
+        """
+        Explain why a download can be skipped.
+
+        Args:
+            name: Ingestion task name (selects the refresh interval)
+            year: Year folder of the artifact
+            local_name: File name in the year folder
+            url: Resolved resource URL
+            last_modified: Upstream `last_modified` from the catalog
+            checksum: Upstream checksum from the catalog
+
+        Returns:
+            Human-readable reason, or None if the resource must be fetched
+        """
+        entry = self.raw_store.load_manifest(year).get(local_name)
+        if not entry or not (self.raw_store.base_path / str(year) / local_name).exists():
+            return None
+        if entry.get('url') != url:
+            return None
+
+        # A known checksum decides alone: a different one means new content
+        if checksum:
+            return "unchanged upstream (checksum)" if entry.get('source_checksum') == checksum else None
+        if last_modified and entry.get('source_last_modified') == last_modified:
+            return "unchanged upstream (last_modified)"
+
+        fetched_at = entry.get('fetched_at')
+        if fetched_at:
+            age_hours = (datetime.utcnow() - datetime.fromisoformat(fetched_at)).total_seconds() / 3600
+            if age_hours < self.refresh_hours(name):
+                return f"fresh ({age_hours:.0f}h old, refresh every {self.refresh_hours(name)}h)"
+        return None
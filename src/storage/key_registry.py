@@ -0,0 +1,140 @@
+"""
+Persistent registry of establishment identities.
+
+Maps every FINESS number ever processed to its `vel_id`, with the first and
+last year it appeared in the FINESS extraction. The registry is a SQLite file
+shared by all years: processing a year only inserts the FINESS numbers not
+seen before, and qualifications and metrics of any year are linked to their
+establishment with one bulk lookup against it, including establishments
+absent from that year's extraction.
+
+Rows are keyed by the packed integer FINESS key (`keys.encode_finess`), the
+join key of the silver layer, so lookups return keys that records can be
+merged on directly.
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+
+from src.processing.identifiers import ETABLISSEMENT, record_ids
+from src.processing.keys import encode_finess
+
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_FILENAME = "registry.sqlite"
+
+
+class KeyRegistry:
+    """
+    SQLite-backed FINESS → vel_id registry.
+    """
+
+    def __init__(self, registry_path: Union[str, Path]):
+        """
+        Initialize KeyRegistry.
+
+        Args:
+            registry_path: SQLite file holding the registry
+        """
+        self.registry_path = Path(registry_path)
+        self._conn = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Open the registry lazily so that unused registries never touch the disk."""
+        if self._conn is None:
+            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.registry_path))
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS etablissements (
+                    finess_key INTEGER PRIMARY KEY,
+                    finess_et TEXT NOT NULL,
+                    vel_id TEXT NOT NULL UNIQUE,
+                    first_year INTEGER NOT NULL,
+                    last_year INTEGER NOT NULL
+                );
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _load_keys(self, keys: pd.Series) -> None:
+        """Fill the temporary `lookup_keys` table with the distinct FINESS keys."""
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup_keys (finess_key INTEGER PRIMARY KEY)")
+        self.conn.execute("DELETE FROM lookup_keys")
+        self.conn.executemany("INSERT INTO lookup_keys VALUES (?)",
+                              ((int(key),) for key in keys.dropna().unique()))
+
+    def register(self, finess: pd.Series, year: int) -> int:
+        """
+        Add the FINESS numbers of a year's extraction to the registry.
+
+        Unseen numbers get a `vel_id` (see `identifiers.record_ids`); known
+        numbers keep theirs and only have their year range extended.
+        Numbers that are not valid FINESS codes cannot be keyed and are
+        left out.
+
+        Args:
+            finess: FINESS numbers of the establishments (9 characters)
+            year: Extraction year
+
+        Returns:
+            Number of FINESS numbers inserted
+        """
+        keys = encode_finess(finess)
+        establishments = pd.DataFrame({'finess_key': keys, 'finess_et': finess.astype("string")})
+        establishments = establishments.dropna(subset=['finess_key']).drop_duplicates(subset=['finess_key'])
+        with self.conn:
+            self._load_keys(establishments['finess_key'])
+            known = {row[0] for row in self.conn.execute(
+                "SELECT finess_key FROM lookup_keys JOIN etablissements USING (finess_key)"
+            )}
+            unseen = establishments[~establishments['finess_key'].isin(known)]
+            self.conn.executemany(
+                "INSERT INTO etablissements VALUES (?, ?, ?, ?, ?)",
+                zip(unseen['finess_key'].astype(int).tolist(), unseen['finess_et'].tolist(),
+                    record_ids(ETABLISSEMENT, unseen['finess_et']).tolist(),
+                    [year] * len(unseen), [year] * len(unseen))
+            )
+            self.conn.execute(
+                "UPDATE etablissements SET first_year = min(first_year, ?), last_year = max(last_year, ?) "
+                "WHERE finess_key IN (SELECT finess_key FROM lookup_keys)", (year, year)
+            )
+        logger.info(f"Registered {len(unseen)} new establishments for {year}")
+        return len(unseen)
+
+    def lookup(self, keys: pd.Series) -> pd.DataFrame:
+        """
+        Find the `vel_id` of many FINESS numbers at once.
+
+        Args:
+            keys: Packed FINESS keys to resolve (`keys.encode_finess`)
+
+        Returns:
+            DataFrame with `finess_key` (Int64) and `vel_id`, one row per
+            known distinct key (unknown and missing keys are left out)
+        """
+        with self.conn:
+            self._load_keys(keys)
+            rows = self.conn.execute(
+                "SELECT e.finess_key, e.vel_id FROM lookup_keys k JOIN etablissements e USING (finess_key)"
+            ).fetchall()
+        return pd.DataFrame({
+            'finess_key': pd.array([row[0] for row in rows], dtype="Int64"),
+            'vel_id': pd.array([row[1] for row in rows], dtype="string"),
+        })
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT count(*) FROM etablissements").fetchone()[0]
+
+    def close(self):
+        """Close the SQLite registry."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
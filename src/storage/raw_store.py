@@ -0,0 +1,261 @@
+"""
+Content-addressed storage for the raw data layer.
+
+Downloaded files are stored once under `raw/.store/objects/` keyed by the
+SHA-256 of their content. The per-year folders (`raw/{year}/...`) keep
+their usual file names, but each file is a hardlink to its blob and is
+listed in `raw/{year}/manifest.json`. Identical files across years (the
+FINESS snapshot, the HAS 2021-2025 extracts) therefore take disk space
+only once, and blobs no longer referenced by any manifest can be
+garbage-collected.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import stat
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, List, Union
+
+from .transcode import normalize_text_file
+
+
+logger = logging.getLogger(__name__)
+
+STORE_DIRNAME = ".store"
+MANIFEST_NAME = "manifest.json"
+HASH_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """
+    Compute the SHA-256 of a file without loading it in memory.
+
+    Args:
+        path: File to hash
+        chunk_size: Number of bytes read at a time
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class RawStore:
+    """
+    Deduplicating blob store backing the raw/{year} folders.
+    """
+
+    def __init__(self, base_path: Union[str, Path]):
+        """
+        Initialize RawStore.
+
+        Args:
+            base_path: Raw data directory (the parent of the year folders)
+        """
+        self.base_path = Path(base_path)
+        self.objects_path = self.base_path / STORE_DIRNAME / "objects"
+        # Serializes blob creation and manifest updates across download threads
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str) -> Path:
+        """Location of the blob for a content hash."""
+        return self.objects_path / digest[:2] / digest
+
+    def _manifest_path(self, year: int) -> Path:
+        return self.base_path / str(year) / MANIFEST_NAME
+
+    def load_manifest(self, year: int) -> Dict[str, dict]:
+        """
+        Load the manifest of a year folder.
+
+        Returns:
+            Mapping of local file name to entry (sha256, size, url, stored_at)
+        """
+        manifest_path = self._manifest_path(year)
+        if not manifest_path.exists():
+            return {}
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save_manifest(self, year: int, manifest: Dict[str, dict]):
+        manifest_path = self._manifest_path(year)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+
+    def _link(self, blob: Path, target: Path):
+        """Point `target` at `blob`, preferring a hardlink and falling back to a copy."""
+        tmp_target = target.with_name(f".{target.name}.link")
+        if tmp_target.exists():
+            tmp_target.unlink()
+        try:
+            os.link(blob, tmp_target)
+        except OSError:
+            # Filesystems without hardlinks (or cross-device) still get a valid file
+            shutil.copy2(blob, tmp_target)
+        os.replace(tmp_target, target)
+
+    def adopt(self, file_path: Union[str, Path], year: int,
+              url: Optional[str] = None, source: Optional[dict] = None) -> str:
+        """
+        Move a freshly downloaded file into the store and link it back.
+
+        If a blob with the same content already exists, the new copy is
+        discarded and the year file becomes a link to the existing blob.
+
+        Args:
+            file_path: File inside raw/{year}/ to adopt
+            year: Year folder the file belongs to
+            url: Source URL recorded in the manifest
+            source: Extra fields recorded in the manifest entry
+                (fetch time, upstream last_modified/checksum)
+
+        Returns:
+            SHA-256 digest of the file content
+        """
+        file_path = Path(file_path)
+        digest = file_sha256(file_path)
+        blob = self.blob_path(digest)
+
+        with self._lock:
+            if blob.exists():
+                logger.info(f"{file_path.name} for {year} is identical to stored blob {digest[:12]}, deduplicated")
+            else:
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.link(file_path, blob)
+                except OSError:
+                    shutil.copy2(file_path, blob)
+                # Blobs are shared between years: never modify them in place
+                os.chmod(blob, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            self._link(blob, file_path)
+            self._record(year, file_path.name, digest, url, source)
+        return digest
+
+    def _record(self, year: int, name: str, digest: str, url: Optional[str],
+                source: Optional[dict] = None):
+        """Add or update a manifest entry (caller holds the lock)."""
+        manifest = self.load_manifest(year)
+        manifest[name] = {
+            **(source or {}),
+            'sha256': digest,
+            'size': self.blob_path(digest).stat().st_size,
+            'url': url,
+            'stored_at': datetime.utcnow().isoformat(),
+        }
+        self._save_manifest(year, manifest)
+
+    def place(self, digest: str, year: int, name: str, url: Optional[str] = None,
+              source: Optional[dict] = None) -> Path:
+        """
+        Materialize an already stored blob in another year folder.
+
+        Used to fan a single download out to every year that needs it,
+        without transferring or copying the content again.
+
+        Args:
+            digest: Content hash of an existing blob
+            year: Destination year folder
+            name: File name in the year folder
+            url: Source URL recorded in the manifest
+            source: Extra fields recorded in the manifest entry
+
+        Returns:
+            Path of the linked year file
+        """
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            raise FileNotFoundError(f"No blob stored for {digest}")
+
+        target = self.base_path / str(year) / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self._link(blob, target)
+            self._record(year, name, digest, url, source)
+        return target
+
+    def year_folders(self) -> List[Path]:
+        """All raw/{year} folders currently on disk."""
+        if not self.base_path.exists():
+            return []
+        return sorted(p for p in self.base_path.iterdir() if p.is_dir() and p.name.isdigit())
+
+    def adopt_existing(self, fallback_encoding: str = 'latin-1') -> int:
+        """
+        Adopt files already present in year folders but missing from their manifest.
+
+        Useful to migrate a raw layer written before the store existed. Text
+        files are normalized to UTF-8 first, as downloads are, and their
+        source encoding is recorded. Leftovers of interrupted downloads and
+        conversions (`.part`, `.tmp`) are skipped.
+
+        Args:
+            fallback_encoding: Encoding assumed for text files that are not UTF-8
+
+        Returns:
+            Number of files adopted
+        """
+        adopted = 0
+        for year_path in self.year_folders():
+            year = int(year_path.name)
+            manifest = self.load_manifest(year)
+            for file_path in sorted(year_path.iterdir()):
+                if not file_path.is_file() or file_path.name == MANIFEST_NAME or file_path.name.startswith('.'):
+                    continue
+                if file_path.name.endswith(('.part', '.part.json', '.tmp')):
+                    continue
+                entry = manifest.get(file_path.name)
+                if entry and self.blob_path(entry['sha256']).exists():
+                    continue
+                encoding = normalize_text_file(file_path, fallback=fallback_encoding)
+                self.adopt(file_path, year, source={'source_encoding': encoding} if encoding else None)
+                adopted += 1
+        return adopted
+
+    def referenced_digests(self) -> set:
+        """Content hashes referenced by a manifest entry whose year file still exists."""
+        digests = set()
+        for year_path in self.year_folders():
+            for name, entry in self.load_manifest(int(year_path.name)).items():
+                if (year_path / name).exists():
+                    digests.add(entry['sha256'])
+        return digests
+
+    def gc(self, dry_run: bool = False) -> Dict[str, int]:
+        """
+        Delete blobs that no manifest references any more.
+
+        Args:
+            dry_run: Only report what would be deleted
+
+        Returns:
+            Dict with the number of blobs and bytes removed (or removable)
+        """
+        referenced = self.referenced_digests()
+        removed = {'blobs': 0, 'bytes': 0}
+        if not self.objects_path.exists():
+            return removed
+
+        for blob in self.objects_path.glob("*/*"):
+            if blob.name in referenced:
+                continue
+            size = blob.stat().st_size
+            if not dry_run:
+                os.chmod(blob, stat.S_IWUSR | stat.S_IRUSR)
+                blob.unlink()
+            removed['blobs'] += 1
+            removed['bytes'] += size
+            logger.info(f"{'Would remove' if dry_run else 'Removed'} unreferenced blob {blob.name} ({size} bytes)")
+
+        return removed
@@ -0,0 +1,143 @@
+"""
+Encoding normalization of raw text files.
+
+Downloaded CSV files are rewritten as UTF-8 without a byte order mark, so
+every reader downstream uses a single encoding and never sees a BOM in its
+first header. The source encoding comes from the first bytes: a BOM if there
+is one, otherwise UTF-8 when they decode as UTF-8, otherwise the configured
+fallback (`DataGouvConfig.csv_encoding`). Files are streamed chunk by chunk,
+so memory use does not depend on file size. A file that already is UTF-8
+without a BOM is only read, never rewritten.
+"""
+
+import codecs
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Bytes inspected to detect the encoding
+SNIFF_BYTES = 64 * 1024
+
+# Bytes read and converted at a time
+CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Raw files that are text (others, e.g. .xlsx, are left untouched)
+TEXT_SUFFIXES = {'.csv', '.tsv', '.txt'}
+
+UTF8 = 'utf-8'
+
+# Checked in order: the UTF-32 LE BOM starts with the UTF-16 LE one
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+def detect_encoding(head: bytes, fallback: str = 'latin-1') -> str:
+    """
+    Guess the encoding of a file from its first bytes.
+
+    Args:
+        head: First bytes of the file
+        fallback: Encoding assumed when the bytes are not UTF-8
+
+    Returns:
+        Codec name ('utf-8-sig' / 'utf-16' / 'utf-32' when a BOM is present)
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    try:
+        # Not final: the sample may end in the middle of a character
+        codecs.getincrementaldecoder(UTF8)().decode(head, final=False)
+        return UTF8
+    except UnicodeDecodeError:
+        return fallback
+
+
+def _is_utf8(path: Path, chunk_size: int) -> bool:
+    """True if the whole file decodes as UTF-8."""
+    decoder = codecs.getincrementaldecoder(UTF8)()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                decoder.decode(chunk)
+        decoder.decode(b'', final=True)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def transcode_to_utf8(path: Union[str, Path], fallback: str = 'latin-1',
+                      chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Rewrite a text file as UTF-8 without BOM, in place.
+
+    The file is written to a temporary name and renamed, so it is never
+    left half converted.
+
+    Args:
+        path: File to normalize
+        fallback: Encoding assumed when the file is not UTF-8
+        chunk_size: Number of bytes read at a time
+
+    Returns:
+        Encoding the file was in ('utf-8' if it was left unchanged)
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid in the detected encoding
+    """
+    path = Path(path)
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+    encoding = detect_encoding(head, fallback)
+    if encoding == UTF8:
+        if _is_utf8(path, chunk_size):
+            return UTF8
+        # UTF-8 at the start only (e.g. ASCII header, Latin-1 rows)
+        encoding = fallback
+
+    decoder = codecs.getincrementaldecoder(encoding)()
+    tmp_path = path.with_name(path.name + ".utf8.tmp")
+    try:
+        with open(path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            for chunk in iter(lambda: src.read(chunk_size), b''):
+                dst.write(decoder.decode(chunk).encode(UTF8))
+            dst.write(decoder.decode(b'', final=True).encode(UTF8))
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return encoding
+
+
+def normalize_text_file(path: Union[str, Path], fallback: str = 'latin-1') -> Optional[str]:
+    """
+    Rewrite a raw file as UTF-8 without BOM if it is a text file.
+
+    Args:
+        path: Raw file
+        fallback: Encoding assumed when the file is not UTF-8
+
+    Returns:
+        Encoding the file was in, or None for binary files and files that
+        could not be decoded (left as they are)
+    """
+    path = Path(path)
+    if path.suffix.lower() not in TEXT_SUFFIXES:
+        return None
+    try:
+        encoding = transcode_to_utf8(path, fallback=fallback)
+    except (UnicodeDecodeError, OSError) as e:
+        logger.warning(f"Could not transcode {path.name} to UTF-8, keeping it as is: {e}")
+        return None
+    if encoding != UTF8:
+        logger.info(f"Transcoded {path.name} from {encoding} to UTF-8")
+    return encoding
@@ -0,0 +1,365 @@
+"""
+Tests for the raw → bronze cleaning step.
+
+Run with: python -m pytest tests/
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.processing.data_cleaner import DataCleaner, FINESS_COLUMNS, RowHashSet, strip_category_prefix
+from src.processing.data_processor import DataProcessor
+from src.processing.excel_reader import ExcelReader
+from src.processing.identifiers import VELTIS_NAMESPACE
+from src.processing.joins import JOIN_ALLOW, JOIN_DEDUPE, JOIN_FAIL, JoinFanOutError, link_join
+from src.processing.keys import decode_finess, encode_finess
+from src.processing.source_specs import DATETIME, HEADERS_LOWER, SourceSpec
+from src.processing.table_io import read_table
+
+
+def _write_finess(raw_path: Path, rows):
+    year_path = raw_path / "2024"
+    year_path.mkdir(parents=True, exist_ok=True)
+    lines = ["finess;etalab;2024-01-01", ";".join(FINESS_COLUMNS)]
+    for finess_et, rs in rows:
+        values = ["structureet", finess_et, "010000000", rs] + [""] * (len(FINESS_COLUMNS) - 4)
+        lines.append(";".join(values))
+    (year_path / "finess.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_chunked_finess_cleaning_matches_full_cleaning(tmp_path):
+    rows = [("010000001", "A"), ("010000002", "B"), ("010000001", "A"),  # duplicate in chunk 1
+            ("010000003", "C"), ("010000002", "B"), ("010000004", "D")]  # duplicate across chunks
+    _write_finess(tmp_path / "raw", rows)
+
+    cleaner = DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=True)
+    full = cleaner.clean_finess(2024)
+    written = cleaner.clean_finess_chunked(2024, chunksize=2)
+
+    assert written == len(full) == 4
+    streamed = read_table(tmp_path / "bronze" / "2024", "finess_clean")
+    assert list(streamed.columns) == FINESS_COLUMNS
+    side_output = pd.read_csv(tmp_path / "bronze" / "2024" / "finess_clean.csv", dtype=str)
+    assert side_output['finess_et'].tolist() == streamed['finess_et'].tolist()
+    assert streamed['finess_et'].tolist() == ["010000001", "010000002", "010000003", "010000004"]
+    assert streamed['rs'].tolist() == full['rs'].tolist()
+    assert streamed.dtypes.to_dict() == full.dtypes.to_dict()
+    assert not list((tmp_path / "bronze" / "2024").glob("*.tmp"))
+
+
+def test_legacy_latin1_raw_files_are_cleaned(tmp_path):
+    _write_finess(tmp_path / "raw", [("010000001", "Hôpital Sainte-Thérèse")])
+    finess = tmp_path / "raw" / "2024" / "finess.csv"
+    finess.write_bytes(finess.read_text(encoding="utf-8").encode("latin-1"))  # Never went through ingestion
+
+    cleaner = DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False)
+
+    assert cleaner.clean_finess(2024)["rs"].tolist() == ["Hôpital Sainte-Thérèse"]
+    assert cleaner.clean_finess_chunked(2024, chunksize=1) == 1
+
+def test_row_hash_set_matches_a_python_set():
+    rng = np.random.default_rng(0)
+    seen, expected = RowHashSet(), set()
+    for _ in range(40):
+        hashes = np.unique(rng.integers(0, 3000, size=200).astype(np.uint64))
+        new = ~seen.contains(hashes)
+        assert new.tolist() == [h not in expected for h in hashes.tolist()]
+        seen.add(hashes[new])
+        expected.update(hashes[new].tolist())
+    assert len(seen) == len(expected) and len(seen.runs) < 10
+
+
+def test_bronze_and_silver_are_typed_parquet(tmp_path):
+    _write_finess(tmp_path / "raw", [("010000001", "A"), ("2A0000002", "B")])
+    raw_year = tmp_path / "raw" / "2024"
+    (raw_year / "has_demarche.csv").write_text(
+        "code_demarche,date_de_decision,decision_de_la_cces\n30001,10/02/2022,Certifié\n", encoding="utf-8")
+    (raw_year / "has_etab_geo.csv").write_text(
+        "code_demarche,finess_ej,finess_eg\n30001,010000000,010000001\n", encoding="utf-8")
+
+    cleaner = DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False)
+    cleaner.clean_finess(2024)
+    cleaner.clean_has_demarche(2024)
+    cleaner.clean_has_etab_geo(2024)
+    bronze_year = tmp_path / "bronze" / "2024"
+    assert (bronze_year / "finess_clean.parquet").exists()
+    assert not (bronze_year / "finess_clean.csv").exists()
+
+    ids = read_table(bronze_year, "finess_clean", columns=["finess_et"])
+    assert list(ids.columns) == ["finess_et"]
+    assert ids["finess_et"].tolist() == ["010000001", "2A0000002"]  # leading zeros and letters kept
+
+    results = DataProcessor(tmp_path / "bronze", export_csv=False).process_year(2024)
+    silver_year = tmp_path / "silver" / "2024"
+    etab = read_table(silver_year, "etablissements")
+    assert etab["finess_et"].tolist() == ["010000001", "2A0000002"]
+    assert str(etab["vel_id"].dtype) == "string"
+    qual = read_table(silver_year, "qualifications")
+    assert len(qual) == 1 and qual["vel_id"].iloc[0] == etab["vel_id"].iloc[0]
+    assert len(results["qualifications"]) == 1
+
+
+def test_arrow_csv_backend_matches_pandas(tmp_path):
+    _write_finess(tmp_path / "raw", [("010000001", "A;B"), ("2A0000002", 'Say "hi"'), ("010000001", "A;B")])
+    raw_year = tmp_path / "raw" / "2024"
+    with open(raw_year / "finess.csv", "a", encoding="utf-8") as f:
+        f.write("geolocalisation;010000001;1.0;2.0\n")  # Short row: padded by pandas
+    (raw_year / "has_demarche.csv").write_text(
+        "code_demarche,annee_visite,date_de_decision,decision_de_la_cces\n"
+        "30001,2022,10/02/2022,Certifié\n30002,,NA,\"Certifié, sous conditions\"\n", encoding="utf-8")
+    (raw_year / "has_etab_geo.csv").write_text(
+        "code_demarche,finess_ej,finess_eg,site_principal\n30001,010000000,010000001,True\n", encoding="utf-8")
+
+    outputs = {}
+    for backend in ("pandas", "arrow"):
+        cleaner = DataCleaner(tmp_path / "raw", tmp_path / backend, export_csv=True, csv_backend=backend)
+        frames = {name: getattr(cleaner, f"clean_{name}")(2024)
+                  for name in ("finess", "has_demarche", "has_etab_geo")}
+        files = {path.name: path.read_bytes() for path in (tmp_path / backend / "2024").glob("*.csv")}
+        outputs[backend] = frames, files
+        cleaner.clean_finess_chunked(2024, chunksize=2)  # Side output appended chunk by chunk
+        assert (tmp_path / backend / "2024" / "finess_clean.csv").read_bytes() == files["finess_clean.csv"]
+
+    (pandas_frames, pandas_files), (arrow_frames, arrow_files) = outputs["pandas"], outputs["arrow"]
+    for name, df in pandas_frames.items():
+        pd.testing.assert_frame_equal(df, arrow_frames[name])
+    assert len(pandas_files) == 3 and pandas_files == arrow_files
+    assert len(pandas_frames["finess"]) == 3
+
+
+def test_clean_year_runs_sources_in_worker_processes(tmp_path):
+    _write_finess(tmp_path / "raw", [("010000001", "A"), ("010000002", "B")])
+    (tmp_path / "raw" / "2024" / "has_demarche.csv").write_text(
+        "code_demarche,decision_de_la_cces\n30001,Certifié\n30001,Certifié\n", encoding="utf-8")
+
+    cleaner = DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False, max_workers=2)
+    results = cleaner.clean_year(2024)
+
+    assert list(results) == ["finess", "has_demarche", "has_etab_geo", "health_metrics"]
+    assert results["finess"].records == 2
+    assert results["has_demarche"].records == 1
+    assert results["has_demarche"].output_path == tmp_path / "bronze" / "2024" / "has_demarche_clean.parquet"
+    assert read_table(results["finess"].output_path.parent, "finess_clean")["rs"].tolist() == ["A", "B"]
+    assert not results["has_etab_geo"].succeeded and results["has_etab_geo"].output_path is None
+
+
+def test_excel_reader_caches_parsed_sheet_by_content(tmp_path, monkeypatch):
+    workbook = tmp_path / "health_metrics.xlsx"
+    pd.DataFrame({"FINESS": ["010000001", "2A0000002"], "Score": [71.5, None]}).to_excel(workbook, index=False)
+
+    reader = ExcelReader(cache_path=tmp_path / "cache")
+    first = reader.read(workbook)
+    assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+    pd.testing.assert_frame_equal(first, pd.read_excel(workbook, engine="openpyxl"))
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("unchanged workbook parsed again")
+
+    monkeypatch.setattr(pd, "read_excel", no_parse)
+    pd.testing.assert_frame_equal(reader.read(workbook), first)
+
+
+def test_strip_category_prefix_keeps_nulls():
+    values = pd.Series(["1- Oui", "Oui", None, "2-Non", float("nan")], dtype=object)
+
+    text = strip_category_prefix(values)
+    assert text.tolist()[:2] == ["Oui", "Oui"] and text.isna().tolist() == [False, False, True, False, True]
+    assert str(text.dtype) == "string" and "nan" not in text.dropna().tolist()
+
+    category = strip_category_prefix(values, as_category=True)
+    assert str(category.dtype) == "category"
+    assert list(category.cat.categories) == ["Oui", "Non"]
+    assert category.isna().sum() == 2
+
+
+def test_unchanged_year_is_not_rebuilt(tmp_path):
+    _write_finess(tmp_path / "raw", [("010000001", "A")])
+    raw_year = tmp_path / "raw" / "2024"
+    (raw_year / "has_demarche.csv").write_text(
+        "code_demarche,date_de_decision,decision_de_la_cces\n30001,10/02/2022,Certifié\n", encoding="utf-8")
+    (raw_year / "has_etab_geo.csv").write_text(
+        "code_demarche,finess_ej,finess_eg\n30001,010000000,010000001\n", encoding="utf-8")
+
+    cleaner = DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False, max_workers=1)
+    first = cleaner.clean_year(2024)
+    assert not first["finess"].skipped and not first["has_etab_geo"].skipped
+    processor = DataProcessor(tmp_path / "bronze", export_csv=False)
+    vel_id = processor.process_year(2024)["etablissements"]["vel_id"].iloc[0]
+
+    second = cleaner.clean_year(2024)
+    assert second["finess"].skipped and second["finess"].records == 1
+    assert not second["health_metrics"].succeeded  # Missing raw file: never recorded
+    assert processor.process_year(2024)["etablissements"]["vel_id"].iloc[0] == str(vel_id)  # Stored table reused
+
+    # An upstream change re-runs its step and the silver step downstream
+    _write_finess(tmp_path / "raw", [("010000001", "A"), ("010000002", "B")])
+    third = cleaner.clean_year(2024)
+    assert not third["finess"].skipped and third["has_demarche"].skipped
+    assert len(processor.process_year(2024)["etablissements"]) == 2
+
+
+def test_new_source_is_cleaned_from_its_spec(tmp_path):
+    raw_year = tmp_path / "raw" / "2024"
+    raw_year.mkdir(parents=True)
+    (raw_year / "sae.csv").write_text(
+        "﻿FINESS;Lits;Ouverture;Public\n010000001;120;01/02/2020;true\n010000001;120;01/02/2020;true\n"
+        "020000002;;31/12/2021;false\n", encoding="utf-8")
+    spec = SourceSpec(
+        name="sae", label="SAE", file_name="sae.csv", table="sae_clean", sep=";", headers=HEADERS_LOWER,
+        dtypes={"finess": "string", "lits": "Int64", "ouverture": DATETIME, "public": "boolean"},
+        date_formats={"ouverture": "%d/%m/%Y"}, key_columns=("finess",),
+    )
+
+    df = DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False).clean_from_spec(spec, 2024)
+
+    assert df["finess"].tolist() == ["010000001", "020000002"]  # Read as text: leading zeros kept
+    assert str(df["lits"].dtype) == "Int64" and df["lits"].isna().tolist() == [False, True]
+    assert df["ouverture"].tolist() == [pd.Timestamp("2020-02-01"), pd.Timestamp("2021-12-31")]
+    assert df["public"].tolist() == [True, False]
+    assert (tmp_path / "bronze" / "2024" / "sae_clean.parquet").exists()
+
+
+def test_finess_addresses_categories_and_departments_are_derived_by_column(tmp_path):
+    year_path = tmp_path / "raw" / "2024"
+    year_path.mkdir(parents=True)
+    rows = [
+        {"finess_et": "010000001", "numvoie": "12", "typvoie": "RUE", "voie": "DE LA PAIX",
+         "ligneacheminement": "01300 BELLEY", "libsph": "Etablissement public de santé"},
+        {"finess_et": "2A0000002", "voie": "COURS NAPOLEON", "lieuditbp": "BP 4",
+         "ligneacheminement": "20000 AJACCIO", "libsph": "Etablissement privé non lucratif"},
+        {"finess_et": "2B0000003", "ligneacheminement": "20200 BASTIA", "libsph": "ESPIC"},
+        {"finess_et": "970000004", "numvoie": "3", "ligneacheminement": "97400 ST DENIS"},
+    ]
+    lines = ["finess;etalab;2024-01-01", ";".join(FINESS_COLUMNS)]
+    lines += [";".join(row.get(col, "") for col in FINESS_COLUMNS) for row in rows]
+    (year_path / "finess.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False).clean_finess(2024)
+
+    etab = DataProcessor(tmp_path / "bronze", export_csv=False).load_clean_finess(2024)
+
+    assert etab["adresse_postale"].tolist() == ["12 RUE DE LA PAIX", "COURS NAPOLEON BP 4", "", "3"]
+    assert etab["categorie_etab"].tolist() == ["Public", "Privé", "ESPIC", "Autre"]
+    assert etab["departement"].tolist() == ["01", "2A", "2B", "974"]
+
+
+def test_record_ids_are_uuid5_of_natural_keys_and_stable_across_runs(tmp_path):
+    _write_finess(tmp_path / "raw", [("010000001", "A"), ("010000002", "B")])
+    raw_year = tmp_path / "raw" / "2024"
+    (raw_year / "has_demarche.csv").write_text(
+        "code_demarche,date_de_decision,decision_de_la_cces\n30001,10/02/2022,Certifié\n", encoding="utf-8")
+    (raw_year / "has_etab_geo.csv").write_text(
+        "code_demarche,finess_ej,finess_eg\n30001,010000000,010000002\n", encoding="utf-8")
+    DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False, max_workers=1).clean_year(2024)
+    processor = DataProcessor(tmp_path / "bronze", export_csv=False, incremental=False)
+
+    first = processor.process_year(2024)
+    second = processor.process_year(2024)
+
+    etab = first["etablissements"]
+    assert etab["vel_id"].tolist() == second["etablissements"]["vel_id"].tolist()
+    assert etab["vel_id"].tolist() == [str(uuid.uuid5(VELTIS_NAMESPACE, f"etablissement:{f}"))
+                                       for f in ["010000001", "010000002"]]
+    qual = first["qualifications"]
+    assert qual["qua_id"].tolist() == [str(uuid.uuid5(VELTIS_NAMESPACE, "qualification:30001:010000002"))]
+    assert qual["vel_id"].tolist() == [etab["vel_id"].iloc[1]]
+
+
+def test_qualifications_link_to_establishments_of_other_years(tmp_path):
+    for year, rows in ((2023, [("010000001", "A")]), (2024, [("010000001", "A"), ("010000002", "B")])):
+        year_path = tmp_path / "raw" / str(year)
+        year_path.mkdir(parents=True)
+        lines = ["finess;etalab;2024-01-01", ";".join(FINESS_COLUMNS)]
+        lines += [";".join(["structureet", f, "010000000", rs] + [""] * (len(FINESS_COLUMNS) - 4)) for f, rs in rows]
+        (year_path / "finess.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    (tmp_path / "raw" / "2023" / "has_demarche.csv").write_text(
+        "code_demarche,date_de_decision,decision_de_la_cces\n30001,10/02/2022,Certifié\n", encoding="utf-8")
+    (tmp_path / "raw" / "2023" / "has_etab_geo.csv").write_text(
+        "code_demarche,finess_ej,finess_eg\n30001,010000000,010000002\n", encoding="utf-8")
+    cleaner = DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False, max_workers=1)
+    cleaner.clean_year(2023)
+    cleaner.clean_year(2024)
+    processor = DataProcessor(tmp_path / "bronze", export_csv=False, key_registry=True)
+
+    assert processor.process_year(2023)["qualifications"].empty  # 010000002 not known yet
+    etab_2024 = processor.process_year(2024)["etablissements"]
+    qual_2023 = processor.process_year(2023)["qualifications"]  # Registry grew: relinked
+
+    assert len(processor.registry) == 2
+    assert qual_2023["vel_id"].tolist() == [etab_2024["vel_id"].iloc[1]]
+
+    processor.load_clean_finess = lambda year: pytest.fail("unchanged year was processed again")
+    assert processor.process_year(2023)["qualifications"]["vel_id"].tolist() == qual_2023["vel_id"].tolist()
+
+
+def test_finess_keys_round_trip_through_integers():
+    finess = pd.Series(["010000001", "2A0000002", "2b0000003", "10000004", None, "12345678X", "999999999"])
+
+    finess_keys = encode_finess(finess)
+
+    assert str(finess_keys.dtype) == "Int64"
+    assert finess_keys.nunique() == 5  # Corsican codes do not collide with numeric ones
+    assert decode_finess(finess_keys).tolist() == [
+        "010000001", "2A0000002", "2B0000003", "010000004", pd.NA, pd.NA, "999999999"]
+
+
+def test_link_join_guards_against_duplicated_lookup_keys():
+    sites = pd.DataFrame({"code_demarche": ["1", "1", "2"], "finess_eg": ["a", "b", "c"]})
+    demarches = pd.DataFrame({"code_demarche": ["1", "1", "2"], "decision": ["x", "y", "z"]})
+
+    with pytest.raises(JoinFanOutError):
+        link_join(sites, demarches, on="code_demarche", name="has_demarche", policy=JOIN_FAIL)
+
+    stats = []
+    deduped = link_join(sites, demarches, on="code_demarche", name="has_demarche", policy=JOIN_DEDUPE, stats=stats)
+    allowed = link_join(sites, demarches, on="code_demarche", name="has_demarche", policy=JOIN_ALLOW, stats=stats)
+
+    assert deduped["decision"].tolist() == ["x", "x", "z"]
+    assert len(allowed) == 5
+    assert [(s.expected_rows, s.output_rows, s.duplicate_lookup_keys) for s in stats] == [(5, 3, 1), (5, 5, 1)]
+    assert stats[0].fan_out == pytest.approx(5 / 3) and not stats[0].records_unique_keys
+
+
+def test_repeated_demarche_fails_the_year_without_recording_the_build(tmp_path):
+    _write_finess(tmp_path / "raw", [("010000002", "B")])
+    raw_year = tmp_path / "raw" / "2024"
+    (raw_year / "has_demarche.csv").write_text(
+        "code_demarche,date_de_decision,decision_de_la_cces\n"
+        "30001,10/02/2022,Certifié\n30001,10/02/2023,Non certifié\n", encoding="utf-8")
+    (raw_year / "has_etab_geo.csv").write_text(
+        "code_demarche,finess_ej,finess_eg\n30001,010000000,010000002\n", encoding="utf-8")
+    DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False, max_workers=1).clean_year(2024)
+    processor = DataProcessor(tmp_path / "bronze", export_csv=False, key_registry=False)
+
+    with pytest.raises(JoinFanOutError):
+        processor.process_year(2024)
+    assert not (tmp_path / "silver" / "2024" / ".build" / "process.json").exists()
+
+    processor.load_clean_health_metrics = lambda year: processor.failed_steps.append("health_metrics")
+    processor.join_policies["has_demarche"] = JOIN_DEDUPE
+    assert len(processor.process_year(2024)["qualifications"]) == 1
+    assert not (tmp_path / "silver" / "2024" / ".build" / "process.json").exists()
+
+def test_each_establishment_gets_one_row_and_a_unique_vel_id(tmp_path):
+    year_path = tmp_path / "raw" / "2024"
+    year_path.mkdir(parents=True)
+    lines = ["finess;etalab;2024-01-01", ";".join(FINESS_COLUMNS)]
+    for record, finess_et, rs in [("structureet", "010000001", "A"), ("geolocalisation", "010000001", "870000.1"),
+                                  ("structureet", "010000002", "B")]:
+        lines.append(";".join([record, finess_et, "010000000", rs] + [""] * (len(FINESS_COLUMNS) - 4)))
+    (year_path / "finess.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    DataCleaner(tmp_path / "raw", tmp_path / "bronze", export_csv=False).clean_finess(2024)
+
+    etab = DataProcessor(tmp_path / "bronze", export_csv=False, key_registry=False).load_clean_finess(2024)
+
+    assert etab["finess_et"].tolist() == ["010000001", "010000002"]
+    assert etab["raison_sociale"].tolist() == ["A", "B"]
+    assert etab["vel_id"].is_unique
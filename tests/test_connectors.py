@@ -0,0 +1,403 @@
+"""
+Tests for the connector layer (downloads, caching, throttling).
+
+Run with: python -m pytest tests/
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import requests
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.connectors.base import BaseConnector
+from src.connectors.catalog_index import CatalogIndex
+from src.connectors.datagouv_api import DataGouvConnector
+from src.connectors.http_cache import HTTPCache
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response used by the streaming code."""
+
+    def __init__(self, body: bytes, status_code: int = 200, headers=None, fail_after: int = None):
+        self.body = body
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.fail_after = fail_after
+
+    @property
+    def content(self):
+        return self.body
+
+    def json(self):
+        return json.loads(self.body)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size=1):
+        for offset in range(0, len(self.body), chunk_size):
+            if self.fail_after is not None and offset >= self.fail_after:
+                raise requests.exceptions.ConnectionError("connection reset")
+            yield self.body[offset:offset + chunk_size]
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class DummyConnector(BaseConnector):
+    """Concrete connector whose session returns queued fake responses."""
+
+    def __init__(self, responses, http_cache=None):
+        super().__init__(name="Dummy", base_url="https://example.org", http_cache=http_cache)
+        self.responses = list(responses)
+        self.requests_made = []
+        self.session.request = self._fake_request
+
+    def _fake_request(self, method, url, **kwargs):
+        self.requests_made.append((method, url, kwargs))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def fetch_data(self, **kwargs):
+        return None
+
+    def validate_response(self, response):
+        return True
+
+
+def test_download_to_file_streams_and_reports_rate(tmp_path):
+    body = b"x" * 10_000
+    connector = DummyConnector([FakeResponse(body)])
+    dest = tmp_path / "2024" / "finess.csv"
+
+    result = connector.download_to_file("https://example.org/finess.csv", dest, chunk_size=1024)
+
+    assert result is not None
+    assert dest.read_bytes() == body
+    assert result.bytes_written == len(body)
+    assert result.bytes_per_second > 0
+    assert connector.requests_made[0][2]["stream"] is True
+
+
+def test_download_to_file_keeps_part_file_on_failure(tmp_path):
+    connector = DummyConnector([FakeResponse(b"y" * 5000, headers={"ETag": '"v1"'}, fail_after=2048)])
+    connector.max_retries = 0
+    dest = tmp_path / "finess.csv"
+
+    result = connector.download_to_file("https://example.org/finess.csv", dest, chunk_size=1024)
+
+    assert result is None
+    assert not dest.exists()
+    assert (tmp_path / "finess.csv.part").stat().st_size == 2048
+
+
+def test_download_to_file_resumes_with_range_request(tmp_path):
+    body = b"0123456789" * 500
+    connector = DummyConnector([
+        FakeResponse(body, headers={"ETag": '"v1"'}, fail_after=2048),
+        FakeResponse(body[2048:], status_code=206, headers={"ETag": '"v1"'}),
+    ])
+    dest = tmp_path / "finess.csv"
+
+    result = connector.download_to_file("https://example.org/finess.csv", dest, chunk_size=1024)
+
+    assert dest.read_bytes() == body
+    assert result.resumed_from == 0
+    retry_headers = connector.requests_made[1][2]["headers"]
+    assert retry_headers["Range"] == "bytes=2048-"
+    assert retry_headers["If-Range"] == '"v1"'
+    assert not (tmp_path / "finess.csv.part").exists()
+
+
+def test_download_to_file_restarts_when_range_is_ignored(tmp_path):
+    body = b"abcdef" * 1000
+    dest = tmp_path / "finess.csv"
+    failing = DummyConnector([FakeResponse(body, headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}, fail_after=1024)])
+    failing.max_retries = 0
+    failing.download_to_file("https://example.org/finess.csv", dest, chunk_size=512)
+
+    connector = DummyConnector([FakeResponse(body, status_code=200)])
+    result = connector.download_to_file("https://example.org/finess.csv", dest, chunk_size=512)
+
+    assert connector.requests_made[0][2]["headers"]["Range"] == "bytes=1024-"
+    assert dest.read_bytes() == body
+    assert result.resumed_from == 0
+
+
+def test_download_fails_fast_on_client_errors_and_backs_off_otherwise(tmp_path, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("src.connectors.base.time.sleep", sleeps.append)
+    connector = DummyConnector([FakeResponse(b"", status_code=404), FakeResponse(b"")])
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        connector.download_to_file("https://example.org/missing.csv", tmp_path / "missing.csv")
+    assert len(connector.requests_made) == 1 and not sleeps
+
+    body = b"q" * 4000
+    connector.responses = [FakeResponse(body, headers={"ETag": '"v1"'}, fail_after=1024),
+                           FakeResponse(body[1024:], status_code=206, headers={"ETag": '"v1"'})]
+    result = connector.download_to_file("https://example.org/finess.csv", tmp_path / "finess.csv", chunk_size=512)
+
+    assert result.bytes_written == len(body)
+    assert len(sleeps) == 1 and 0 <= sleeps[0] <= connector.backoff_base  # Jittered backoff of the first retry
+
+def test_download_bypasses_http_cache_and_revalidates_existing_file(tmp_path):
+    cache = HTTPCache(tmp_path / "cache")
+    body = b"z" * 5000
+    dest = tmp_path / "finess.csv"
+    connector = DummyConnector([
+        FakeResponse(body, headers={"ETag": '"v1"'}, fail_after=2048),
+        FakeResponse(body[2048:], status_code=206, headers={"ETag": '"v1"'}),
+    ], http_cache=cache)
+
+    first = connector.download_to_file("https://example.org/finess.csv", dest, chunk_size=1024)
+
+    assert dest.read_bytes() == body and first.etag == '"v1"'
+    assert connector.requests_made[1][2]["headers"]["Range"] == "bytes=2048-"  # Partial body kept
+    assert cache.total_size() == 0  # Body only stored in dest
+
+    connector.responses = [FakeResponse(b"", status_code=304)]
+    kept = connector.download_to_file("https://example.org/finess.csv", dest,
+                                      validators={"etag": first.etag, "last_modified": None})
+
+    assert connector.requests_made[2][2]["headers"]["If-None-Match"] == '"v1"'
+    assert kept.from_cache and kept.bytes_transferred == 0 and kept.etag == '"v1"'
+    assert dest.read_bytes() == body
+
+
+def test_part_file_survives_transport_errors_but_not_rejected_ranges(tmp_path):
+    body = b"0123456789" * 500
+    dest = tmp_path / "finess.csv"
+    failing = DummyConnector([FakeResponse(body, headers={"ETag": '"v1"'}, fail_after=2048)])
+    failing.max_retries = 0
+    failing.download_to_file("https://example.org/finess.csv", dest, chunk_size=1024)
+
+    flaky = DummyConnector([requests.exceptions.Timeout("read timeout")])
+    flaky.max_retries = 0
+    assert flaky.download_to_file("https://example.org/finess.csv", dest, chunk_size=1024) is None
+    assert (tmp_path / "finess.csv.part").stat().st_size == 2048  # Kept for the next run
+
+    connector = DummyConnector([FakeResponse(b"", status_code=416), FakeResponse(body, headers={"ETag": '"v2"'})])
+    result = connector.download_to_file("https://example.org/finess.csv", dest, chunk_size=1024)
+
+    assert "Range" not in connector.requests_made[1][2]["headers"]  # Restarted from scratch
+    assert dest.read_bytes() == body and result.resumed_from == 0
+
+
+def test_http_cache_turns_unchanged_resource_into_304(tmp_path):
+    body = b'{"id": "53699569a3a729239d2046eb"}'
+    url = "https://example.org/datasets/finess/"
+    first = DummyConnector([FakeResponse(body, headers={"ETag": '"abc"'})], http_cache=HTTPCache(tmp_path))
+    assert first.get(url).content == body
+    first.close()
+
+    # A new process reuses the on-disk cache and revalidates it
+    second = DummyConnector([FakeResponse(b"", status_code=304)], http_cache=HTTPCache(tmp_path))
+    response = second.get(url)
+
+    assert second.requests_made[0][2]["headers"]["If-None-Match"] == '"abc"'
+    assert response.from_cache is True
+    assert response.content == body
+
+
+def test_http_cache_evicts_least_recently_used(tmp_path):
+    cache = HTTPCache(tmp_path, max_bytes=250)
+    connector = DummyConnector(
+        [FakeResponse(b"a" * 100, headers={"ETag": f'"{i}"'}) for i in range(3)],
+        http_cache=cache
+    )
+    for name in ("one", "two", "three"):
+        connector.get(f"https://example.org/{name}").close()
+
+    assert cache.lookup(cache.make_key("https://example.org/one")) is None
+    assert cache.lookup(cache.make_key("https://example.org/three")) is not None
+    assert cache.total_size() == 200
+
+
+def test_memory_cache_evicts_by_dataframe_bytes():
+    import pandas as pd
+    from src.connectors.memory_cache import MemoryCache, estimate_size
+
+    frame = pd.DataFrame({'finess_et': [f"0{i:08d}" for i in range(1000)]})
+    size = estimate_size(frame)
+    cache = MemoryCache(max_bytes=int(size * 2.5))
+
+    cache.put("finess_2023", frame)
+    cache.put("finess_2024", frame.copy())
+    assert cache.get("finess_2023") is not None  # 2023 becomes most recently used
+    cache.put("has_certification", frame.copy())
+
+    assert cache.get("finess_2024") is None
+    assert cache.get("finess_2023") is not None
+    stats = cache.stats()
+    assert stats['evictions'] == 1
+    assert stats['hits'] == 2 and stats['misses'] == 1
+    assert stats['bytes'] <= stats['max_bytes']
+
+
+def test_retry_after_is_honoured_on_429(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("src.connectors.rate_limit.time.sleep", sleeps.append)
+    connector = DummyConnector([
+        FakeResponse(b"", status_code=429, headers={"Retry-After": "2"}),
+        FakeResponse(b"ok"),
+    ])
+
+    response = connector.get("https://example.org/datasets/")
+
+    assert response.content == b"ok"
+    assert len(connector.requests_made) == 2
+    assert sleeps and 1.5 < sleeps[0] <= 2
+
+
+def test_circuit_breaker_fails_fast_after_repeated_errors(monkeypatch):
+    from src.connectors.rate_limit import HostRateLimiter
+
+    monkeypatch.setattr("src.connectors.base.time.sleep", lambda seconds: None)
+    connector = DummyConnector([FakeResponse(b"", status_code=503) for _ in range(2)])
+    connector.rate_limiter = HostRateLimiter(failure_threshold=2, cooldown_seconds=60)
+    connector.max_retries = 0
+
+    assert connector.get("https://example.org/a") is None
+    assert connector.get("https://example.org/b") is None
+    assert connector.get("https://example.org/c") is None
+    assert len(connector.requests_made) == 2
+
+
+def test_half_open_circuit_lets_a_single_probe_through(monkeypatch):
+    import threading
+    from src.connectors.rate_limit import CircuitBreaker
+
+    now = [0.0]
+    monkeypatch.setattr("src.connectors.rate_limit.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=60)
+    breaker.record_failure()
+    now[0] = 61.0
+
+    start = threading.Barrier(8)
+    allowed = []
+
+    def worker():
+        start.wait()
+        allowed.append(breaker.allow())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(allowed) == [False] * 7 + [True]
+    assert breaker.state == CircuitBreaker.HALF_OPEN and not breaker.allow()
+    breaker.record_failure()  # Probe failed: open again, no caller let through
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+    now[0] = 122.0
+    assert breaker.allow() and not breaker.allow()
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+    breaker.record_failure()
+    now[0] = 183.0
+    assert breaker.allow()  # Probe outcome never recorded...
+    now[0] = 244.0
+    assert breaker.allow()  # ...given up after another cooldown
+
+def test_async_connector_downloads_concurrently(tmp_path):
+    import asyncio
+    from aiohttp import web
+    from src.connectors.async_base import AsyncBaseConnector
+
+    class DummyAsyncConnector(AsyncBaseConnector):
+        async def fetch_data(self, **kwargs):
+            return None
+
+        def validate_response(self, response):
+            return True
+
+    async def serve_file(request):
+        return web.Response(body=request.match_info['name'].encode() * 1000)
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get('/{name}', serve_file)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with DummyAsyncConnector("Dummy", f"http://127.0.0.1:{port}", max_concurrency=2) as connector:
+                names = ["finess", "demarche", "etab"]
+                results = await asyncio.gather(*(
+                    connector.download_to_file(f"http://127.0.0.1:{port}/{name}", tmp_path / f"{name}.csv", chunk_size=512)
+                    for name in names
+                ))
+                metadata = await connector.get(f"http://127.0.0.1:{port}/meta")
+                fetched_at = connector.last_fetch_time
+            return names, results, metadata, fetched_at
+        finally:
+            await runner.cleanup()
+
+    names, results, metadata, fetched_at = asyncio.run(scenario())
+
+    for name, result in zip(names, results):
+        assert result.bytes_written == len(name) * 1000
+        assert (tmp_path / f"{name}.csv").read_bytes() == name.encode() * 1000
+    assert metadata.content == b"meta" * 1000
+    assert isinstance(fetched_at, datetime)  # Same type as BaseConnector.last_fetch_time
+
+
+def test_async_connectors_share_resource_logic_with_sync_ones():
+    from src.connectors.datagouv_api import AsyncDataGouvConnector, DataGouvMixin
+    from src.connectors.has_connector import AsyncHASConnector, HASConnector, HASMixin
+
+    dataset = {"resources": [
+        {"format": "csv", "title": "Extraction FINESS", "url": "https://example.org/old.csv", "last_modified": "2023"},
+        {"format": "csv", "title": "Extraction FINESS", "url": "https://example.org/new.csv", "last_modified": "2024"},
+    ]}
+
+    assert issubclass(DataGouvConnector, DataGouvMixin) and issubclass(AsyncDataGouvConnector, DataGouvMixin)
+    assert AsyncDataGouvConnector().find_csv_resource(dataset, "finess") == "https://example.org/new.csv"
+    assert issubclass(HASConnector, HASMixin) and issubclass(AsyncHASConnector, HASMixin)
+    assert AsyncHASConnector().parse_certification_level("Certifiée") == "Certifié"
+
+def test_catalog_index_resolves_dataset_without_network(tmp_path):
+    dataset = {
+        "id": "finess", "title": "FINESS",
+        "resources": [{"id": "r1", "title": "Extraction finess", "format": "csv",
+                       "url": "https://example.org/finess.csv", "last_modified": "2024-01-01",
+                       "checksum": {"type": "sha1", "value": "abc"}, "filesize": 42}],
+    }
+    catalog = CatalogIndex(tmp_path / "catalog.sqlite")
+    connector = DataGouvConnector(catalog=catalog, offline=False)
+    connector.http_cache = None
+    calls = []
+    connector.session.request = lambda method, url, **kw: calls.append(url) or FakeResponse(json.dumps(dataset).encode())
+
+    assert connector.get_dataset_info("finess")["title"] == "FINESS"
+    indexed = connector.get_dataset_info("finess")
+    assert len(calls) == 1
+    assert indexed["resources"][0]["checksum"] == {"type": "sha1", "value": "abc"}
+    assert connector.find_csv_resource(indexed, "extraction") == "https://example.org/finess.csv"
+
+    # Offline mode resolves stale entries from the index and never hits the API
+    catalog.max_age_hours = 0
+    connector.offline = True
+    assert connector.get_dataset_info("finess")["resources"][0]["filesize"] == 42
+    assert connector.search_datasets("unknown query") is None
+    assert len(calls) == 1
@@ -0,0 +1,185 @@
+"""
+Tests for ingestion orchestration.
+
+Run with: python -m pytest tests/
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.connectors.base import DownloadResult
+from src.ingestion_manager import IngestionManager, ResourcePlan, TASK_SUCCESS, TASK_FAILED
+from src.storage.transcode import SNIFF_BYTES, transcode_to_utf8
+
+
+def _fake_download(name, delay=0.2):
+    def download(year, *args):
+        time.sleep(delay)
+        return DownloadResult(url=f"https://example.org/{name}", path=Path(name),
+                              bytes_written=100, elapsed_seconds=delay, bytes_transferred=100)
+    return download
+
+
+def test_year_ingestion_runs_downloads_concurrently(tmp_path):
+    manager = IngestionManager(base_path=str(tmp_path), max_workers=4)
+    manager.download_health_metrics = _fake_download("health_metrics.xlsx")
+    manager.download_finess_data = _fake_download("finess.csv")
+    manager.download_has_resource = _fake_download("has.csv")
+
+    start = time.monotonic()
+    result = manager.run_year_ingestion(2024)
+    elapsed = time.monotonic() - start
+
+    assert [t.name for t in result.tasks] == ["health_metrics", "finess", "has_demarche", "has_etab_geo"]
+    assert result.succeeded
+    assert result.bytes_downloaded == 400
+    assert elapsed < 0.6  # ~ one download, not four in a row
+
+
+def test_failed_task_is_reported_not_raised(tmp_path):
+    def broken(year):
+        raise RuntimeError("boom")
+
+    manager = IngestionManager(base_path=str(tmp_path), max_workers=2)
+    manager.download_health_metrics = broken
+    manager.download_finess_data = lambda year: None
+    manager.download_has_resource = _fake_download("has.csv", delay=0)
+
+    result = manager.run_year_ingestion(2024)
+
+    statuses = {t.name: t.status for t in result.tasks}
+    assert statuses == {"health_metrics": TASK_FAILED, "finess": TASK_FAILED,
+                        "has_demarche": TASK_SUCCESS, "has_etab_geo": TASK_SUCCESS}
+    assert result.tasks[0].error == "boom"
+
+
+def test_multi_year_plan_downloads_shared_resources_once(tmp_path):
+    manager = IngestionManager(base_path=str(tmp_path), max_workers=4)
+    shared = "https://example.org/finess.csv"
+    manager.resolve_finess = lambda year: ResourcePlan("finess", year, shared, "finess.csv")
+    manager.resolve_health_metrics = lambda year: ResourcePlan(
+        "health_metrics", year, f"https://example.org/iqss-{year}.xlsx", "health_metrics.xlsx")
+    manager.resolve_has_resource = lambda year, resource, local: None
+
+    calls = []
+
+    def download_to_file(url, dest_path, validators=None):
+        calls.append(url)
+        Path(dest_path).write_bytes(url.encode())
+        return DownloadResult(url=url, path=Path(dest_path), bytes_written=len(url),
+                              elapsed_seconds=0.0, bytes_transferred=len(url))
+    manager.datagouv_connector.download_to_file = download_to_file
+
+    result = manager.run_multi_year_ingestion(2021, 2023)
+
+    assert calls.count(shared) == 1
+    assert len(calls) == 4  # one FINESS + three yearly IQSS files
+    for year in (2021, 2022, 2023):
+        assert (tmp_path / str(year) / "finess.csv").read_bytes() == shared.encode()
+    statuses = {(t.name, t.year): t.status for t in result.tasks}
+    assert all(statuses[("finess", y)] == TASK_SUCCESS for y in (2021, 2022, 2023))
+    assert statuses[("has_demarche", 2021)] == TASK_FAILED
+    assert result.years == [2021, 2022, 2023]
+
+
+def test_scheduler_skips_fresh_and_unchanged_resources(tmp_path):
+    manager = IngestionManager(base_path=str(tmp_path), max_workers=2)
+    calls = []
+
+    def download_to_file(url, dest_path, validators=None):
+        calls.append(url)
+        Path(dest_path).write_bytes(b"payload")
+        return DownloadResult(url=url, path=Path(dest_path), bytes_written=7,
+                              elapsed_seconds=0.0, bytes_transferred=7)
+    manager.datagouv_connector.download_to_file = download_to_file
+
+    plan = ResourcePlan("finess", 2024, "https://example.org/finess.csv", "finess.csv",
+                        last_modified="2024-01-01", checksum="sha1:abc")
+    assert manager.fetch_resource(plan).bytes_transferred == 7
+
+    # Second run: unchanged upstream, nothing transferred
+    kept = manager.fetch_resource(plan)
+    assert kept.bytes_transferred == 0 and kept.sha256 is not None
+    assert len(calls) == 1
+
+    # A different checksum is fetched, even with an unchanged last_modified
+    plan.checksum = "sha1:def"
+    assert manager.fetch_resource(plan).bytes_transferred == 7
+    assert len(calls) == 2
+
+    # Without a checksum: new last_modified but still within finess_refresh_hours
+    plan.checksum, plan.last_modified = None, "2024-02-01"
+    assert manager.fetch_resource(plan).bytes_transferred == 0
+
+    # Unknown source names have no refresh interval, and force always downloads
+    assert manager.scheduler.refresh_hours("unknown") == 0
+    manager.force = True
+    assert manager.fetch_resource(plan).bytes_transferred == 7
+    assert len(calls) == 3
+
+
+def test_downloaded_text_files_are_transcoded_to_utf8(tmp_path):
+    manager = IngestionManager(base_path=str(tmp_path), max_workers=1)
+    bodies = {
+        "https://example.org/finess.csv": "finess;rs\n010000001;Hôpital Léon\n".encode("latin-1"),
+        "https://example.org/has.csv": b"\xef\xbb\xbf" + "code,décision\n1,Certifié\n".encode("utf-8"),
+        "https://example.org/iqss.xlsx": b"\xef\xbb\xbfbinary",
+    }
+
+    def download_to_file(url, dest_path, validators=None):
+        Path(dest_path).write_bytes(bodies[url])
+        return DownloadResult(url=url, path=Path(dest_path), bytes_written=len(bodies[url]),
+                              elapsed_seconds=0.0, bytes_transferred=len(bodies[url]))
+    manager.datagouv_connector.download_to_file = download_to_file
+
+    finess = manager.fetch_resource(ResourcePlan("finess", 2024, "https://example.org/finess.csv", "finess.csv"))
+    manager.fetch_resource(ResourcePlan("has_demarche", 2024, "https://example.org/has.csv", "has_demarche.csv"))
+    manager.fetch_resource(ResourcePlan("health_metrics", 2024, "https://example.org/iqss.xlsx", "health_metrics.xlsx"))
+
+    year = tmp_path / "2024"
+    assert (year / "finess.csv").read_text(encoding="utf-8") == "finess;rs\n010000001;Hôpital Léon\n"
+    assert finess.bytes_written == (year / "finess.csv").stat().st_size
+    assert (year / "has_demarche.csv").read_bytes() == "code,décision\n1,Certifié\n".encode("utf-8")  # BOM dropped
+    assert (year / "health_metrics.xlsx").read_bytes() == bodies["https://example.org/iqss.xlsx"]  # Binary untouched
+    manifest = manager.raw_store.load_manifest(2024)
+    assert manifest["finess.csv"]["source_encoding"] == "latin-1"
+    assert manifest["has_demarche.csv"]["source_encoding"] == "utf-8-sig"
+    assert "source_encoding" not in manifest["health_metrics.xlsx"]
+
+
+def test_transcoding_detects_non_utf8_bytes_after_the_sniffed_prefix(tmp_path):
+    path = tmp_path / "late.csv"
+    path.write_bytes(b"a;b\n" + b"x;y\n" * (SNIFF_BYTES // 4) + "z;été\n".encode("latin-1"))
+
+    assert transcode_to_utf8(path, fallback="latin-1") == "latin-1"
+    assert path.read_text(encoding="utf-8").endswith("z;été\n")
+    assert transcode_to_utf8(path) == "utf-8"  # Already normalized: left as is
+
+
+def test_not_modified_download_keeps_stored_file_and_its_encoding(tmp_path):
+    manager = IngestionManager(base_path=str(tmp_path), max_workers=1, force=True)
+    received = []
+
+    def download_to_file(url, dest_path, validators=None):
+        received.append(validators)
+        if validators:  # Server answers 304: nothing written
+            return DownloadResult(url=url, path=Path(dest_path), bytes_written=Path(dest_path).stat().st_size,
+                                  elapsed_seconds=0.0, bytes_transferred=0, from_cache=True, **validators)
+        Path(dest_path).write_bytes("rs\nHôpital\n".encode("latin-1"))
+        return DownloadResult(url=url, path=Path(dest_path), bytes_written=11, elapsed_seconds=0.0,
+                              bytes_transferred=11, etag='"v1"')
+    manager.datagouv_connector.download_to_file = download_to_file
+
+    plan = ResourcePlan("finess", 2024, "https://example.org/finess.csv", "finess.csv")
+    first = manager.fetch_resource(plan)
+    second = manager.fetch_resource(plan)
+
+    assert received == [None, {"etag": '"v1"', "last_modified": None}]
+    assert second.sha256 == first.sha256 and second.bytes_transferred == 0
+    entry = manager.raw_store.load_manifest(2024)["finess.csv"]
+    assert entry["source_encoding"] == "latin-1" and entry["http_etag"] == '"v1"'
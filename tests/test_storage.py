@@ -0,0 +1,84 @@
+"""
+Tests for the raw data storage layer.
+
+Run with: python -m pytest tests/
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.processing.keys import encode_finess
+from src.storage.key_registry import KeyRegistry
+from src.storage.raw_store import RawStore
+
+
+def test_identical_files_across_years_share_one_blob(tmp_path):
+    store = RawStore(tmp_path)
+    for year in (2023, 2024):
+        year_path = tmp_path / str(year)
+        year_path.mkdir()
+        (year_path / "has_demarche.csv").write_bytes(b"code_demarche;annee\n30001;2021\n")
+        store.adopt(year_path / "has_demarche.csv", year, url="https://example.org/demarche.csv")
+
+    first = tmp_path / "2023" / "has_demarche.csv"
+    second = tmp_path / "2024" / "has_demarche.csv"
+    digest = store.load_manifest(2023)["has_demarche.csv"]["sha256"]
+
+    assert first.stat().st_ino == second.stat().st_ino == store.blob_path(digest).stat().st_ino
+    assert store.load_manifest(2024)["has_demarche.csv"]["url"] == "https://example.org/demarche.csv"
+
+
+def test_gc_removes_only_unreferenced_blobs(tmp_path):
+    store = RawStore(tmp_path)
+    (tmp_path / "2024").mkdir()
+    kept = tmp_path / "2024" / "finess.csv"
+    kept.write_bytes(b"new snapshot")
+    store.adopt(kept, 2024)
+    old = tmp_path / "2024" / "old.csv"
+    old.write_bytes(b"old snapshot")
+    store.adopt(old, 2024)
+    old.unlink()
+
+    removed = store.gc()
+
+    assert removed == {'blobs': 1, 'bytes': len(b"old snapshot")}
+    assert kept.read_bytes() == b"new snapshot"
+
+
+def test_adopted_legacy_files_are_transcoded_and_leftovers_skipped(tmp_path):
+    year_path = tmp_path / "2024"
+    year_path.mkdir()
+    (year_path / "finess.csv").write_bytes("rs\nCentre hospitalier de Sélestat\n".encode("latin-1"))
+    (year_path / "finess.csv.utf8.tmp").write_bytes(b"rs\n")
+    (year_path / "has_demarche.csv.part").write_bytes(b"code_demarche")
+
+    store = RawStore(tmp_path)
+
+    assert store.adopt_existing(fallback_encoding="latin-1") == 1
+    manifest = store.load_manifest(2024)
+    assert list(manifest) == ["finess.csv"] and manifest["finess.csv"]["source_encoding"] == "latin-1"
+    assert (year_path / "finess.csv").read_text(encoding="utf-8") == "rs\nCentre hospitalier de Sélestat\n"
+
+def test_key_registry_inserts_only_unseen_finess_and_keeps_ids(tmp_path):
+    registry = KeyRegistry(tmp_path / "registry.sqlite")
+    assert registry.register(pd.Series(["010000001", "010000002", "not a code"]), 2023) == 2
+    first = registry.lookup(encode_finess(pd.Series(["010000001", "010000002"]))).set_index("finess_key")["vel_id"]
+    registry.close()
+
+    reopened = KeyRegistry(tmp_path / "registry.sqlite")
+    assert reopened.register(pd.Series(["010000002", "010000003", "010000003"]), 2024) == 1
+    keys = encode_finess(pd.Series(["010000001", "010000002", "010000003", "999999999", None]))
+    ids = reopened.lookup(keys)
+
+    assert len(reopened) == 3
+    assert str(ids["finess_key"].dtype) == "Int64"
+    assert sorted(ids["finess_key"]) == keys.iloc[:3].tolist()  # Unknown and missing keys left out
+    assert ids.set_index("finess_key")["vel_id"][keys.iloc[1]] == first[keys.iloc[1]]
+    years = reopened.conn.execute("SELECT first_year, last_year FROM etablissements WHERE finess_et = '010000002'")
+    assert years.fetchone() == (2023, 2024)